@@ -0,0 +1,211 @@
+"""
+Shared plumbing for talking to the Ollama server.
+
+session() is one requests.Session for the whole process, so every message
+reuses a keep-alive connection from its pool instead of opening a new one.
+limiter caps how many generations run at once; callers that cannot get a
+slot within CHATBOT_QUEUE_TIMEOUT fall back to the keyword answers. It works
+from threads (WSGI) and from any event loop (ASGI) alike. OllamaStream reads a
+streamed generation on its own thread so the slot is freed when Ollama
+finishes, however slowly the browser reads the reply.
+"""
+
+import asyncio
+import queue
+import threading
+from collections import deque
+
+import requests
+from django.conf import settings
+from requests.adapters import HTTPAdapter
+
+_session = None
+_session_lock = threading.Lock()
+
+
+def session():
+    """The process-wide pooled session to Ollama."""
+    global _session
+    if _session is None:
+        with _session_lock:
+            if _session is None:
+                pooled = requests.Session()
+                adapter = HTTPAdapter(
+                    pool_connections=1,
+                    pool_maxsize=settings.OLLAMA_POOL_SIZE,
+                    max_retries=0,
+                )
+                pooled.mount('http://', adapter)
+                pooled.mount('https://', adapter)
+                _session = pooled
+    return _session
+
+
+def _resolve(future):
+    if not future.done():
+        future.set_result(True)
+
+
+class ConcurrencyLimiter:
+    """
+    A counting semaphore shared by threads and event loops.
+
+    asyncio.Semaphore belongs to one loop and threading.Semaphore blocks the
+    loop, so waiters queue here as either a threading.Event or a future on
+    their own loop. release() hands the slot straight to the oldest waiter.
+    """
+
+    def __init__(self, limit):
+        self.limit = limit
+        self.active = 0
+        self.waiting = 0
+        self._lock = threading.Lock()
+        self._waiters = deque()
+
+    def _try_take(self, waiter):
+        with self._lock:
+            if self.active < self.limit and not self._waiters:
+                self.active += 1
+                return True
+            self._waiters.append(waiter)
+            self.waiting += 1
+            return False
+
+    def _give_up(self, waiter):
+        """True if the waiter was still queued; False means release() already gave it the slot."""
+        with self._lock:
+            try:
+                self._waiters.remove(waiter)
+            except ValueError:
+                return False
+            self.waiting -= 1
+            return True
+
+    def acquire(self, timeout=None):
+        event = threading.Event()
+        if self._try_take(event):
+            return True
+        if event.wait(timeout):
+            return True
+        return not self._give_up(event)
+
+    async def acquire_async(self, timeout=None):
+        loop = asyncio.get_running_loop()
+        future = loop.create_future()
+        waiter = (loop, future)
+        if self._try_take(waiter):
+            return True
+        try:
+            await asyncio.wait_for(asyncio.shield(future), timeout)
+            return True
+        except asyncio.TimeoutError:
+            return not self._give_up(waiter)
+        except asyncio.CancelledError:
+            if not self._give_up(waiter):
+                self.release()
+            raise
+
+    def release(self):
+        with self._lock:
+            while self._waiters:
+                waiter = self._waiters.popleft()
+                self.waiting -= 1
+                if isinstance(waiter, threading.Event):
+                    waiter.set()
+                    return
+                loop, future = waiter
+                try:
+                    loop.call_soon_threadsafe(_resolve, future)
+                    return
+                except RuntimeError:
+                    # That request's loop is gone; try the next waiter
+                    continue
+            self.active -= 1
+
+    def __enter__(self):
+        if not self.acquire(settings.CHATBOT_QUEUE_TIMEOUT):
+            raise ChatbotBusy()
+        return self
+
+    def __exit__(self, *exc):
+        self.release()
+
+    async def __aenter__(self):
+        if not await self.acquire_async(settings.CHATBOT_QUEUE_TIMEOUT):
+            raise ChatbotBusy()
+        return self
+
+    async def __aexit__(self, *exc):
+        self.release()
+
+
+class ChatbotBusy(Exception):
+    """Every generation slot stayed taken for CHATBOT_QUEUE_TIMEOUT seconds."""
+
+
+limiter = ConcurrencyLimiter(settings.CHATBOT_MAX_CONCURRENT)
+
+_END = object()
+
+
+class OllamaStream:
+    """
+    A streamed Ollama response read into a queue by a worker thread.
+
+    Created holding a limiter slot, which the reader releases as soon as the
+    response ends, fails or is closed, so the slot lasts as long as the
+    generation and not as long as the client takes to read it. Iterating
+    yields the raw NDJSON lines and re-raises any error from the request.
+    """
+
+    def __init__(self, url, payload, timeout):
+        self._lines = queue.SimpleQueue()
+        self._closed = threading.Event()
+        try:
+            threading.Thread(target=self._read, args=(url, payload, timeout), daemon=True).start()
+        except BaseException:
+            limiter.release()
+            raise
+
+    def _read(self, url, payload, timeout):
+        try:
+            # The timeout bounds the connect and each read, not the whole generation
+            with session().post(url, json=payload, timeout=timeout, stream=True) as response:
+                response.raise_for_status()
+                for line in response.iter_lines(chunk_size=None):
+                    if self._closed.is_set():
+                        break
+                    if line:
+                        self._lines.put(line)
+        except Exception as e:
+            end = e
+        else:
+            end = _END
+        finally:
+            limiter.release()
+        # Queued after the release: once a consumer sees the end, the slot is free
+        self._lines.put(end)
+
+    def __iter__(self):
+        while (line := self._lines.get()) is not _END:
+            if isinstance(line, Exception):
+                raise line
+            yield line
+
+    def close(self):
+        """Stop reading at the next line; safe to call more than once."""
+        self._closed.set()
+
+
+def open_stream(url, payload, timeout):
+    """Wait up to CHATBOT_QUEUE_TIMEOUT for a slot and start streaming, or raise ChatbotBusy."""
+    if not limiter.acquire(settings.CHATBOT_QUEUE_TIMEOUT):
+        raise ChatbotBusy()
+    return OllamaStream(url, payload, timeout)
+
+
+async def aopen_stream(url, payload, timeout):
+    """open_stream for event loops: the wait for a slot costs no thread."""
+    if not await limiter.acquire_async(settings.CHATBOT_QUEUE_TIMEOUT):
+        raise ChatbotBusy()
+    return OllamaStream(url, payload, timeout)
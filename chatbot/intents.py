@@ -0,0 +1,117 @@
+"""
+Keyword intents for the Penguin chatbot.
+
+Each table lists (intent, phrases) in priority order. A phrase matches when
+it occurs anywhere in the lowercased message (plain substring, as the old
+`any(phrase in message_lower ...)` chains did). Each table compiles once at
+import into a single regex, so a message is scanned once per table instead
+of once per phrase.
+"""
+
+import re
+
+# Questions answered from the keyword responses even when AI is enabled
+BYPASS_INTENTS = [
+    ('form_fields', ['fill here', 'what i have to fill', 'form fields', 'required fields']),
+    ('link', ['link for', 'give me link', 'give me the link', 'give mw the link', 'go to', 'take me to',
+              'page link', 'url for']),
+    ('password_reset', ['reset password', 'forgot password', 'password reset', 'change password',
+                        'recover password', 'lost password', 'how to reset']),
+    ('identity', ['who are you', 'what is your name', 'introduce yourself']),
+    ('page_identification', ['which page', 'what page', 'current page', 'where am i']),
+]
+
+# Keyword responses, checked in this order by NCPSChatbot.generate_response
+RESPONSE_INTENTS = [
+    ('form_fields', ['fill here', 'what i have to fill', 'what do i fill', 'fill in', 'required fields',
+                     'form fields']),
+    ('page_identification', ['which page', 'what page', 'current page', 'where am i']),
+    ('identity', ['who are you', 'what is your name', 'your name', 'introduce yourself', 'what are you']),
+    ('login_link', ['login page link', 'link for login', 'login link', 'go to login', 'take me to login',
+                    'login url']),
+    ('register_link', ['register page link', 'link for register', 'registration link', 'signup link',
+                       'go to register', 'take me to register']),
+    ('dashboard_link', ['dashboard link', 'go to dashboard', 'take me to dashboard', 'my dashboard']),
+    ('home_link', ['home page link', 'go to home', 'take me home', 'main page']),
+    ('password_reset', ['reset password', 'forgot password', 'forgot my password', 'password reset',
+                        'change password', 'recover password', 'lost password', 'how to reset', 'cant login',
+                        "can't login", 'cannot login']),
+    # Admin-only
+    ('admin_review', ['review', 'approve', 'reject']),
+    ('admin_analytics', ['analytics', 'statistics']),
+    # Public
+    ('abstract', ['submit', 'abstract', 'submission']),
+    ('registration', ['register', 'registration', 'sign up']),
+    ('schedule', ['date', 'when', 'schedule']),
+    ('themes', ['theme', 'topic', 'subject', 'focus']),
+    ('presentation', ['presentation', 'oral', 'poster', 'format']),
+    ('venue', ['venue', 'location', 'where', 'address']),
+    ('contact', ['contact', 'email', 'help', 'support']),
+    ('about', ['about', 'what is', 'ncps', 'conference info']),
+]
+
+
+def _trie_pattern(phrases):
+    """
+    One regex for a set of phrases, factored by common prefix so the engine
+    follows a single branch per character. Deeper branches come before
+    stopping at a shorter phrase, so the longest phrase at a position wins.
+    """
+    trie = {}
+    for phrase in phrases:
+        node = trie
+        for char in phrase:
+            node = node.setdefault(char, {})
+        node[''] = {}
+
+    def build(node):
+        branches = [re.escape(char) + build(child) for char, child in sorted(node.items()) if char]
+        if not branches:
+            return ''
+        body = branches[0] if len(branches) == 1 else '(?:%s)' % '|'.join(branches)
+        if '' in node:
+            # A phrase may also end here; the greedy ? tries the longer ones first
+            body = '(?:%s)?' % body
+        return body
+
+    return build(trie)
+
+
+class IntentMatcher:
+    """
+    Matches every intent of a table in one regex pass.
+
+    The pattern is a lookahead tried at each position that reports the
+    longest phrase starting there. Every shorter phrase that also matches at
+    that position is a prefix of it, and those are precomputed; together
+    this finds exactly the phrases a substring scan would.
+    """
+
+    def __init__(self, table):
+        self.order = [intent for intent, _ in table]
+        owners = {}
+        for intent, phrases in table:
+            for phrase in phrases:
+                owners.setdefault(phrase, set()).add(intent)
+
+        self.intents_for = {}
+        for phrase in owners:
+            found = set()
+            for other, intents in owners.items():
+                if phrase.startswith(other):
+                    found |= intents
+            self.intents_for[phrase] = frozenset(found)
+
+        self.pattern = re.compile('(?=(%s))' % _trie_pattern(owners))
+        self._rank = {intent: i for i, intent in enumerate(self.order)}
+
+    def match(self, message_lower):
+        """Matched intents in priority order."""
+        found = set()
+        for phrase in self.pattern.findall(message_lower):
+            found |= self.intents_for[phrase]
+        return sorted(found, key=self._rank.__getitem__)
+
+
+bypass_matcher = IntentMatcher(BYPASS_INTENTS)
+response_matcher = IntentMatcher(RESPONSE_INTENTS)
@@ -0,0 +1,29 @@
+from django.conf import settings
+from django.core.management.base import BaseCommand
+
+from chatbot import response_cache
+
+
+class Command(BaseCommand):
+    help = ("Show the chatbot answer cache hit rate, or reset its counters and entries. With LocMemCache "
+            "each process has its own cache; use /chatbot/api/cache-stats/ to read the web server's.")
+
+    def add_arguments(self, parser):
+        parser.add_argument('--reset-stats', action='store_true', help='Zero the hit/miss/store counters')
+        parser.add_argument('--clear', action='store_true', help='Drop every cached answer')
+
+    def handle(self, *args, **options):
+        stats = response_cache.stats()
+        state = 'enabled' if settings.CHATBOT_CACHE_ENABLED else 'disabled'
+        self.stdout.write(f'Cache "{settings.CHATBOT_CACHE_ALIAS}" ({state}, TTL {settings.CHATBOT_CACHE_TTL}s)')
+        self.stdout.write(
+            f'  hits {stats["hits"]}  misses {stats["misses"]} (of which similar {stats["semantic_hits"]})  '
+            f'stores {stats["stores"]}  hit rate {stats["hit_rate"]:.1%}'
+        )
+
+        if options['reset_stats']:
+            response_cache.reset_stats()
+            self.stdout.write(self.style.SUCCESS('Counters reset.'))
+        if options['clear']:
+            response_cache.clear()
+            self.stdout.write(self.style.SUCCESS('Cached answers dropped.'))
@@ -0,0 +1,133 @@
+import hashlib
+import json
+import random
+import time
+from pathlib import Path
+
+from django.core.management.base import BaseCommand, CommandError
+
+from chatbot.intents import BYPASS_INTENTS, RESPONSE_INTENTS, bypass_matcher, response_matcher
+from chatbot.views import NCPSChatbot
+
+GOLDEN_PATH = Path(__file__).resolve().parents[2] / 'intent_golden.json'
+PAGE_TYPES = ['home', 'login', 'register', 'dashboard', 'abstract']
+TEMPLATES = ['{}', 'Hi, {} please', 'Could you tell me {}?', '{} AND SOMETHING ELSE']
+EXTRA_MESSAGES = [
+    'thanks', 'ok', 'what is the weather in goa', 'dates?', 'Where is Goa', 'updated my profile',
+    'I forgot my password, can you help', "can't login to my dashboard", 'take me home please',
+    'how do I reach the venue from the airport', 'whenever I submit it fails', 'submissions closed?',
+    'is there a registration fee', 'poster format and size', 'Who are you and what is NCPS',
+    'review statistics for my theme', 'reject this abstract', 'which page has the form fields',
+]
+PAIRS = 300
+
+
+def legacy_intents(table, message_lower):
+    """The old routing: one substring scan per phrase, intent by intent."""
+    return [intent for intent, phrases in table if any(phrase in message_lower for phrase in list(phrases))]
+
+
+def legacy_first(table, message_lower):
+    for intent, phrases in table:
+        if any(phrase in message_lower for phrase in list(phrases)):
+            return intent
+    return None
+
+
+def build_corpus(bots):
+    """(message, page_type, is_admin) cases; deterministic, so the golden file lines up."""
+    rng = random.Random(2025)
+    phrases = sorted({p for table in (BYPASS_INTENTS, RESPONSE_INTENTS) for _, group in table for p in group})
+    quick_replies = bots[False].get_quick_replies() + bots[True].get_quick_replies()
+
+    cases = []
+    singles = [TEMPLATES[i % len(TEMPLATES)].format(p) for i, p in enumerate(phrases)]
+    for message in singles + EXTRA_MESSAGES + quick_replies:
+        for page_type in PAGE_TYPES:
+            for is_admin in (False, True):
+                cases.append((message, page_type, is_admin))
+    for _ in range(PAIRS):
+        first, second = rng.sample(phrases, 2)
+        cases.append((f'{first} {second}', rng.choice(PAGE_TYPES), rng.random() < 0.5))
+    return cases
+
+
+class Command(BaseCommand):
+    help = ("Check that the compiled intent matcher routes like the old per-phrase scans and that keyword "
+            "responses match the golden file, and optionally benchmark both.")
+
+    def add_arguments(self, parser):
+        parser.add_argument('--update', action='store_true', help='Rewrite the golden file from the current responses')
+        parser.add_argument('--benchmark', type=int, default=0, metavar='N',
+                            help='Also time N passes over the corpus with the old scans and the matcher')
+
+    def handle(self, *args, **options):
+        bots = {is_admin: NCPSChatbot(is_admin=is_admin) for is_admin in (False, True)}
+        cases = build_corpus(bots)
+
+        # Routing: the matcher must find exactly the intents the scans find
+        mismatches = []
+        for message in sorted({message for message, _, _ in cases}):
+            lower = message.lower()
+            for name, table, matcher in (('bypass', BYPASS_INTENTS, bypass_matcher),
+                                         ('response', RESPONSE_INTENTS, response_matcher)):
+                expected = legacy_intents(table, lower)
+                if matcher.match(lower) != expected:
+                    mismatches.append(f'{name} {message!r}: {matcher.match(lower)} != {expected}')
+        for mismatch in mismatches[:20]:
+            self.stdout.write(self.style.ERROR(mismatch))
+
+        # Responses: what each case answers, hashed
+        digests = []
+        for message, page_type, is_admin in cases:
+            bot = bots[is_admin]
+            bot.page_type = page_type
+            answer = f'{bot.use_fallback(message)}\x1f{bot.generate_response(message)}'
+            digests.append(hashlib.sha1(answer.encode()).hexdigest()[:10])
+
+        if options['update']:
+            GOLDEN_PATH.write_text(json.dumps({'cases': len(cases), 'digests': digests}, indent=0) + '\n')
+            self.stdout.write(self.style.SUCCESS(f'Wrote {len(cases)} golden responses to {GOLDEN_PATH}.'))
+        else:
+            golden = json.loads(GOLDEN_PATH.read_text())
+            if golden['cases'] != len(cases):
+                raise CommandError(f'Corpus has {len(cases)} cases but the golden file {golden["cases"]}; '
+                                   f'rerun with --update if the intent tables changed on purpose.')
+            changed = [case for case, old, new in zip(cases, golden['digests'], digests) if old != new]
+            for message, page_type, is_admin in changed[:20]:
+                self.stdout.write(self.style.ERROR(
+                    f'response changed: {message!r} on {page_type}{" (admin)" if is_admin else ""}'
+                ))
+            mismatches += changed
+
+        if options['benchmark']:
+            self.benchmark(cases, bots, options['benchmark'])
+
+        if mismatches:
+            raise CommandError(f'{len(mismatches)} routing/response difference(s).')
+        self.stdout.write(self.style.SUCCESS(f'{len(cases)} cases route and respond as before.'))
+
+    def benchmark(self, cases, bots, passes):
+        messages = [message.lower() for message, _, _ in cases]
+
+        def timed(fn):
+            started = time.perf_counter()
+            for _ in range(passes):
+                for message in messages:
+                    fn(message)
+            return (time.perf_counter() - started) / (passes * len(messages)) * 1e6
+
+        rows = [
+            ('all intents, old scans', timed(lambda m: (legacy_intents(BYPASS_INTENTS, m),
+                                                        legacy_intents(RESPONSE_INTENTS, m)))),
+            ('all intents, matcher', timed(lambda m: (bypass_matcher.match(m), response_matcher.match(m)))),
+            ('first intent, old scans', timed(lambda m: (legacy_first(BYPASS_INTENTS, m),
+                                                         legacy_first(RESPONSE_INTENTS, m)))),
+        ]
+        rows.append(('use_fallback + generate_response', timed(
+            lambda m: (bots[False].use_fallback(m), bots[False].generate_response(m))
+        )))
+
+        self.stdout.write(f'{len(messages)} messages x {passes} passes')
+        for label, micros in rows:
+            self.stdout.write(f'  {label:<36} {micros:8.2f} us/message')
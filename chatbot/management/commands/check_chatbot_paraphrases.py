@@ -0,0 +1,57 @@
+from django.conf import settings
+from django.core.management.base import BaseCommand, CommandError
+
+from chatbot.semantic_cache import SemanticIndex, vectorize
+
+# (answered question, new question): the new one may reuse the answer
+PARAPHRASES = [
+    ('When is the abstract deadline?', 'what is the last date for abstract submissions'),
+    ('Where is the conference held?', 'What is the venue of NCPS 2025'),
+    ('Which topics are covered in the conference?', 'what are the themes'),
+    ('registration fees for students', 'registration fee for student'),
+    ('How do I register?', 'how can I sign up'),
+    ('What is the abstract submission deadline?', 'abstract deadline'),
+]
+
+# Questions that share most of their words but need a different answer
+DISTINCT = [
+    ('What is the abstract submission deadline?', 'What is the registration deadline?'),
+    ('abstract deadline', 'registration deadline'),
+    ('Is there a registration fee?', 'Is there a submission fee?'),
+    ('When is the abstract deadline?', 'When is the registration deadline?'),
+    ('Can I submit two abstracts', 'can i edit my abstract after submitting'),
+    ('Where is the conference held?', 'Where is the hotel?'),
+    ('registration fees for students', 'registration fees for faculty'),
+    ('How do I register?', 'How do I submit?'),
+]
+
+
+class Command(BaseCommand):
+    help = ("Check the chatbot's paraphrase cache against labelled question pairs: paraphrases must reuse "
+            "the earlier answer and questions that differ must not.")
+
+    def handle(self, *args, **options):
+        threshold = settings.CHATBOT_SEMANTIC_THRESHOLD
+        failures = []
+        for pairs, expected in ((PARAPHRASES, True), (DISTINCT, False)):
+            for answered, asked in pairs:
+                index = SemanticIndex(max_rows=10)
+                index.add(answered, 'scope', 'key')
+                score, key = index.nearest(asked, 'scope')
+                reused = key is not None and score >= threshold
+                # Cosine of the two questions, whether or not their content words allowed reuse
+                a, b = vectorize(answered), vectorize(asked)
+                cosine = sum(weight * b.get(bucket, 0.0) for bucket, weight in a.items())
+                label = 'reuse' if expected else 'miss '
+                line = f'  {label} {cosine:.3f}  {answered!r} -> {asked!r}'
+                if reused != expected:
+                    failures.append(line)
+                    self.stdout.write(self.style.ERROR(line))
+                else:
+                    self.stdout.write(line)
+
+        if failures:
+            raise CommandError(f'{len(failures)} of {len(PARAPHRASES) + len(DISTINCT)} pairs wrong at threshold {threshold}.')
+        self.stdout.write(self.style.SUCCESS(
+            f'{len(PARAPHRASES)} paraphrases reuse and {len(DISTINCT)} distinct questions miss at threshold {threshold}.'
+        ))
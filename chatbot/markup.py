@@ -0,0 +1,151 @@
+"""
+Markdown-to-HTML cleanup for model output.
+
+The prompt asks the model for HTML, but it still slips into markdown:
+**bold**, ## headers and "* " / "- " bullets. MarkupCleaner rewrites those
+as the text arrives, so a streamed reply can be shown chunk by chunk and a
+whole reply (clean_ai_markup) comes out exactly the same.
+"""
+
+import re
+
+# Longest run we wait on for a "<...>" to close before treating "<" as text
+MAX_TAG_LENGTH = 200
+
+_BR_RE = re.compile(r'<br\s*/?>', re.IGNORECASE)
+_PLAIN_RE = re.compile(r'[^\n*#<]+')
+
+
+class MarkupCleaner:
+    """
+    Incremental cleanup: feed() returns the HTML that is safe to show so far,
+    holding back only what the next chunk could still change (a lone "*",
+    an unfinished "<tag", a bullet marker, trailing newlines). finish()
+    flushes the rest.
+
+    Newlines become <br> unless the model has already used <br> itself, and
+    leading/trailing blank lines are dropped like str.strip().
+    """
+
+    def __init__(self):
+        self.buffer = ''
+        self.at_line_start = True
+        self.started = False
+        self.bold = False
+        self.saw_br = False
+        self.newlines = 0
+
+    def feed(self, text):
+        self.buffer += text
+        return self._drain(final=False)
+
+    def finish(self):
+        out = self._drain(final=True)
+        if self.bold:
+            out += '</strong>'
+            self.bold = False
+        # Trailing newlines are never emitted
+        self.newlines = 0
+        return out
+
+    def _emit(self, out, html):
+        if not html:
+            return
+        if self.newlines:
+            out.append(('\n' if self.saw_br else '<br>') * self.newlines)
+            self.newlines = 0
+        out.append(html)
+        self.started = True
+
+    def _drain(self, final):
+        out = []
+        buf = self.buffer
+        i = 0
+        n = len(buf)
+
+        while i < n:
+            if self.at_line_start:
+                j = i
+                while j < n and buf[j] in ' \t':
+                    j += 1
+                if j == n:
+                    if not final:
+                        break
+                    i = n
+                    break
+                ch = buf[j]
+                if ch == '\n':
+                    i = j
+                    self.at_line_start = False
+                    continue
+                if ch in '*-':
+                    if j + 1 == n and not final:
+                        break
+                    if j + 1 < n and buf[j + 1] in ' \t':
+                        k = j + 1
+                        while k < n and buf[k] in ' \t':
+                            k += 1
+                        if k == n and not final:
+                            break
+                        self._emit(out, '• ')
+                        i = k
+                        self.at_line_start = False
+                        continue
+                # Indentation is only dropped for bullets
+                if self.started:
+                    self._emit(out, buf[i:j])
+                i = j
+                self.at_line_start = False
+                continue
+
+            ch = buf[i]
+            if ch == '\n':
+                if self.started:
+                    self.newlines += 1
+                self.at_line_start = True
+                i += 1
+            elif ch == '*':
+                if i + 1 == n and not final:
+                    break
+                if i + 1 < n and buf[i + 1] == '*':
+                    self._emit(out, '</strong>' if self.bold else '<strong>')
+                    self.bold = not self.bold
+                    i += 2
+                else:
+                    self._emit(out, '*')
+                    i += 1
+            elif ch == '#':
+                j = i
+                while j < n and buf[j] == '#':
+                    j += 1
+                while j < n and buf[j] in ' \t':
+                    j += 1
+                if j == n and not final:
+                    break
+                i = j
+            elif ch == '<':
+                end = buf.find('>', i)
+                if end == -1:
+                    if not final and n - i < MAX_TAG_LENGTH:
+                        break
+                    self._emit(out, '&lt;')
+                    i += 1
+                    continue
+                tag = buf[i:end + 1]
+                if _BR_RE.fullmatch(tag):
+                    self.saw_br = True
+                self._emit(out, tag)
+                i = end + 1
+            else:
+                match = _PLAIN_RE.match(buf, i)
+                self._emit(out, match.group())
+                i = match.end()
+
+        self.buffer = buf[i:]
+        return ''.join(out)
+
+
+def clean_ai_markup(text):
+    """Clean a complete model reply in one go."""
+    cleaner = MarkupCleaner()
+    return cleaner.feed(text) + cleaner.finish()
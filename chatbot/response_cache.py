@@ -0,0 +1,116 @@
+"""
+Cache of generated chatbot answers.
+
+Entries live in the Django cache named by CHATBOT_CACHE_ALIAS. Expiry is
+CHATBOT_CACHE_TTL and eviction is the backend's (LocMemCache drops the least
+recently used entries past MAX_ENTRIES; point the alias at Redis or
+Memcached with an LRU policy to share answers between workers).
+
+Keys combine the normalized question, admin flag, page type and the
+knowledge-base version, plus a version token that clear() rotates. Hit,
+miss and store counters are kept in the same backend, along with hits
+served by the similarity lookup in semantic_cache.
+"""
+
+import hashlib
+import json
+import re
+import unicodedata
+import uuid
+
+from django.conf import settings
+from django.core.cache import caches
+
+CACHE_VERSION_KEY = "chatbot:answers:version"
+COUNTER_KEYS = {
+    "hits": "chatbot:answers:hits",
+    "misses": "chatbot:answers:misses",
+    "stores": "chatbot:answers:stores",
+    "semantic_hits": "chatbot:answers:semantic_hits",
+}
+
+_NON_WORD_RE = re.compile(r"[^\w]+")
+
+
+def _cache():
+    return caches[settings.CHATBOT_CACHE_ALIAS]
+
+
+def normalize_message(message):
+    """Case, full-width forms, punctuation and spacing do not change the key."""
+    text = unicodedata.normalize("NFKC", message).casefold()
+    return " ".join(_NON_WORD_RE.sub(" ", text).split())
+
+
+def knowledge_base_version(knowledge_base):
+    """Digest of the knowledge base and the model, so editing either misses the old answers"""
+    payload = json.dumps([knowledge_base, settings.OLLAMA_MODEL, settings.CHATBOT_CACHE_VERSION], sort_keys=True)
+    return hashlib.sha1(payload.encode()).hexdigest()[:12]
+
+
+def make_scope(is_admin, page_type, kb_version, context=""):
+    """Everything but the question that decides an answer; only answers in one scope are shared."""
+    backend = _cache()
+    version = backend.get(CACHE_VERSION_KEY)
+    if version is None:
+        backend.add(CACHE_VERSION_KEY, uuid.uuid4().hex, None)
+        version = backend.get(CACHE_VERSION_KEY)
+    digest = hashlib.sha1("\x1f".join([str(bool(is_admin)), page_type or "", context]).encode()).hexdigest()[:16]
+    return f"{version}:{kb_version}:{digest}"
+
+
+def make_key(message, scope):
+    digest = hashlib.sha1(normalize_message(message).encode()).hexdigest()
+    return f"chatbot:answers:{scope}:{digest}"
+
+
+def _count(name):
+    backend = _cache()
+    key = COUNTER_KEYS[name]
+    try:
+        backend.incr(key)
+    except ValueError:
+        if not backend.add(key, 1, None):
+            backend.incr(key)
+
+
+def get(key):
+    """Return the cached answer, or None, counting a hit or a miss."""
+    if not settings.CHATBOT_CACHE_ENABLED:
+        return None
+    answer = _cache().get(key)
+    _count("hits" if answer is not None else "misses")
+    return answer
+
+
+def get_similar(key):
+    """Fetch the answer stored for a similar question, counting a semantic hit."""
+    answer = _cache().get(key)
+    if answer is not None:
+        _count("semantic_hits")
+    return answer
+
+
+def store(key, answer):
+    if not settings.CHATBOT_CACHE_ENABLED or not answer:
+        return
+    _cache().set(key, answer, settings.CHATBOT_CACHE_TTL)
+    _count("stores")
+
+
+def stats():
+    counts = _cache().get_many(list(COUNTER_KEYS.values()))
+    result = {name: counts.get(key, 0) for name, key in COUNTER_KEYS.items()}
+    lookups = result["hits"] + result["misses"]
+    # Misses answered by a similar question still saved a generation
+    result["hit_rate"] = (result["hits"] + result["semantic_hits"]) / lookups if lookups else 0.0
+    return result
+
+
+def reset_stats():
+    _cache().delete_many(list(COUNTER_KEYS.values()))
+
+
+def clear():
+    """Orphan every cached answer; the backend expires or evicts them."""
+    _cache().set(CACHE_VERSION_KEY, uuid.uuid4().hex, None)
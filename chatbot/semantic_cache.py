@@ -0,0 +1,177 @@
+"""
+Similarity lookup in front of the exact answer cache.
+
+Questions are embedded offline with a deterministic hashed n-gram
+vectorizer: words are normalized (conference synonyms folded together,
+stop words and plurals dropped), then word, word-bigram and character-
+trigram features are hashed into VECTOR_DIM buckets and L2-normalized.
+Similarity only ranks candidates: an answer is reused only for a question
+with the same normalized content words, since one differing word
+("abstract deadline" vs "registration deadline") changes the answer.
+
+Each process keeps an inverted index of the questions it has answered:
+bucket -> (row, weight) postings in typed arrays, so a lookup only touches
+rows sharing a feature with the query. A row stores the exact-cache key of
+its answer; rows whose answer has expired are treated as misses.
+"""
+
+import math
+import re
+import threading
+import unicodedata
+import zlib
+from array import array
+
+from django.conf import settings
+
+VECTOR_DIM = 1 << 18
+
+STOP_WORDS = frozenset("""
+    a an the is are was were be been to of for in on at by and or with from
+    i me my we our you your it its this that these those there
+    do does did can could will would should may might shall please
+    what how when where which who whom why about any some
+    tell know want need get find give show let
+    covered included available list detail information info
+    conference ncps 2025 penguin
+""".split())
+
+# Phrases users reach for interchangeably (after plurals are dropped),
+# folded onto one word
+SYNONYMS = [
+    ('last date', 'deadline'), ('due date', 'deadline'), ('closing date', 'deadline'),
+    ('final date', 'deadline'), ('cut off', 'deadline'), ('cutoff', 'deadline'),
+    ('sign up', 'register'), ('signup', 'register'), ('enroll', 'register'),
+    ('enrol', 'register'), ('registration', 'register'),
+    ('location', 'venue'), ('held', 'venue'), ('place', 'venue'), ('address', 'venue'),
+    ('topic', 'theme'), ('subject', 'theme'), ('track', 'theme'),
+    ('paper', 'abstract'), ('submission', 'submit'), ('submitting', 'submit'), ('upload', 'submit'),
+    ('abstract submit', 'abstract'), ('submit abstract', 'abstract'),
+]
+
+WORD_WEIGHT = 1.0
+BIGRAM_WEIGHT = 0.5
+TRIGRAM_WEIGHT = 0.1  # tolerates typos without outweighing whole words
+
+_NON_WORD_RE = re.compile(r"[^\w]+")
+
+
+def _singular(word):
+    if word not in STOP_WORDS and len(word) > 3 and word.endswith('s') and not word.endswith('ss'):
+        return word[:-1]
+    return word
+
+
+def content_words(text):
+    text = unicodedata.normalize("NFKC", text).casefold()
+    text = f" {' '.join(_singular(w) for w in _NON_WORD_RE.sub(' ', text).split())} "
+    for phrase, word in SYNONYMS:
+        text = text.replace(f" {phrase} ", f" {word} ")
+    return [word for word in text.split() if word not in STOP_WORDS]
+
+
+def vectorize(text):
+    """Sparse unit vector {bucket: weight}; empty when nothing is left to compare."""
+    features = {}
+
+    def add(feature, weight):
+        bucket = zlib.crc32(feature.encode()) % VECTOR_DIM
+        features[bucket] = features.get(bucket, 0.0) + weight
+
+    words = content_words(text)
+    for word in words:
+        add(f"w:{word}", WORD_WEIGHT)
+        padded = f"#{word}#"
+        for i in range(len(padded) - 2):
+            add(f"c:{padded[i:i + 3]}", TRIGRAM_WEIGHT)
+    for first, second in zip(words, words[1:]):
+        add(f"b:{first} {second}", BIGRAM_WEIGHT)
+
+    norm = math.sqrt(sum(w * w for w in features.values()))
+    if not norm:
+        return {}
+    return {bucket: weight / norm for bucket, weight in features.items()}
+
+
+class SemanticIndex:
+    """
+    Per-process index of answered questions, partitioned by cache scope.
+
+    Rows are appended; once max_rows is reached the older half is dropped
+    and the postings rebuilt, which keeps inserts amortized O(features).
+    """
+
+    def __init__(self, max_rows):
+        self.max_rows = max_rows
+        self._lock = threading.Lock()
+        self._reset([])
+
+    def _reset(self, rows):
+        self.rows = []      # (scope, answer key, vector, content words)
+        self.postings = {}  # bucket -> (array of rows, array of weights)
+        for row in rows:
+            self._append(*row)
+
+    def _append(self, scope, key, vector, words):
+        index = len(self.rows)
+        self.rows.append((scope, key, vector, words))
+        for bucket, weight in vector.items():
+            posting = self.postings.get(bucket)
+            if posting is None:
+                posting = self.postings[bucket] = (array('I'), array('f'))
+            posting[0].append(index)
+            posting[1].append(weight)
+
+    def add(self, question, scope, key):
+        vector = vectorize(question)
+        if not vector:
+            return
+        with self._lock:
+            if len(self.rows) >= self.max_rows:
+                self._reset(self.rows[len(self.rows) // 2:])
+            self._append(scope, key, vector, frozenset(content_words(question)))
+
+    def nearest(self, question, scope):
+        """
+        Return (similarity, answer key) of the closest question in scope with
+        the same content words, or (0.0, None).
+        """
+        vector = vectorize(question)
+        if not vector:
+            return 0.0, None
+        words = frozenset(content_words(question))
+        scores = {}
+        with self._lock:
+            for bucket, weight in vector.items():
+                posting = self.postings.get(bucket)
+                if posting is None:
+                    continue
+                for row, row_weight in zip(*posting):
+                    scores[row] = scores.get(row, 0.0) + weight * row_weight
+            best, best_key = 0.0, None
+            for row, score in scores.items():
+                row_scope, key, _, row_words = self.rows[row]
+                if row_scope == scope and row_words == words and score > best:
+                    best, best_key = score, key
+        return best, best_key
+
+    def __len__(self):
+        return len(self.rows)
+
+
+index = SemanticIndex(settings.CHATBOT_SEMANTIC_MAX_ENTRIES)
+
+
+def remember(question, scope, key):
+    if settings.CHATBOT_SEMANTIC_CACHE:
+        index.add(question, scope, key)
+
+
+def similar_key(question, scope):
+    """Exact-cache key of a previous question close enough to reuse its answer."""
+    if not settings.CHATBOT_SEMANTIC_CACHE:
+        return None
+    score, key = index.nearest(question, scope)
+    if score >= settings.CHATBOT_SEMANTIC_THRESHOLD:
+        return key
+    return None
@@ -1,9 +1,11 @@
+from django.conf import settings
 from django.urls import path
 from . import views
 
 app_name = 'chatbot'
 
 urlpatterns = [
-    path('api/message/', views.chatbot_message, name='message'),
+    path('api/message/', views.chatbot_message_async if settings.CHATBOT_ASYNC else views.chatbot_message, name='message'),
     path('api/init/', views.chatbot_init, name='init'),
+    path('api/cache-stats/', views.chatbot_cache_stats, name='cache_stats'),
 ]
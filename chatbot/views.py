@@ -1,11 +1,21 @@
-from django.http import JsonResponse
+from asgiref.sync import sync_to_async
+from django.contrib.admin.views.decorators import staff_member_required
+from django.http import JsonResponse, StreamingHttpResponse
 from django.views.decorators.csrf import csrf_exempt
 from django.conf import settings
 import json
+import logging
 import requests
+from contextlib import nullcontext
 from datetime import datetime
 from conference.models import AbstractSubmission, Participant, ScientificTheme
 
+from . import client, response_cache, semantic_cache
+from .intents import bypass_matcher, response_matcher
+from .markup import MarkupCleaner, clean_ai_markup
+
+logger = logging.getLogger(__name__)
+
 
 class NCPSChatbot:
     """AI-powered chatbot for NCPS 2025 using local Ollama (qwen3:4b)"""
@@ -21,11 +31,8 @@ class NCPSChatbot:
         self.max_tokens = settings.OLLAMA_MAX_TOKENS
         self.timeout = settings.OLLAMA_TIMEOUT
         
-        print(f"✅ AI Initialized: Ollama")
-        print(f"   Model: {self.model}")
-        print(f"   URL: {self.ollama_url}")
-        print(f"   Timeout: {self.timeout}s")
-        print(f"   Admin Mode: {self.is_admin}")
+        logger.debug("Chatbot initialized: Ollama model %s at %s (timeout %ss, admin %s)",
+                     self.model, self.ollama_url, self.timeout, self.is_admin)
         
         self.knowledge_base = self.load_knowledge_base()
     
@@ -121,54 +128,55 @@ class NCPSChatbot:
                 'revision_abstracts': revision_abstracts,
                 'total_themes': total_themes,
             }
-        except Exception as e:
-            print(f"Error fetching stats: {e}")
+        except Exception:
+            logger.exception("Could not fetch chatbot stats")
             return None
     
-    def generate_ai_response(self, user_message, page_context=''):
-        """Generate response using local Ollama AI (qwen3:4b)"""
-        try:
-            print(f"🤖 Generating AI response...")
-            print(f"📡 Calling Ollama with message: {user_message[:50]}...")
-            
-            kb = self.knowledge_base
-            page_type = getattr(self, 'page_type', 'home')
-            page_ctx = getattr(self, 'page_context', '')
-            message_lower = user_message.lower()
-            
-            # Smart fallback check - bypass AI for specific questions that need accurate responses
-            # 1. Form field questions
-            if any(phrase in message_lower for phrase in ['fill here', 'what i have to fill', 'form fields', 'required fields']) and page_type != 'home':
-                print(f"🎯 Using page-specific fallback for {page_type} page")
-                return self.generate_response(user_message)
-            
-            # 2. Link/navigation requests - bypass AI to provide direct links
-            if any(phrase in message_lower for phrase in ['link for', 'give me link', 'give me the link', 'give mw the link', 'go to', 'take me to', 'page link', 'url for']):
-                print(f"🔗 Using fallback for link request")
-                return self.generate_response(user_message)
-            
-            # 3. Password reset questions - bypass AI for accurate instructions
-            if any(phrase in message_lower for phrase in ['reset password', 'forgot password', 'password reset', 'change password', 'recover password', 'lost password', 'how to reset']):
-                print(f"🔐 Using fallback for password reset")
-                return self.generate_response(user_message)
-            
-            # 4. Identity questions
-            if any(phrase in message_lower for phrase in ['who are you', 'what is your name', 'introduce yourself']):
-                print(f"👤 Using fallback for identity question")
-                return self.generate_response(user_message)
-            
-            # 5. Page identification
-            if any(phrase in message_lower for phrase in ['which page', 'what page', 'current page', 'where am i']):
-                print(f"📍 Using fallback for page identification")
-                return self.generate_response(user_message)
-            
-            # Build system prompt with conference context
-            if self.is_admin:
-                # Fetch real-time statistics for admin
-                stats = self.get_real_time_stats()
-                stats_text = ""
-                if stats:
-                    stats_text = f"""
+    def use_fallback(self, user_message):
+        """Smart fallback check - bypass AI for specific questions that need accurate responses"""
+        page_type = getattr(self, 'page_type', 'home')
+        message_lower = user_message.lower()
+        intents = bypass_matcher.match(message_lower)
+        
+        # 1. Form field questions
+        if 'form_fields' in intents and page_type != 'home':
+            logger.debug("Using page-specific fallback for %s page", page_type)
+            return True
+        
+        # 2. Link/navigation requests - bypass AI to provide direct links
+        if 'link' in intents:
+            logger.debug("Using fallback for link request")
+            return True
+        
+        # 3. Password reset questions - bypass AI for accurate instructions
+        if 'password_reset' in intents:
+            logger.debug("Using fallback for password reset")
+            return True
+        
+        # 4. Identity questions
+        if 'identity' in intents:
+            logger.debug("Using fallback for identity question")
+            return True
+        
+        # 5. Page identification
+        if 'page_identification' in intents:
+            logger.debug("Using fallback for page identification")
+            return True
+        
+        return False
+    
+    def build_prompt(self, user_message, page_context=''):
+        """Build the full Ollama prompt with conference context"""
+        kb = self.knowledge_base
+        page_type = getattr(self, 'page_type', 'home')
+        
+        # Build system prompt with conference context
+        if self.is_admin:
+            # Fetch real-time statistics for admin
+            stats = getattr(self, 'stats', None) or self.get_real_time_stats()
+            stats_text = ""
+            if stats:
+                stats_text = f"""
 CURRENT STATISTICS (Real-time from database):
 - Total Registrations: {stats['total_registrations']}
 - Total Abstracts: {stats['total_abstracts']}
@@ -178,8 +186,8 @@ CURRENT STATISTICS (Real-time from database):
 - Revision Requested: {stats['revision_abstracts']}
 - Active Themes: {stats['total_themes']}
 """
-                
-                system_prompt = f"""You are an AI assistant for NCPS 2025 administrative dashboard.
+            
+            system_prompt = f"""You are an AI assistant for NCPS 2025 administrative dashboard.
 
 Help admins with:
 - Managing abstract submissions (review, approve, reject, request revisions)
@@ -205,26 +213,26 @@ RESPONSE FORMAT:
 - NO DUPLICATES - each URL or info appears only ONCE
 
 Be professional, concise, and actionable."""
-            else:
-                # Determine current page context
-                page_context_info = ""
-                if page_type == 'login':
-                    page_context_info = "\n\nCURRENT PAGE: Login Page - User needs Username and Password to login."
-                elif page_type == 'register':
-                    page_context_info = "\n\nCURRENT PAGE: Registration Page - User needs to fill: Username, Email, Password, Confirm Password, First Name, Last Name, Organization/Institution, Designation."
-                elif page_type == 'dashboard':
-                    page_context_info = "\n\nCURRENT PAGE: User Dashboard - User can submit abstracts, view submissions, edit profile."
-                elif page_type == 'abstract':
-                    page_context_info = (
-                        "\n\nCURRENT PAGE: Abstract Submission Form\n"
-                        "- Title is mandatory\n"
-                        "- User must submit EITHER abstract text (250–500 words) OR upload a PDF\n"
-                        "- Both cannot be submitted together\n"
-                        "- Theme selection is required"
-                    )
+        else:
+            # Determine current page context
+            page_context_info = ""
+            if page_type == 'login':
+                page_context_info = "\n\nCURRENT PAGE: Login Page - User needs Username and Password to login."
+            elif page_type == 'register':
+                page_context_info = "\n\nCURRENT PAGE: Registration Page - User needs to fill: Username, Email, Password, Confirm Password, First Name, Last Name, Organization/Institution, Designation."
+            elif page_type == 'dashboard':
+                page_context_info = "\n\nCURRENT PAGE: User Dashboard - User can submit abstracts, view submissions, edit profile."
+            elif page_type == 'abstract':
+                page_context_info = (
+                    "\n\nCURRENT PAGE: Abstract Submission Form\n"
+                    "- Title is mandatory\n"
+                    "- User must submit EITHER abstract text (250–500 words) OR upload a PDF\n"
+                    "- Both cannot be submitted together\n"
+                    "- Theme selection is required"
+                )
 
-                
-                system_prompt = f"""You are Penguin, the NCPS 2025 Conference Assistant.
+            
+            system_prompt = f"""You are Penguin, the NCPS 2025 Conference Assistant.
 
 NCPS 2025 Conference Info:
 Event: {kb['conference']['name']}
@@ -282,80 +290,228 @@ RESPONSE RULES:
 5. When providing guidelines, be comprehensive and include all relevant steps
 
 Keep responses helpful and detailed (3-5 paragraphs for guidelines). Use proper HTML formatting."""
+        
+        # Add page context if available
+        page_info = ""
+        if page_context:
+            page_info = f"\n\nPAGE CONTEXT: {page_context}\nProvide specific help for THIS page."
+        
+        return f"{system_prompt}{page_info}\n\nUser Question: {user_message}\n\nAssistant:"
+    
+    def cached_answer(self, user_message, page_context=''):
+        """
+        Look the question up in the response cache, then among similar past
+        questions; returns (key, answer or None).
+        
+        The key covers everything build_prompt adds besides the question:
+        the page type and the page_context passed to both. Admin answers
+        quote live statistics, so those are part of the key too and kept for
+        build_prompt.
+        """
+        context = [page_context]
+        if self.is_admin:
+            self.stats = self.get_real_time_stats()
+            context.append(json.dumps(self.stats, sort_keys=True))
+        self.cache_scope = response_cache.make_scope(
+            self.is_admin,
+            getattr(self, 'page_type', 'home'),
+            response_cache.knowledge_base_version(self.knowledge_base),
+            '\x1f'.join(context),
+        )
+        key = response_cache.make_key(user_message, self.cache_scope)
+        answer = response_cache.get(key)
+        if answer is None:
+            similar_key = semantic_cache.similar_key(user_message, self.cache_scope)
+            if similar_key:
+                answer = response_cache.get_similar(similar_key)
+        return key, answer
+    
+    def remember_answer(self, user_message, cache_key, answer):
+        """Store a generated answer for this question and for later paraphrases of it"""
+        response_cache.store(cache_key, answer)
+        semantic_cache.remember(user_message, self.cache_scope, cache_key)
+    
+    def ollama_payload(self, prompt, stream=False):
+        """Request body for the Ollama generate API"""
+        return {
+            'model': self.model,
+            'prompt': prompt,
+            'stream': stream,
+            'temperature': self.temperature,
+            'num_predict': self.max_tokens,
+        }
+    
+    def generate_ai_response(self, user_message, page_context=''):
+        """Generate response using local Ollama AI (qwen3:4b)"""
+        try:
+            logger.debug("Generating AI response for: %s", user_message[:50])
             
-            # Add page context if available
-            page_info = ""
-            if page_context:
-                page_info = f"\n\nPAGE CONTEXT: {page_context}\nProvide specific help for THIS page."
-            
-            # Generate AI response
-            full_prompt = f"{system_prompt}{page_info}\n\nUser Question: {user_message}\n\nAssistant:"
-            
-            print(f"🔍 Sending prompt to Ollama (length: {len(full_prompt)})")
-            
-            # Call Ollama API
-            payload = {
-                'model': self.model,
-                'prompt': full_prompt,
-                'stream': False,
-                'temperature': self.temperature,
-                'num_predict': self.max_tokens,
-            }
+            if self.use_fallback(user_message):
+                return self.generate_response(user_message)
             
-            response = requests.post(
-                self.ollama_url,
-                json=payload,
-                timeout=self.timeout
-            )
+            cache_key, cached = self.cached_answer(user_message, page_context)
+            if cached:
+                logger.debug("Cached answer")
+                return cached
             
-            print(f"📨 Response status: {response.status_code}")
+            full_prompt = self.build_prompt(user_message, page_context)
+        
+        except Exception:
+            logger.exception("AI generation error")
+            return self.generate_response(user_message)
+        
+        return self.complete_prompt(user_message, full_prompt, cache_key=cache_key)
+    
+    def complete_prompt(self, user_message, full_prompt, slot=None, cache_key=None):
+        """
+        Send a built prompt to Ollama and return the cleaned reply.
+        
+        Runs inside a limiter slot unless the caller passes one it already
+        holds. Any failure falls back to the keyword response; only real
+        AI answers are stored under cache_key.
+        """
+        try:
+            with slot or client.limiter:
+                logger.debug("Sending prompt to Ollama (length %d)", len(full_prompt))
+                
+                # Call Ollama API over a pooled keep-alive connection
+                response = client.session().post(
+                    self.ollama_url,
+                    json=self.ollama_payload(full_prompt),
+                    timeout=self.timeout
+                )
             
             if response.status_code == 200:
                 result = response.json()
                 ai_response = result.get('response', '').strip()
                 
-                print(f"✅ AI response received (length: {len(ai_response)})")
+                logger.debug("AI response received (length %d)", len(ai_response))
                 
                 if ai_response:
                     # Clean up markdown formatting that AI might still use
-                    # Remove markdown bold **text** and replace with <strong>
-                    import re
-                    ai_response = re.sub(r'\*\*([^*]+)\*\*', r'<strong>\1</strong>', ai_response)
-                    # Remove markdown headers ## and ###
-                    ai_response = re.sub(r'#+\s*', '', ai_response)
-                    # Replace markdown bullets * or - with •
-                    ai_response = re.sub(r'^\s*[\*\-]\s+', '• ', ai_response, flags=re.MULTILINE)
-                    
-                    # Ensure HTML formatting for line breaks
-                    if '<br>' not in ai_response and '\n\n' in ai_response:
-                        ai_response = ai_response.replace('\n\n', '<br><br>')
-                    if '<br>' not in ai_response and '\n' in ai_response:
-                        ai_response = ai_response.replace('\n', '<br>')
-                    
+                    ai_response = clean_ai_markup(ai_response)
+                    if cache_key:
+                        self.remember_answer(user_message, cache_key, ai_response)
                     return ai_response
                 else:
                     return self.generate_response(user_message)
             else:
-                print(f"❌ Ollama error: HTTP {response.status_code}")
+                logger.warning("Ollama error: HTTP %s", response.status_code)
                 return self.generate_response(user_message)
         
-        except requests.exceptions.ConnectionError as e:
-            print(f"❌ Cannot connect to Ollama at {self.ollama_url}")
-            print(f"   Make sure Ollama is running: ollama serve")
+        except client.ChatbotBusy:
+            logger.warning("All %d Ollama slots busy, using fallback", client.limiter.limit)
             return self.generate_response(user_message)
         
-        except Exception as e:
-            print(f"❌ AI generation error: {str(e)}")
+        except requests.exceptions.ConnectionError:
+            logger.warning("Cannot connect to Ollama at %s; is `ollama serve` running?", self.ollama_url)
             return self.generate_response(user_message)
+        
+        except Exception:
+            logger.exception("AI generation error")
+            return self.generate_response(user_message)
+    
+    def stream_ai_response(self, user_message, page_context=''):
+        """
+        Yield the Ollama reply as cleaned HTML fragments while it is generated.
+        
+        Falls back to the keyword response (as one fragment) when the question
+        bypasses AI or Ollama cannot be reached before the first token.
+        """
+        if self.use_fallback(user_message):
+            yield self.generate_response(user_message)
+            return
+        
+        cache_key, cached = self.cached_answer(user_message, page_context)
+        if cached:
+            logger.debug("Cached answer")
+            yield cached
+            return
+        
+        yield from self.stream_prompt(user_message, self.build_prompt(user_message, page_context), cache_key=cache_key)
+    
+    def stream_prompt(self, user_message, full_prompt, upstream=None, cache_key=None):
+        """
+        Streaming counterpart of complete_prompt.
+        
+        Ollama is read through client.OllamaStream, which frees the limiter
+        slot when the generation ends rather than when the client has read
+        the last fragment. Callers that opened the stream themselves pass it
+        as upstream. If nothing usable comes back, the keyword response is
+        sent instead.
+        """
+        logger.debug("Streaming prompt from Ollama (length %d)", len(full_prompt))
+        
+        cleaner = MarkupCleaner()
+        parts = []
+        try:
+            if upstream is None:
+                upstream = client.open_stream(
+                    self.ollama_url, self.ollama_payload(full_prompt, stream=True), self.timeout
+                )
+            
+            # Ollama streams one JSON object per line
+            for line in upstream:
+                try:
+                    chunk = json.loads(line)
+                except ValueError:
+                    chunk = None
+                if not isinstance(chunk, dict):
+                    logger.warning("Skipping malformed line from Ollama: %.80r", line)
+                    continue
+                if 'error' in chunk:
+                    logger.warning("Ollama error: %s", chunk['error'])
+                    break
+                html = cleaner.feed(chunk.get('response', ''))
+                if html:
+                    parts.append(html)
+                    yield html
+                if chunk.get('done'):
+                    break
+            
+            html = cleaner.finish()
+            if html:
+                parts.append(html)
+                yield html
+            if not parts:
+                yield self.generate_response(user_message)
+            elif cache_key:
+                self.remember_answer(user_message, cache_key, ''.join(parts))
+        
+        except client.ChatbotBusy:
+            logger.warning("All %d Ollama slots busy, using fallback", client.limiter.limit)
+            yield self.generate_response(user_message)
+        
+        except requests.exceptions.HTTPError as e:
+            logger.warning("Ollama error: %s", e)
+            yield self.generate_response(user_message)
+        
+        except requests.exceptions.ConnectionError:
+            logger.warning("Cannot connect to Ollama at %s; is `ollama serve` running?", self.ollama_url)
+            if not parts:
+                yield self.generate_response(user_message)
+        
+        except Exception:
+            # Mid-stream failures keep what the user has already seen
+            logger.exception("AI streaming error")
+            if not parts:
+                yield self.generate_response(user_message)
+            else:
+                yield cleaner.finish()
+        
+        finally:
+            if upstream is not None:
+                upstream.close()
     
     def generate_response(self, user_message):
         """Fallback: Generate response using keywords"""
         message_lower = user_message.lower()
+        intents = response_matcher.match(message_lower)
         kb = self.knowledge_base
         
         # Check for page-specific context questions FIRST
         page_type = getattr(self, 'page_type', 'home')
-        if any(phrase in message_lower for phrase in ['fill here', 'what i have to fill', 'what do i fill', 'fill in', 'required fields', 'form fields']):
+        if 'form_fields' in intents:
             if page_type == 'login':
                 return "<strong>📝 Login Page</strong><br><br>To login, fill in:<br>• <strong>Username:</strong> Your registered email or username<br>• <strong>Password:</strong> Your account password<br><br>Don't have an account? <a href='/register/' style='color: #3b82f6; font-weight: bold;'>Register here</a>"
             elif page_type == 'register':
@@ -375,7 +531,7 @@ Keep responses helpful and detailed (3-5 paragraphs for guidelines). Use proper
                 return "<strong>📝 Dashboard Features</strong><br><br>From here you can:<br>• <strong>Submit Abstract</strong> - Click 'Submit New Abstract'<br>• <strong>View Submissions</strong> - See status of your abstracts<br>• <strong>Edit Profile</strong> - Update your information<br>• <strong>Track Progress</strong> - Monitor review status"
         
         # Check for page identification questions
-        if any(phrase in message_lower for phrase in ['which page', 'what page', 'current page', 'where am i']):
+        if 'page_identification' in intents:
             if page_type == 'login':
                 return "<strong>📍 Current Page</strong><br><br>You are on the <strong>Login Page</strong>.<br><br>This is where you enter your credentials to access the conference portal. Enter your username and password to continue."
             elif page_type == 'register':
@@ -388,29 +544,29 @@ Keep responses helpful and detailed (3-5 paragraphs for guidelines). Use proper
                 return "<strong>📍 Current Page</strong><br><br>You are on the <strong>NCPS 2025 Home Page</strong>.<br><br>This is the main conference information page. You can navigate to Login, Registration, or explore conference details from here."
         
         # Check for identity/introduction questions
-        if any(phrase in message_lower for phrase in ['who are you', 'what is your name', 'your name', 'introduce yourself', 'what are you']):
+        if 'identity' in intents:
             return "<strong>👋 Hello! I'm Penguin</strong><br><br>Your intelligent assistant for <strong>NCPS 2025</strong> - the National Conference on Polar Sciences.<br><br><strong>I can help you with:</strong><br>• Registration and account setup<br>• Abstract submission guidelines<br>• Conference dates, venue, and schedules<br>• Scientific themes and topics<br>• General questions about NCPS<br><br>What would you like to know about the conference?"
         
         # Check for navigation/link requests
-        if any(phrase in message_lower for phrase in ['login page link', 'link for login', 'login link', 'go to login', 'take me to login', 'login url']):
+        if 'login_link' in intents:
             return "<strong>🔗 Login Page</strong><br><br>You can access the login page here:<br><a href='/login/' style='color: #3b82f6; font-weight: bold; text-decoration: underline;'>→ Go to Login Page</a><br><br>Don't have an account yet? <a href='/register/' style='color: #3b82f6;'>Register here</a>"
         
-        if any(phrase in message_lower for phrase in ['register page link', 'link for register', 'registration link', 'signup link', 'go to register', 'take me to register']):
+        if 'register_link' in intents:
             return "<strong>🔗 Registration Page</strong><br><br>Create your NCPS 2025 account:<br><a href='/register/' style='color: #3b82f6; font-weight: bold; text-decoration: underline;'>→ Go to Registration Page</a><br><br>Already have an account? <a href='/login/' style='color: #3b82f6;'>Login here</a>"
         
-        if any(phrase in message_lower for phrase in ['dashboard link', 'go to dashboard', 'take me to dashboard', 'my dashboard']):
+        if 'dashboard_link' in intents:
             return "<strong>🔗 Dashboard</strong><br><br>Access your dashboard:<br><a href='/dashboard/' style='color: #3b82f6; font-weight: bold; text-decoration: underline;'>→ Go to Dashboard</a><br><br><em>Note: You need to be logged in to access the dashboard.</em>"
         
-        if any(phrase in message_lower for phrase in ['home page link', 'go to home', 'take me home', 'main page']):
+        if 'home_link' in intents:
             return "<strong>🔗 Home Page</strong><br><br>Return to the main page:<br><a href='/' style='color: #3b82f6; font-weight: bold; text-decoration: underline;'>→ Go to Home Page</a>"
         
         # Check for password reset questions
-        if any(phrase in message_lower for phrase in ['reset password', 'forgot password', 'forgot my password', 'password reset', 'change password', 'recover password', 'lost password', 'how to reset', 'cant login', "can't login", 'cannot login']):
+        if 'password_reset' in intents:
             return "<strong>🔐 Reset Your Password</strong><br><br><strong>Steps to reset your password:</strong><br><br>1. Go to the <a href='/login/' style='color: #3b82f6; font-weight: bold;'>Login Page</a><br>2. Click on <strong>'Forgot Password?'</strong> link<br>3. Enter your registered email address<br>4. Check your email for reset instructions<br>5. Click the reset link in the email<br>6. Create a new password<br><br><strong>Note:</strong> If you don't receive the email within 5 minutes, check your spam folder.<br><br>Need more help? Contact <a href='mailto:ncps2025@ncpor.gov.in' style='color: #3b82f6;'>ncps2025@ncpor.gov.in</a>"
         
         # Admin-specific responses
         if self.is_admin:
-            if any(word in message_lower for word in ['review', 'approve', 'reject']):
+            if 'admin_review' in intents:
                 return (
                     "<strong>📋 Review Abstracts</strong><br><br>"
                     "Steps:<br>"
@@ -421,7 +577,7 @@ Keep responses helpful and detailed (3-5 paragraphs for guidelines). Use proper
                     "5. Submit to notify the author"
                 )
 
-            elif any(word in message_lower for word in ['analytics', 'statistics']):
+            elif 'admin_analytics' in intents:
                 return (
                     "<strong>📊 Analytics Dashboard</strong><br><br>"
                     "• Total registrations & abstracts<br>"
@@ -439,7 +595,7 @@ Keep responses helpful and detailed (3-5 paragraphs for guidelines). Use proper
         # --------------------------------------------------
         # Public user responses (NON-ADMIN)
         # --------------------------------------------------
-        if any(word in message_lower for word in ['submit', 'abstract', 'submission']):
+        if 'abstract' in intents:
             return (
                 "<strong>📝 Abstract Submission</strong><br><br>"
                 "<strong>Submission Rules (IMPORTANT):</strong><br>"
@@ -463,7 +619,7 @@ Keep responses helpful and detailed (3-5 paragraphs for guidelines). Use proper
                 "5. Submit for review"
             )
 
-        elif any(word in message_lower for word in ['register', 'registration', 'sign up']):
+        elif 'registration' in intents:
             return (
                 "<strong>📋 Register for NCPS 2025</strong><br><br>"
                 "<strong>Required Fields:</strong><br>"
@@ -479,7 +635,7 @@ Keep responses helpful and detailed (3-5 paragraphs for guidelines). Use proper
                 "<a href='/register/' style='color: #3b82f6; font-weight: bold; text-decoration: underline;'>"
                 "→ Register Now</a>"
             )
-        elif any(word in message_lower for word in ['date', 'when', 'schedule']):
+        elif 'schedule' in intents:
             return (
                 f"<strong>📅 Conference Schedule</strong><br><br>"
                 f"<strong>Dates:</strong> {kb['conference']['dates']}<br><br>"
@@ -491,14 +647,14 @@ Keep responses helpful and detailed (3-5 paragraphs for guidelines). Use proper
                 "• Networking events<br><br>"
                 "Detailed schedule coming soon!"
             )
-        elif any(word in message_lower for word in ['theme', 'topic', 'subject', 'focus']):
+        elif 'themes' in intents:
             themes_list = '<br>'.join([f"• {t}" for t in kb['themes']])
             return (
                 "<strong>🔬 Scientific Themes</strong><br><br>"
                 f"{themes_list}<br><br>"
                 "You can submit abstracts under any theme."
             )
-        elif any(word in message_lower for word in ['presentation', 'oral', 'poster', 'format']):
+        elif 'presentation' in intents:
             return (
                 "<strong>🎤 Presentation Formats</strong><br><br>"
                 "<strong>Oral Presentation:</strong><br>"
@@ -509,7 +665,7 @@ Keep responses helpful and detailed (3-5 paragraphs for guidelines). Use proper
                 "• Portrait orientation<br><br>"
                 "Format assigned after abstract acceptance."
             )
-        elif any(word in message_lower for word in ['venue', 'location', 'where', 'address']):
+        elif 'venue' in intents:
             return (
                 f"<strong>📍 Conference Venue</strong><br><br>"
                 f"{kb['conference']['venue']}<br><br>"
@@ -518,7 +674,7 @@ Keep responses helpful and detailed (3-5 paragraphs for guidelines). Use proper
                 "• Travel guidelines for participants<br><br>"
                 f"Contact: {kb['conference']['email']}"
             )
-        elif any(word in message_lower for word in ['contact', 'email', 'help', 'support']):
+        elif 'contact' in intents:
             email_link = f"<a href='mailto:{kb['conference']['email']}' style='color: #3b82f6;'>{kb['conference']['email']}</a>"
             return (
                 "<strong>📧 Get Help</strong><br><br>"
@@ -527,7 +683,7 @@ Keep responses helpful and detailed (3-5 paragraphs for guidelines). Use proper
                 "• Registration help<br>"
                 "• Technical support"
             )
-        elif any(word in message_lower for word in ['about', 'what is', 'ncps', 'conference info']):
+        elif 'about' in intents:
             return (
                 f"<strong>ℹ️ About NCPS 2025</strong><br><br>"
                 f"{kb['conference']['name']}<br><br>"
@@ -551,12 +707,10 @@ Keep responses helpful and detailed (3-5 paragraphs for guidelines). Use proper
     
     def get_response(self, message, conversation_history=None):
         """Main method to get chatbot response"""
-        print(f"🤖 get_response called. AI enabled: {self.ai_enabled}")
         if self.ai_enabled:
-            print(f"📡 Using Ollama AI for message: {message[:50]}...")
             response = self.generate_ai_response(message)
         else:
-            print(f"📚 Using keyword-based response")
+            logger.debug("Using keyword-based response")
             response = self.generate_response(message)
         
         return {
@@ -564,6 +718,80 @@ Keep responses helpful and detailed (3-5 paragraphs for guidelines). Use proper
             'timestamp': datetime.now().isoformat(),
             'quick_replies': self.get_quick_replies() if len(message.strip()) < 10 else []
         }
+    
+    def stream_response(self, message):
+        """Streaming counterpart of get_response: yields delta events, then a done event"""
+        if self.ai_enabled:
+            for html in self.stream_ai_response(message):
+                yield {'delta': html}
+        else:
+            yield {'delta': self.generate_response(message)}
+        
+        yield {
+            'done': True,
+            'timestamp': datetime.now().isoformat(),
+            'quick_replies': self.get_quick_replies() if len(message.strip()) < 10 else []
+        }
+    
+    async def astream_response(self, message, full_prompt, cache_key=None):
+        """
+        stream_response for the async view, given a prompt built by the caller.
+        
+        The limiter slot is awaited on the event loop; only the blocking reads
+        from the stream's queue run in worker threads, one chunk at a time.
+        """
+        try:
+            upstream = await client.aopen_stream(
+                self.ollama_url, self.ollama_payload(full_prompt, stream=True), self.timeout
+            )
+        except client.ChatbotBusy:
+            logger.warning("All %d Ollama slots busy, using fallback", client.limiter.limit)
+            yield {'delta': self.generate_response(message)}
+        else:
+            tokens = self.stream_prompt(message, full_prompt, upstream=upstream, cache_key=cache_key)
+            try:
+                while True:
+                    html = await sync_to_async(next, thread_sensitive=False)(tokens, None)
+                    if html is None:
+                        break
+                    yield {'delta': html}
+            finally:
+                # The generator may never have started, so close the stream directly too
+                upstream.close()
+                try:
+                    tokens.close()
+                except ValueError:
+                    # Still reading in its thread; the client went away mid-chunk
+                    pass
+        
+        yield {
+            'done': True,
+            'timestamp': datetime.now().isoformat(),
+            'quick_replies': self.get_quick_replies() if len(message.strip()) < 10 else []
+        }
+
+
+async def aiter_events(events):
+    """Serve a ready list of events through the async branch of ndjson_response"""
+    for event in events:
+        yield event
+
+
+def ndjson_response(events):
+    """Send events as newline-delimited JSON, one flushed line per event"""
+    if hasattr(events, '__aiter__'):
+        async def lines():
+            async for event in events:
+                yield json.dumps(event) + '\n'
+        content = lines()
+    else:
+        content = (json.dumps(event) + '\n' for event in events)
+    
+    response = StreamingHttpResponse(content, content_type='application/x-ndjson')
+    response['Cache-Control'] = 'no-cache'
+    # Stop nginx from buffering the stream
+    response['X-Accel-Buffering'] = 'no'
+    return response
 
 
 @csrf_exempt
@@ -578,8 +806,8 @@ def chatbot_init(request):
             'quick_replies': chatbot.get_quick_replies(),
             'is_admin': is_admin
         })
-    except Exception as e:
-        print(f"Error: {e}")
+    except Exception:
+        logger.exception("Chatbot init failed")
         return JsonResponse({
             'greeting': 'Welcome to NCPS 2025!',
             'quick_replies': [],
@@ -587,15 +815,28 @@ def chatbot_init(request):
         })
 
 
+@staff_member_required
+def chatbot_cache_stats(request):
+    """Hit-rate counters of the answer cache as seen by this server process"""
+    return JsonResponse(response_cache.stats())
+
+
 @csrf_exempt
 def chatbot_message(request):
-    """API endpoint to handle chatbot messages"""
+    """
+    API endpoint to handle chatbot messages.
+    
+    With "stream": true in the body the reply is sent as newline-delimited
+    JSON: {"delta": html} events as Ollama generates, then {"done": true, ...}
+    with the timestamp and quick replies.
+    """
     try:
         data = json.loads(request.body)
         user_message = data.get('message', '').strip()
         is_admin = data.get('is_admin', False)
         page_context = data.get('page_context', '')
         page_type = data.get('page_type', 'home')
+        stream = bool(data.get('stream', False))
         
         if not user_message:
             return JsonResponse({'error': 'Message is required'}, status=400)
@@ -618,13 +859,85 @@ def chatbot_message(request):
                 'quick_replies': chatbot.get_quick_replies(),
                 'timestamp': datetime.now().isoformat()
             }
+        elif stream:
+            return ndjson_response(chatbot.stream_response(user_message))
         else:
             response = chatbot.get_response(user_message)
         
+        if stream:
+            message = response.pop('message')
+            return ndjson_response([{'delta': message}, dict(response, done=True)])
+        return JsonResponse(response)
+    
+    except json.JSONDecodeError:
+        return JsonResponse({'error': 'Invalid JSON'}, status=400)
+    except Exception as e:
+        logger.exception("Chatbot request failed")
+        return JsonResponse({'error': str(e)}, status=500)
+
+
+@csrf_exempt
+async def chatbot_message_async(request):
+    """
+    chatbot_message for ASGI servers (enabled with CHATBOT_ASYNC).
+    
+    Waiting for a generation slot costs no thread, and the Ollama call runs in
+    a worker thread outside Django's sync thread, so slow generations do not
+    hold up the rest of the site. Request and response formats are the same.
+    """
+    try:
+        data = json.loads(request.body)
+        user_message = data.get('message', '').strip()
+        is_admin = data.get('is_admin', False)
+        page_context = data.get('page_context', '')
+        page_type = data.get('page_type', 'home')
+        stream = bool(data.get('stream', False))
+        
+        if not user_message:
+            return JsonResponse({'error': 'Message is required'}, status=400)
+        
+        # Initialize chatbot
+        chatbot = NCPSChatbot(is_admin=is_admin)
+        chatbot.page_context = page_context
+        chatbot.page_type = page_type
+        
+        # Special commands, keyword mode and AI bypasses need no Ollama call
+        if user_message.lower() == '/start':
+            reply = chatbot.get_greeting()
+        elif user_message.lower() in ['hello', 'hi', 'hey']:
+            reply = 'Hello! How can I assist you with NCPS 2025 today?'
+        elif not chatbot.ai_enabled or chatbot.use_fallback(user_message):
+            reply = chatbot.generate_response(user_message)
+        else:
+            # Admin keys and prompts read live statistics from the database
+            cache_key, reply = await sync_to_async(chatbot.cached_answer)(user_message)
+        
+        if reply is None:
+            full_prompt = await sync_to_async(chatbot.build_prompt)(user_message)
+            
+            if stream:
+                return ndjson_response(chatbot.astream_response(user_message, full_prompt, cache_key))
+            
+            try:
+                async with client.limiter as slot:
+                    reply = await sync_to_async(chatbot.complete_prompt, thread_sensitive=False)(
+                        user_message, full_prompt, slot=nullcontext(slot), cache_key=cache_key
+                    )
+            except client.ChatbotBusy:
+                logger.warning("All %d Ollama slots busy, using fallback", client.limiter.limit)
+                reply = chatbot.generate_response(user_message)
+        
+        response = {
+            'message': reply,
+            'timestamp': datetime.now().isoformat(),
+            'quick_replies': chatbot.get_quick_replies() if len(user_message) < 10 else []
+        }
+        if stream:
+            return ndjson_response(aiter_events([{'delta': response.pop('message')}, dict(response, done=True)]))
         return JsonResponse(response)
     
     except json.JSONDecodeError:
         return JsonResponse({'error': 'Invalid JSON'}, status=400)
     except Exception as e:
-        print(f"Error: {e}")
+        logger.exception("Chatbot request failed")
         return JsonResponse({'error': str(e)}, status=500)
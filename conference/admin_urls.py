@@ -12,6 +12,10 @@ urlpatterns = [
     path("logs/", admin_views.admin_logs, name="admin_logs"),
     path("logs/export/", admin_views.export_admin_logs, name="export_admin_logs"),
 
+    # Background exports
+    path("exports/", admin_views.export_jobs, name="export_jobs"),
+    path("exports/<int:pk>/download/", admin_views.export_job_download, name="export_job_download"),
+
     # Abstracts
     path("abstracts/", admin_views.admin_abstracts, name="abstracts"),
     path("abstracts/<int:pk>/", admin_views.admin_abstract_detail, name="abstract_detail"),
@@ -31,6 +35,7 @@ urlpatterns = [
         name="submit_review_comment",
     ),
     path("abstracts/export/", admin_views.admin_export_abstracts, name="export_abstracts"),
+    path("abstracts/export-pdfs/", admin_views.admin_export_abstract_pdfs, name="export_abstract_pdfs"),
 
     # Registrations
     path("registrations/", admin_views.admin_registrations, name="registrations"),
@@ -47,6 +52,7 @@ urlpatterns = [
 
     # Analytics
     path("analytics/", admin_views.admin_analytics, name="analytics"),
+    path("analytics/trends/", admin_views.admin_analytics_trends, name="analytics_trends"),
 
     # Theme Admins
     path("theme-admins/", admin_views.theme_admin_list, name="theme_admin_list"),
@@ -1,5 +1,9 @@
 from datetime import datetime
 import csv
+import os
+from functools import partial
+from itertools import chain
+from urllib.parse import urlencode
 
 from django.shortcuts import render, redirect, get_object_or_404
 from django.contrib import messages
@@ -7,12 +11,18 @@ from django.contrib.admin.views.decorators import staff_member_required
 from django.contrib.auth.models import User
 from django.contrib.auth.password_validation import validate_password
 from django.core.exceptions import ValidationError
-from django.core.paginator import Paginator
-from django.db.models import Count, Q, F
-from django.http import HttpResponse, HttpResponseForbidden
+from django.db import transaction
+from django.db.models import Count, Exists, OuterRef, Prefetch, Q
+from django.http import FileResponse, Http404, HttpResponseForbidden, JsonResponse, StreamingHttpResponse
 from django.utils import timezone
-from .utils import log_admin_action
-from datetime import timedelta
+from .utils import (
+    log_admin_action,
+    queue_mail,
+    get_unread_notification_count,
+    adjust_unread_notification_count,
+    reset_unread_notification_count,
+    invalidate_unread_notification_counts,
+)
 from .models import (
     AbstractSubmission,
     Participant,
@@ -21,11 +31,26 @@ from .models import (
     AbstractReview,
     AdminActionLog,
     ScientificTheme,  
+    ExportJob,
 )
-from django.core.mail import send_mail
-from django.conf import settings
 import json
 from .context_processors import theme_choices as get_theme_choices
+from .services.exports import (
+    ABSTRACT_HEADER,
+    ADMIN_LOG_HEADER,
+    REGISTRATION_HEADER,
+    abstract_rows,
+    admin_log_filter_args,
+    admin_log_rows,
+    archived_admin_log_rows,
+    filter_abstracts,
+    filter_admin_logs,
+    registration_rows,
+    stream_zip,
+)
+from .services import analytics, log_archive
+from .services.pagination import cached_count, keyset_page
+from .services.trends import maybe_refresh_trends, trend_series
 
 
 
@@ -50,59 +75,69 @@ def _get_theme_filtered_abstracts(user):
     return None
 
 
+# ==================================================
+# HELPER: STREAMING CSV
+# ==================================================
+class _Echo:
+    """File-like object whose write() hands the CSV line straight back."""
 
-@staff_member_required
-def admin_logs(request):
-    if not request.user.is_superuser:
-        return HttpResponseForbidden("Only parent admin allowed.")
+    def write(self, value):
+        return value
 
-    logs_qs = AdminActionLog.objects.select_related("user").order_by("created_at")
-    query_params = request.GET.copy()
-    query_params.pop("page", None)
-    query_params._mutable = True
-    query_params.setlist("page", [])
 
+def _stream_csv(filename, header, rows):
+    writer = csv.writer(_Echo())
 
-    # -------- FILTERS --------
-    action = request.GET.get("action")
-    user_id = request.GET.get("user")
-    start_date = request.GET.get("start_date")
-    end_date = request.GET.get("end_date")
+    def lines():
+        yield writer.writerow(header)
+        for row in rows:
+            yield writer.writerow(row)
 
-    if action:
-        logs_qs = logs_qs.filter(action=action)
+    response = StreamingHttpResponse(lines(), content_type="text/csv")
+    response["Content-Disposition"] = f'attachment; filename="{filename}"'
+    return response
 
-    if user_id and user_id.isdigit():
-        logs_qs = logs_qs.filter(user__id=int(user_id))
 
-    if start_date:
-        try:
-            logs_qs = logs_qs.filter(created_at__date__gte=start_date)
-        except ValueError:
-            pass
+@staff_member_required
+def admin_logs(request):
+    if not request.user.is_superuser:
+        return HttpResponseForbidden("Only parent admin allowed.")
 
-    if end_date:
-        try:
-            logs_qs = logs_qs.filter(created_at__date__lte=end_date)
-        except ValueError:
-            pass
+    logs_qs = AdminActionLog.objects.select_related("user")
 
-    # -------- PAGINATION --------
-    paginator = Paginator(logs_qs, 20)  # 20 logs per page
-    page_number = request.GET.get("page")
-    page_obj = paginator.get_page(page_number)
-    query_string = query_params.urlencode()
+    # -------- FILTERS --------
+    filters = {
+        key: request.GET.get(key, "")
+        for key in ("action", "user", "start_date", "end_date")
+        if request.GET.get(key)
+    }
+    logs_qs = filter_admin_logs(logs_qs, filters)
+
+    # Date ranges reaching back past the live table also read the archives
+    archive_args = admin_log_filter_args(filters)
+    older = None
+    if log_archive.reaches_archive(archive_args["start"], archive_args["end"]):
+        older = partial(log_archive.archived_entries, **archive_args)
+
+    # -------- PAGINATION (keyset on created_at, id; newest first) --------
+    page_obj = keyset_page(
+        logs_qs,
+        after=request.GET.get("after"),
+        before=request.GET.get("before"),
+        per_page=20,
+        older=older,
+    )
 
     context = {
         "logs": page_obj,
         "actions": AdminActionLog.ACTION_CHOICES,
         "users": User.objects.filter(is_staff=True),
         "page_obj": page_obj,
-        "query_string": query_string,
+        "total_logs": cached_count(logs_qs, "admin_logs", filters),
+        "archive_searched": older is not None,
+        "query_string": urlencode(filters),
     }
 
-
-
     return render(request, "admin/admin_logs.html", context)
 
 
@@ -115,15 +150,9 @@ def admin_dashboard(request):
         return redirect("conference:ncps_admin:theme_dashboard")
 
 
-    total_abstracts = AbstractSubmission.objects.count()
-    total_registrations = Participant.objects.count()
-
-    status_stats = (
-        AbstractSubmission.objects
-        .values("status")
-        .annotate(count=Count("status"))
-    )
-    status_map = {s["status"]: s["count"] for s in status_stats}
+    # Counts come from the daily rollups (services/analytics.py)
+    abstract_stats = analytics.abstract_summary()
+    status_map = {s["status"]: s["count"] for s in abstract_stats["by_status"]}
 
     recent_abstracts = (
         AbstractSubmission.objects
@@ -138,8 +167,8 @@ def admin_dashboard(request):
     )
 
     context = {
-        "total_abstracts": total_abstracts,
-        "total_registrations": total_registrations,
+        "total_abstracts": abstract_stats["total"],
+        "total_registrations": analytics.registration_summary()["total"],
         "recent_abstracts": recent_abstracts,
         "recent_registrations": recent_registrations,
         "pending_count": status_map.get("PENDING", 0),
@@ -168,19 +197,9 @@ def admin_abstracts(request):
     search_query = request.GET.get("search", "")
     theme_filter = request.GET.get("theme", "")
 
-    if status_filter:
-        abstracts = abstracts.filter(status=status_filter)
-
-    if search_query:
-        abstracts = abstracts.filter(
-            Q(title__icontains=search_query) |
-            Q(user__username__icontains=search_query) |
-            Q(user__email__icontains=search_query)
-        )
-
-    # Theme filter (by ScientificTheme.code)
-    if theme_filter:
-        abstracts = abstracts.filter(theme__code=theme_filter)
+    # Status, search and theme (by ScientificTheme.code) filters; each row
+    # shows the author's participant code
+    abstracts = filter_abstracts(abstracts, request.GET).select_related("user__participant")
 
     # Use canonical 8-theme list (falls back to DB names where present)
     theme_choices = get_theme_choices(request).get('theme_choices', [])
@@ -188,7 +207,8 @@ def admin_abstracts(request):
     themes = [{"code": code, "name": name} for code, name in theme_choices]
 
     context = {
-        "abstracts": abstracts.order_by("-submitted_at"),
+        # search results keep their relevance order
+        "abstracts": abstracts if search_query else abstracts.order_by("-submitted_at"),
         "status_choices": [
             c for c in AbstractSubmission.STATUS_CHOICES
             if c[0] != "RESUBMITTED"
@@ -370,28 +390,31 @@ def admin_update_abstract_status(request, pk):
         abstract.approved_at = None
 
 
-    abstract.save()
-
-    messages.success(
-        request,
-        f"Abstract marked as {abstract.get_status_display()}."
-    )
+    # Status change, decision email (queued by the pre_save signal) and the
+    # participant notification commit together.
+    with transaction.atomic():
+        abstract.save()
 
-    # ---------- 🔔 CREATE NOTIFICATION ----------
-    comment = (abstract.admin_comments or "").strip()
+        # ---------- 🔔 CREATE NOTIFICATION ----------
+        comment = (abstract.admin_comments or "").strip()
 
-    Notification.objects.create(
-        user=abstract.user,
-        abstract=abstract,
-        title=f"Abstract {abstract.get_status_display()}",
-        message=(
-            f"Your abstract '{abstract.title}' was marked as "
-            f"{abstract.get_status_display()}."
-            + (
-                f"\n\nReviewer comment:\n{comment}"
-                if comment else ""
+        Notification.objects.create(
+            user=abstract.user,
+            abstract=abstract,
+            title=f"Abstract {abstract.get_status_display()}",
+            message=(
+                f"Your abstract '{abstract.title}' was marked as "
+                f"{abstract.get_status_display()}."
+                + (
+                    f"\n\nReviewer comment:\n{comment}"
+                    if comment else ""
+                )
             )
         )
+
+    messages.success(
+        request,
+        f"Abstract marked as {abstract.get_status_display()}."
     )
     ACTION_MAP = {
         "APPROVED": "APPROVED",
@@ -423,44 +446,45 @@ def admin_export_abstracts(request):
         return HttpResponseForbidden("Not authorized.")
 
     # Apply same filters as list view so export matches current view
-    status_filter = request.GET.get("status", "")
-    search_query = request.GET.get("search", "")
-    theme_filter = request.GET.get("theme", "")
+    abstracts = filter_abstracts(abstracts, request.GET)
 
-    if status_filter:
-        abstracts = abstracts.filter(status=status_filter)
+    return _stream_csv("abstracts.csv", ABSTRACT_HEADER, abstract_rows(abstracts))
 
-    if search_query:
-        abstracts = abstracts.filter(
-            Q(title__icontains=search_query) |
-            Q(user__username__icontains=search_query) |
-            Q(user__email__icontains=search_query)
-        )
 
-    if theme_filter:
-        abstracts = abstracts.filter(theme__code=theme_filter)
-
-    response = HttpResponse(content_type="text/csv")
-    response["Content-Disposition"] = 'attachment; filename="abstracts.csv"'
-
-    writer = csv.writer(response)
-    writer.writerow([
-        "ID", "Participant Code", "Title", "Author", "Email",
-        "Theme", "Status", "Submitted On"
-    ])
-
-    for a in abstracts:
-        writer.writerow([
-            a.id,
-            (getattr(getattr(a.user, 'participant', None), 'participant_code', '') or ''),
-            a.title,
-            a.user.get_full_name() or a.user.username,
-            a.user.email,
-            a.theme.name,
-            a.get_status_display(),
-            a.submitted_at.strftime("%d-%m-%Y"),
-        ])
+# ==================================================
+# DOWNLOAD ABSTRACT PDFS AS ZIP (THEME SAFE)
+# ==================================================
+@staff_member_required
+def admin_export_abstract_pdfs(request):
+    user = request.user
+    abstracts = _get_theme_filtered_abstracts(user)
 
+    if abstracts is None:
+        return HttpResponseForbidden("Not authorized.")
+
+    # Same filters as the list view / CSV export
+    abstracts = filter_abstracts(abstracts, request.GET)
+
+    def entries():
+        for abstract in abstracts.select_related(
+            "user__participant", "theme"
+        ).iterator(chunk_size=200):
+            participant = getattr(abstract.user, "participant", None)
+            code = (participant.participant_code if participant else None) or f"USER-{abstract.user_id}"
+            folder = abstract.theme.code
+            if abstract.pdf_file:
+                yield f"{folder}/{code}_{abstract.id}.pdf", abstract.pdf_file
+            if abstract.revised_submission:
+                yield f"{folder}/{code}_{abstract.id}_revised.pdf", abstract.revised_submission
+
+    log_admin_action(
+        request,
+        action="OTHER",
+        description="Downloaded abstract PDFs as ZIP"
+    )
+
+    response = StreamingHttpResponse(stream_zip(entries()), content_type="application/zip")
+    response["Content-Disposition"] = 'attachment; filename="abstract_pdfs.zip"'
     return response
 
 
@@ -525,63 +549,39 @@ def admin_analytics(request):
     if abstracts is None:
         return HttpResponseForbidden("Not authorized.")
 
-    # ================= BASE COUNTS =================
-    total_abstracts = abstracts.count()
-    total_registrations = 0
+    # ================= ROLLUPS (services/analytics.py) =================
+    theme_ids = None
+    if not user.is_superuser:
+        theme_ids = list(user.theme_admin.themes.values_list("id", flat=True))
 
-    last_30_days = timezone.now() - timedelta(days=30)
+    abstract_stats = analytics.abstract_summary(theme_ids)
+    participant_stats = analytics.theme_participant_summary(theme_ids)
 
-    recent_abstracts = abstracts.filter(
-        submitted_at__gte=last_30_days
-    ).count()
+    total_abstracts = abstract_stats["total"]
+    recent_abstracts = abstract_stats["recent"]
 
     if user.is_superuser:
-        recent_registrations = Participant.objects.filter(
-            created_at__gte=last_30_days
-        ).count()
-        total_registrations = Participant.objects.count()
+        registrations = analytics.registration_summary()
+        total_registrations = registrations["total"]
+        recent_registrations = registrations["recent"]
     else:
-        themes = user.theme_admin.themes.all()
-
-        recent_registrations = Participant.objects.filter(
-            user__abstracts__theme__in=themes,
-            created_at__gte=last_30_days
-        ).distinct().count()
-
-        total_registrations = Participant.objects.filter(
-            user__abstracts__theme__in=themes
-        ).distinct().count()
+        total_registrations = participant_stats["total"]
+        recent_registrations = participant_stats["recent"]
 
     # ================= ABSTRACT STATUS =================
-    abstracts_by_status = (
-        abstracts
-        .values("status")
-        .annotate(count=Count("id"))
-        .order_by("status")
-    )
+    abstracts_by_status = abstract_stats["by_status"]
 
     status_labels = [s["status"] for s in abstracts_by_status]
     status_counts = [s["count"] for s in abstracts_by_status]
 
     # ================= ABSTRACT THEME =================
-    abstracts_by_theme = (
-        abstracts
-        .values(theme_name=F("theme__name"))
-        .annotate(count=Count("id"))
-        .order_by("theme_name")
-    )
+    abstracts_by_theme = abstract_stats["by_theme"]
 
     theme_labels = [t["theme_name"] for t in abstracts_by_theme]
     theme_counts = [t["count"] for t in abstracts_by_theme]
 
     # ================= SCIENTIFIC THEME (PARTICIPANTS) =================
-    scientific_theme_stats = (
-        Participant.objects
-        .filter(user__abstracts__in=abstracts)
-        .distinct()
-        .values("scientific_theme")
-        .annotate(count=Count("id"))
-    )
+    scientific_theme_stats = participant_stats["by_scientific_theme"]
 
     scientific_theme_labels = [
         s["scientific_theme"] or "Unknown"
@@ -612,41 +612,46 @@ def admin_analytics(request):
     return render(request, "admin/analytics.html", context)
 
 
+TREND_POINTS = {"DAY": (60, 366), "HOUR": (72, 24 * 14)}
+
+
+@staff_member_required
+def admin_analytics_trends(request):
+    """Compact JSON time-series for the analytics trend chart."""
+    user = request.user
+    if _get_theme_filtered_abstracts(user) is None:
+        return HttpResponseForbidden("Not authorized.")
+
+    granularity = "HOUR" if request.GET.get("granularity") == "hour" else "DAY"
+    default_points, max_points = TREND_POINTS[granularity]
+    try:
+        points = min(max(int(request.GET.get("points", default_points)), 1), max_points)
+    except ValueError:
+        points = default_points
+
+    theme_codes = None
+    if not user.is_superuser:
+        theme_codes = list(user.theme_admin.themes.values_list("code", flat=True))
+
+    # Folds in only the events since the last pass (throttled)
+    maybe_refresh_trends()
+
+    return JsonResponse(
+        trend_series(granularity, points, theme_codes),
+        json_dumps_params={"separators": (",", ":")},
+    )
+
+
 # ==================================================
 # EXPORT REGISTRATIONS
 # ==================================================
 @staff_member_required
 def admin_export_registrations(request):
-    response = HttpResponse(content_type="text/csv")
-    response["Content-Disposition"] = 'attachment; filename="registrations.csv"'
-
-    writer = csv.writer(response)
-    writer.writerow([
-        "Username",
-        "Participant Code",
-        "Full Name",
-        "Email",
-        "Organization",
-        "Designation",
-        "Scientific Theme",
-        "Phone",
-        "Registered On",
-    ])
-
-    for p in Participant.objects.select_related("user"):
-        writer.writerow([
-            p.user.username,
-            p.participant_code or "",
-            p.user.get_full_name(),
-            p.user.email,
-            p.organization,
-            p.designation,
-            p.get_scientific_theme_display(),
-            p.phone,
-            p.created_at.strftime("%d-%m-%Y"),
-        ])
-
-    return response
+    return _stream_csv(
+        "registrations.csv",
+        REGISTRATION_HEADER,
+        registration_rows(Participant.objects.all()),
+    )
 
 # ==================================================
 # THEME ADMIN MANAGEMENT (PARENT ADMIN ONLY)
@@ -918,31 +923,48 @@ def theme_admin_dashboard(request):
     if not selected_theme:
         selected_theme = themes_all[0] if themes_all else None
 
-    # Abstracts belonging to the selected theme ONLY
-    abstracts = AbstractSubmission.objects.filter(
-        theme=selected_theme
-    ).exclude(
-        id__in=AbstractReview.objects.filter(
-            reviewer=theme_admin
-        ).values_list("abstract_id", flat=True)
-    ) if selected_theme else AbstractSubmission.objects.none()
-
-    # Abstracts assigned to this admin for review (show all assigned, not scoped)
+    # Abstracts belonging to the selected theme ONLY, minus those this admin
+    # was asked to review (correlated NOT EXISTS rather than NOT IN (subquery))
+    if selected_theme:
+        abstracts = AbstractSubmission.objects.filter(theme=selected_theme).exclude(
+            Exists(AbstractReview.objects.filter(abstract=OuterRef("pk"), reviewer=theme_admin))
+        )
+    else:
+        abstracts = AbstractSubmission.objects.none()
+
+    # All status counts in one conditional aggregate
+    stats = abstracts.aggregate(
+        total=Count("id"),
+        pending=Count("id", filter=Q(status="PENDING")),
+        revision=Count("id", filter=Q(status="REVISION")),
+        approved=Count("id", filter=Q(status="APPROVED")),
+        rejected=Count("id", filter=Q(status="REJECTED")),
+    ) if selected_theme else {}
+
+    # Abstracts assigned to this admin for review (show all assigned, not scoped).
+    # (abstract, reviewer) is unique, so the join needs no DISTINCT; only this
+    # admin's review is prefetched, with its sender in the same query.
     review_abstracts = (
         AbstractSubmission.objects
-        .filter(
-            reviews__reviewer=theme_admin
-        )
+        .filter(reviews__reviewer=theme_admin)
         .select_related("theme")
+        .defer("abstract", "extracted_text")
         .prefetch_related(
-            "reviews__assigned_by__user"
+            Prefetch(
+                "reviews",
+                queryset=AbstractReview.objects
+                .filter(reviewer=theme_admin)
+                .select_related("assigned_by__user"),
+            )
         )
-        .distinct()
     )
 
-    participants = Participant.objects.filter(
-        user__abstracts__theme=selected_theme
-    ).distinct() if selected_theme else Participant.objects.none()
+    participants = (
+        Participant.objects
+        .filter(Exists(AbstractSubmission.objects.filter(user=OuterRef("user"), theme=selected_theme)))
+        .select_related("user")
+        .order_by("-created_at")
+    ) if selected_theme else Participant.objects.none()
 
 
     context = {
@@ -950,20 +972,20 @@ def theme_admin_dashboard(request):
         "selected_theme": selected_theme,
 
         # Selected theme stats
-        "total_abstracts": abstracts.count(),
-        "pending_count": abstracts.filter(status="PENDING").count(),
-        "revision_count": abstracts.filter(status="REVISION").count(),
-        "approved_count": abstracts.filter(status="APPROVED").count(),
-        "rejected_count": abstracts.filter(status="REJECTED").count(),
+        "total_abstracts": stats.get("total", 0),
+        "pending_count": stats.get("pending", 0),
+        "revision_count": stats.get("revision", 0),
+        "approved_count": stats.get("approved", 0),
+        "rejected_count": stats.get("rejected", 0),
 
         # Existing data (scoped)
-        "abstracts": abstracts.order_by("-submitted_at")[:10],
-        "participants": participants[:10],
+        "abstracts": list(abstracts.only("title", "status", "submitted_at").order_by("-submitted_at")[:10]),
+        "participants": list(participants[:10]),
 
         # notifications will be shown on dedicated page
 
         # review assignments scoped to selected theme
-        "review_abstracts": review_abstracts,
+        "review_abstracts": list(review_abstracts),
     }
 
     return render(
@@ -987,25 +1009,30 @@ def theme_admin_notifications(request):
         if action == "mark_all":
             if user.is_superuser:
                 Notification.objects.filter(is_read=False).update(is_read=True)
+                invalidate_unread_notification_counts()
             else:
-                Notification.objects.filter(user=user, is_read=False).update(is_read=True)
+                updated = Notification.objects.filter(user=user, is_read=False).update(is_read=True)
+                adjust_unread_notification_count(user.id, -updated)
+                reset_unread_notification_count(user.id)
         else:
             nid = request.POST.get("notification_id")
             if nid and nid.isdigit():
                 # superuser may mark any notification; theme admins only theirs
-                q = Notification.objects.filter(id=int(nid))
+                q = Notification.objects.filter(id=int(nid), is_read=False)
                 if not user.is_superuser:
                     q = q.filter(user=user)
-                q.update(is_read=True)
+                owner_id = q.values_list("user_id", flat=True).first()
+                if owner_id and q.update(is_read=True):
+                    adjust_unread_notification_count(owner_id, -1)
 
         return redirect("conference:ncps_admin:notifications")
 
     if user.is_superuser:
         notifications = Notification.objects.select_related("user", "abstract").order_by("-created_at")
-        unread_count = Notification.objects.filter(is_read=False).count()
+        unread_count = get_unread_notification_count()
     else:
         notifications = Notification.objects.filter(user=user).order_by("-created_at")
-        unread_count = notifications.filter(is_read=False).count()
+        unread_count = get_unread_notification_count(user)
 
     return render(
         request,
@@ -1068,7 +1095,7 @@ def assign_abstract_reviewer(request, pk):
         # Send email to reviewer
         try:
             if reviewer.user.email:
-                send_mail(
+                queue_mail(
                     subject="NCPS 2025 | Review Assignment",
                     message=(
                         f"Dear {reviewer.user.get_full_name() or reviewer.user.username},\n\n"
@@ -1076,9 +1103,7 @@ def assign_abstract_reviewer(request, pk):
                         "Please log in to the admin dashboard to access the submission and submit your review.\n\n"
                         "Regards,\nNCPS 2025 Organizing Committee"
                     ),
-                    from_email=settings.DEFAULT_FROM_EMAIL,
                     recipient_list=[reviewer.user.email],
-                    fail_silently=True,
                 )
         except Exception:
             pass
@@ -1097,16 +1122,14 @@ def assign_abstract_reviewer(request, pk):
         # Optionally email the sender (confirmation)
         try:
             if sender_admin.user.email:
-                send_mail(
+                queue_mail(
                     subject="NCPS 2025 | Review Assigned",
                     message=(
                         f"Dear {sender_admin.user.get_full_name() or sender_admin.user.username},\n\n"
                         f"The abstract '{abstract.title}' was assigned to {reviewer.user.get_full_name() or reviewer.user.username} for review.\n\n"
                         "Regards,\nNCPS 2025 Organizing Committee"
                     ),
-                    from_email=settings.DEFAULT_FROM_EMAIL,
                     recipient_list=[sender_admin.user.email],
-                    fail_silently=True,
                 )
         except Exception:
             pass
@@ -1169,16 +1192,14 @@ def submit_review_comment(request, pk):
                 # send email to assigned_by
                 try:
                     if assigned_by.user.email:
-                        send_mail(
+                        queue_mail(
                             subject="NCPS 2025 | Review Submitted",
                             message=(
                                 f"Dear {assigned_by.user.get_full_name() or assigned_by.user.username},\n\n"
                                 f"The reviewer {review.reviewer.user.get_full_name() or review.reviewer.user.username} has submitted a review for the abstract '{abstract.title}' with status {review.status}.\n\n"
                                 "Please log in to the admin dashboard to view the comments and take further action.\n\nRegards,\nNCPS 2025 Organizing Committee"
                             ),
-                            from_email=settings.DEFAULT_FROM_EMAIL,
                             recipient_list=[assigned_by.user.email],
-                            fail_silently=True,
                         )
                 except Exception:
                     pass
@@ -1205,50 +1226,91 @@ def export_admin_logs(request):
     if not request.user.is_superuser:
         return HttpResponseForbidden("Only parent admin allowed.")
 
-    logs = AdminActionLog.objects.select_related("user").order_by("-created_at")
+    logs = AdminActionLog.objects.order_by("-created_at")
 
     # SAME FILTERS AS LIST PAGE
-    action = request.GET.get("action")
-    user_id = request.GET.get("user")
-    start_date = request.GET.get("start_date")
-    end_date = request.GET.get("end_date")
-
-    if action:
-        logs = logs.filter(action=action)
-
-    if user_id:
-        logs = logs.filter(user__id=user_id)
-
-    if start_date:
-        logs = logs.filter(created_at__date__gte=start_date)
-
-    if end_date:
-        logs = logs.filter(created_at__date__lte=end_date)
-
-    # CSV RESPONSE
-    response = HttpResponse(content_type="text/csv")
-    response["Content-Disposition"] = 'attachment; filename="admin_logs.csv"'
-
-    writer = csv.writer(response)
-    writer.writerow([
-        "Time",
-        "User",
-        "Action",
-        "Object Type",
-        "Object ID",
-        "IP Address",
-        "Description",
-    ])
-
-    for log in logs:
-        writer.writerow([
-            log.created_at.strftime("%d-%m-%Y %H:%M"),
-            log.user.username if log.user else "System",
-            log.get_action_display(),
-            log.object_type or "",
-            log.object_id or "",
-            log.ip_address,
-            log.description,
-        ])
+    logs = filter_admin_logs(logs, request.GET)
 
-    return response
+    rows = chain(admin_log_rows(logs), archived_admin_log_rows(request.GET))
+    return _stream_csv("admin_logs.csv", ADMIN_LOG_HEADER, rows)
+
+
+# ==================================================
+# BACKGROUND EXPORT JOBS
+# ==================================================
+EXPORT_JOB_FILTERS = {
+    "ADMIN_LOGS": ("action", "user", "start_date", "end_date"),
+    "ABSTRACTS": ("status", "search", "theme"),
+}
+
+
+@staff_member_required
+def export_jobs(request):
+    user = request.user
+
+    if request.method == "POST":
+        kind = request.POST.get("kind")
+        export_format = request.POST.get("format", "CSV")
+
+        if kind not in EXPORT_JOB_FILTERS or export_format not in dict(ExportJob.FORMAT_CHOICES):
+            messages.error(request, "Invalid export request.")
+            return redirect("conference:ncps_admin:export_jobs")
+
+        if kind == "ADMIN_LOGS" and not user.is_superuser:
+            return HttpResponseForbidden("Only parent admin allowed.")
+
+        if kind == "ABSTRACTS" and _get_theme_filtered_abstracts(user) is None:
+            return HttpResponseForbidden("Not authorized.")
+
+        filters = {
+            key: request.POST.get(key)
+            for key in EXPORT_JOB_FILTERS[kind]
+            if request.POST.get(key)
+        }
+
+        job = ExportJob.objects.create(
+            user=user,
+            kind=kind,
+            format=export_format,
+            filters=filters,
+        )
+
+        log_admin_action(
+            request,
+            action="CREATE",
+            obj=job,
+            description=f"{job.get_kind_display()} export requested ({export_format})"
+        )
+
+        messages.success(
+            request,
+            "Export queued. You will get a notification with the download link when it is ready."
+        )
+        return redirect("conference:ncps_admin:export_jobs")
+
+    return render(
+        request,
+        "admin/export_jobs.html",
+        {
+            "jobs": ExportJob.objects.filter(user=user)[:50],
+            "formats": ExportJob.FORMAT_CHOICES,
+        }
+    )
+
+
+@staff_member_required
+def export_job_download(request, pk):
+    job = get_object_or_404(ExportJob, pk=pk)
+
+    if job.user_id != request.user.id and not request.user.is_superuser:
+        return HttpResponseForbidden("Not authorized.")
+
+    if job.status != "DONE" or not job.file:
+        raise Http404("Export is not available.")
+
+    try:
+        fh = job.file.open("rb")
+    except FileNotFoundError:
+        raise Http404("Export file no longer exists.")
+
+    return FileResponse(fh, as_attachment=True, filename=os.path.basename(job.file.name))
@@ -1,5 +1,59 @@
+import uuid
+
+from django.core.cache import cache
+
 from .models import ScientificTheme, Participant
-from .models import Notification
+from .utils import get_unread_notification_count
+
+
+# Shared-cache keys for the admin-defined theme names. The version token is
+# rotated by the ScientificTheme save/delete signals; every process keeps its
+# own copy of the catalog and only reloads it when the token changes.
+THEME_CATALOG_VERSION_KEY = "conference:theme_catalog:version"
+THEME_CATALOG_KEY = "conference:theme_catalog:{version}"
+# With a per-process cache (the default LocMemCache) the rotated token only
+# reaches the process that saved the theme, so the token expires and other
+# processes pick up a rename within this many seconds.
+THEME_CATALOG_TTL = 5 * 60
+
+_local_theme_catalog = {"version": None, "themes": None}
+
+
+def _theme_catalog_version():
+    version = cache.get(THEME_CATALOG_VERSION_KEY)
+    if version is None:
+        cache.add(THEME_CATALOG_VERSION_KEY, uuid.uuid4().hex, THEME_CATALOG_TTL)
+        version = cache.get(THEME_CATALOG_VERSION_KEY)
+    return version
+
+
+def get_db_theme_names():
+    """Return a {code: name} map of ScientificTheme rows.
+
+    Served from the process-local copy while the shared version token is
+    unchanged, then from the shared cache, and only hits the database when
+    the catalog has been invalidated.
+    """
+    version = _theme_catalog_version()
+    if version is not None and _local_theme_catalog["version"] == version:
+        return _local_theme_catalog["themes"]
+
+    key = THEME_CATALOG_KEY.format(version=version)
+    themes = cache.get(key)
+    if themes is None:
+        themes = dict(ScientificTheme.objects.values_list("code", "name"))
+        cache.set(key, themes, THEME_CATALOG_TTL)
+
+    _local_theme_catalog["version"] = version
+    _local_theme_catalog["themes"] = themes
+    return themes
+
+
+def invalidate_theme_catalog():
+    """Rotate the catalog version so every process reloads the theme names."""
+    cache.set(THEME_CATALOG_VERSION_KEY, uuid.uuid4().hex, THEME_CATALOG_TTL)
+    _local_theme_catalog["version"] = None
+    _local_theme_catalog["themes"] = None
 
 
 def theme_choices(request):
@@ -21,7 +75,7 @@ def theme_choices(request):
     ]
 
     try:
-        db_themes = {t.code: t.name for t in ScientificTheme.objects.all()}
+        db_themes = get_db_theme_names()
     except Exception:
         db_themes = {}
 
@@ -44,9 +98,9 @@ def notification_count(request):
         if user and user.is_authenticated:
             # Superuser sees global unread count
             if getattr(user, "is_superuser", False):
-                count = Notification.objects.filter(is_read=False).count()
+                count = get_unread_notification_count()
             else:
-                count = Notification.objects.filter(user=user, is_read=False).count()
+                count = get_unread_notification_count(user)
         else:
             count = 0
     except Exception:
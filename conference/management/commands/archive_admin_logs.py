@@ -0,0 +1,121 @@
+from datetime import datetime, timedelta, timezone as dt_timezone
+
+from django.conf import settings
+from django.core.management.base import BaseCommand, CommandError
+from django.utils import timezone
+
+from conference.models import AdminActionLog
+from conference.services import audit_log, log_archive
+
+
+class Command(BaseCommand):
+    help = "Move AdminActionLog rows older than the retention window into monthly gzip JSON-lines archives."
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--days', type=int, default=getattr(settings, 'AUDIT_LOG_RETENTION_DAYS', 180),
+            help='Keep this many days of logs in the live table'
+        )
+        parser.add_argument('--batch-size', type=int, default=2000, help='Rows read and deleted per batch')
+        parser.add_argument('--dry-run', action='store_true', help='Report what would be archived without writing or deleting')
+
+    def handle(self, *args, **options):
+        if options['days'] < 1:
+            raise CommandError('--days must be at least 1.')
+
+        # Entries still sitting in this process's buffer belong in the table first
+        audit_log.flush()
+
+        cutoff = timezone.now() - timedelta(days=options['days'])
+        old_logs = AdminActionLog.objects.filter(created_at__lt=cutoff)
+
+        months = {}
+        for created_at in old_logs.values_list("created_at", flat=True).iterator(chunk_size=options['batch_size']):
+            month = log_archive.month_key(created_at)
+            months[month] = months.get(month, 0) + 1
+
+        if not months:
+            self.stdout.write(self.style.SUCCESS(f'Nothing older than {cutoff:%Y-%m-%d} to archive.'))
+            return
+
+        if options['dry_run']:
+            for month, count in sorted(months.items()):
+                self.stdout.write(f'{month}: {count} row(s) would be archived')
+            return
+
+        index = log_archive.load_index()
+        total = 0
+        for month in sorted(months):
+            written = self.archive_month(index, month, old_logs, cutoff, options['batch_size'])
+            total += written
+            self.stdout.write(f'{month}: archived {written} row(s) to {log_archive.month_file(month)}')
+
+        previous = log_archive.archived_before(index)
+        if previous is None or cutoff > previous:
+            index["archived_before"] = cutoff.isoformat()
+        log_archive.save_index(index)
+
+        self.stdout.write(self.style.SUCCESS(
+            f'Archived {total} log row(s) older than {cutoff:%Y-%m-%d} into {log_archive.archive_dir()}.'
+        ))
+
+    def archive_month(self, index, month, old_logs, cutoff, batch_size):
+        """Append one month's rows to its archive file, then delete them."""
+        year, mon = (int(part) for part in month.split("-"))
+        start = datetime(year, mon, 1, tzinfo=dt_timezone.utc)
+        end = datetime(year + (mon == 12), mon % 12 + 1, 1, tzinfo=dt_timezone.utc)
+        month_logs = old_logs.filter(created_at__gte=start, created_at__lt=end)
+
+        meta = index["months"].get(month)
+        if meta:
+            # The last run archived every row of the month up to last_id that
+            # was older than its cutoff; any still here were written to the
+            # file before a crash stopped the delete
+            leftover, _ = month_logs.filter(
+                id__lte=meta["last_id"], created_at__lt=datetime.fromisoformat(meta["cutoff"])
+            ).delete()
+            if leftover:
+                self.stdout.write(f'{month}: deleted {leftover} row(s) already in the archive')
+
+        rows = (
+            month_logs
+            .order_by("created_at", "id")
+            .values("id", "created_at", "user_id", "user__username", "action",
+                    "object_type", "object_id", "ip_address", "description")
+        )
+
+        ids = []
+        span = []
+
+        def serialised():
+            for log in rows.iterator(chunk_size=batch_size):
+                ids.append(log["id"])
+                if not span:
+                    span.append(log["created_at"])
+                span[1:] = [log["created_at"]]
+                yield log_archive.serialise(log, log["user__username"])
+
+        blocks = log_archive.append_month(month, serialised())
+        written = sum(block["rows"] for block in blocks)
+        if not written:
+            return 0
+
+        first, last = span[0], span[-1]
+        if meta:
+            first = min(first, datetime.fromisoformat(meta["first"]))
+            last = max(last, datetime.fromisoformat(meta["last"]))
+        index["months"][month] = {
+            "file": log_archive.month_file(month),
+            "rows": (meta["rows"] if meta else 0) + written,
+            "first": first.isoformat(),
+            "last": last.isoformat(),
+            "blocks": (meta["blocks"] if meta else []) + blocks,
+            "last_id": max(ids + ([meta["last_id"]] if meta else [])),
+            "cutoff": cutoff.isoformat(),
+        }
+        # The file is on disk and indexed before anything leaves the table
+        log_archive.save_index(index)
+
+        for offset in range(0, len(ids), batch_size):
+            AdminActionLog.objects.filter(pk__in=ids[offset:offset + batch_size]).delete()
+        return written
@@ -0,0 +1,79 @@
+import time
+import tracemalloc
+
+from django.contrib.auth import get_user_model
+from django.core.management.base import BaseCommand, CommandError
+from django.test import RequestFactory
+
+from conference import admin_views
+from conference.models import AdminActionLog
+
+User = get_user_model()
+
+
+class Command(BaseCommand):
+    help = "Benchmark the streaming admin log CSV export: time to first byte, throughput and peak Python memory."
+
+    def add_arguments(self, parser):
+        parser.add_argument('--rows', type=int, default=100000, help='Number of AdminActionLog rows to export')
+        parser.add_argument('--seed', action='store_true', help='Bulk-insert log rows first if fewer than --rows exist')
+        parser.add_argument('--checkpoints', type=int, default=5, help='How many memory samples to print')
+
+    def handle(self, *args, **options):
+        rows = options['rows']
+
+        existing = AdminActionLog.objects.count()
+        if existing < rows:
+            if not options['seed']:
+                raise CommandError(f'Only {existing} log rows exist; rerun with --seed to create {rows - existing} more.')
+            self.seed(rows - existing)
+
+        admin = User.objects.filter(is_superuser=True).first()
+        if not admin:
+            raise CommandError('A superuser is required to call the export view.')
+
+        request = RequestFactory().get('/admin-dashboard/logs/export/')
+        request.user = admin
+
+        step = max(rows // max(options['checkpoints'], 1), 1)
+
+        tracemalloc.start()
+        started = time.perf_counter()
+        response = admin_views.export_admin_logs(request)
+
+        lines = 0
+        size = 0
+        first_byte = None
+        for chunk in response.streaming_content:
+            if first_byte is None:
+                first_byte = time.perf_counter() - started
+            lines += 1
+            size += len(chunk)
+            if lines % step == 0:
+                current, peak = tracemalloc.get_traced_memory()
+                self.stdout.write(
+                    f'{lines:>9} lines  current={current / 1024:8.1f} KiB  peak={peak / 1024:8.1f} KiB'
+                )
+
+        elapsed = time.perf_counter() - started
+        _, peak = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+
+        self.stdout.write(self.style.SUCCESS(
+            f'Exported {lines - 1} rows ({size / 1024 / 1024:.1f} MiB) in {elapsed:.2f}s; '
+            f'first byte after {(first_byte or 0) * 1000:.1f} ms; peak traced memory {peak / 1024:.1f} KiB.'
+        ))
+
+    def seed(self, count, batch_size=5000):
+        self.stdout.write(f'Seeding {count} AdminActionLog rows...')
+        for offset in range(0, count, batch_size):
+            AdminActionLog.objects.bulk_create(
+                AdminActionLog(
+                    action="OTHER",
+                    object_type="Benchmark",
+                    object_id=offset + i,
+                    description="Export benchmark row",
+                    ip_address="127.0.0.1",
+                )
+                for i in range(min(batch_size, count - offset))
+            )
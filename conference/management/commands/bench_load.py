@@ -0,0 +1,327 @@
+import json
+import os
+import threading
+import time
+from collections import defaultdict
+from itertools import cycle
+
+from django.conf import settings
+from django.contrib.auth.models import User
+from django.core.management.base import BaseCommand, CommandError
+from django.db import connection
+from django.test import Client
+from django.urls import reverse
+from django.utils import timezone
+
+from conference.models import AbstractSubmission, ThemeAdmin
+from conference.services import seed
+from conference.services.perf import percentile
+
+# Each simulated user logs in through the real form (unless anonymous) and
+# then walks its flow in a loop. Steps are (label, url builder); builders
+# get the user's context dict.
+FLOWS = {
+    "anonymous": [
+        ("home", lambda ctx: reverse("conference:home")),
+        ("themes", lambda ctx: reverse("conference:themes")),
+        ("theme_detail", lambda ctx: reverse("conference:theme_detail", args=[ctx["theme_code"]])),
+        ("login_page", lambda ctx: reverse("conference:login")),
+    ],
+    "participant": [
+        ("dashboard", lambda ctx: reverse("conference:dashboard")),
+        ("notifications", lambda ctx: reverse("conference:notifications")),
+        ("abstract_detail", lambda ctx: reverse("conference:user_abstract_detail", args=[ctx["abstract_id"]])),
+        ("profile", lambda ctx: reverse("conference:profile")),
+        ("home", lambda ctx: reverse("conference:home")),
+    ],
+    "theme_admin": [
+        ("theme_dashboard", lambda ctx: reverse("conference:ncps_admin:theme_dashboard")),
+        ("theme_notifications", lambda ctx: reverse("conference:ncps_admin:notifications")),
+        ("admin_abstract_detail", lambda ctx: reverse("conference:ncps_admin:abstract_detail", args=[ctx["abstract_id"]])),
+    ],
+    "admin": [
+        ("admin_dashboard", lambda ctx: reverse("conference:ncps_admin:dashboard")),
+        ("admin_abstracts", lambda ctx: reverse("conference:ncps_admin:abstracts")),
+        ("admin_abstracts_search", lambda ctx: reverse("conference:ncps_admin:abstracts") + f"?search={ctx['search']}"),
+        ("admin_abstracts_pending", lambda ctx: reverse("conference:ncps_admin:abstracts") + "?status=PENDING"),
+        ("admin_abstract_detail", lambda ctx: reverse("conference:ncps_admin:abstract_detail", args=[ctx["abstract_id"]])),
+        ("admin_registrations", lambda ctx: reverse("conference:ncps_admin:registrations")),
+        ("admin_analytics", lambda ctx: reverse("conference:ncps_admin:analytics")),
+        ("admin_logs", lambda ctx: reverse("conference:ncps_admin:admin_logs")),
+    ],
+}
+
+SEARCH_TERMS = ["sea ice", "krill", "albedo", "meltwater", "ozone", "calving"]
+
+# Slugs served by views.theme_detail (its catalog is static, not ScientificTheme)
+PUBLIC_THEME_CODES = ["crustal_evolution", "space_weather", "southern_ocean", "climate_change",
+                      "cryosphere", "sea_ice", "polar_ecology", "polar_operations"]
+
+
+class Command(BaseCommand):
+    help = ("Drive the participant and admin URL routes with concurrent simulated users; "
+            "report throughput and latency percentiles and compare them to a stored baseline. "
+            "Refuses to run with DEBUG off unless --force is given.")
+
+    def add_arguments(self, parser):
+        parser.add_argument('--users', type=int, default=20, help='Concurrent simulated users (at least 1)')
+        parser.add_argument('--duration', type=float, default=30.0, help='Seconds to run after all users have logged in')
+        parser.add_argument(
+            '--mix', default='participant=60,anonymous=20,theme_admin=12,admin=8',
+            help='Share of users per role, e.g. participant=60,admin=40'
+        )
+        parser.add_argument('--seed', action='store_true', help='Generate the benchmark dataset first')
+        parser.add_argument('--participants', type=int, default=10000, help='Participants to seed with --seed')
+        parser.add_argument('--abstracts', type=int, default=20000, help='Abstracts to seed with --seed')
+        parser.add_argument('--logs', type=int, default=100000, help='Admin log rows to seed with --seed')
+        parser.add_argument(
+            '--baseline', default=os.path.join(settings.BASE_DIR, 'perf', 'load_baseline.json'),
+            help='Baseline JSON file to compare against / write'
+        )
+        parser.add_argument('--save-baseline', action='store_true', help='Store this run as the new baseline')
+        parser.add_argument('--tolerance', type=float, default=0.2,
+                            help='Allowed regression vs the baseline (0.2 = 20%% slower p95 or lower throughput)')
+        parser.add_argument('--check', action='store_true', help='Exit with an error on errors or a regression vs the baseline')
+        parser.add_argument('--force', action='store_true', help='Run even though DEBUG is off')
+
+    def handle(self, *args, **options):
+        # Seeds, and gives the seeded accounts it drives a password while it runs
+        if not settings.DEBUG and not options['force']:
+            raise CommandError(f'DEBUG is off, so "{connection.settings_dict["NAME"]}" may be a live database; '
+                               f'pass --force to benchmark it anyway.')
+        if options['seed']:
+            self.stdout.write('Seeding benchmark dataset...')
+            started = time.perf_counter()
+            counts = seed.seed_conference(
+                participants=options['participants'], abstracts=options['abstracts'],
+                logs=options['logs'], stdout=self.stdout,
+            )
+            self.stdout.write(self.style.SUCCESS(
+                f'Seeded {counts} in {time.perf_counter() - started:.1f}s.'
+            ))
+
+        if options['users'] < 1:
+            raise CommandError('--users must be at least 1.')
+        identities = self.identities()
+        roles = self.assign_roles(options['mix'], options['users'], identities)
+
+        # Seeded accounts cannot log in; give the ones driven here a password for this run only
+        usernames = sorted({ctx["username"] for _, ctx in roles if ctx["username"]})
+        password = seed.grant_password(usernames)
+        try:
+            report, errors, first_errors = self.drive(roles, password, options['duration'])
+        finally:
+            seed.revoke_passwords(usernames)
+
+        report["users"] = len(roles)
+        report["mix"] = options['mix']
+        report["created"] = timezone.now().isoformat(timespec="seconds")
+
+        self.print_report(report)
+        for label, error in sorted(first_errors.items()):
+            self.stdout.write(self.style.WARNING(f'  first error in {label}: {error[:200]}'))
+        regressions = self.compare(report, options['baseline'], options['tolerance'])
+
+        if options['save_baseline']:
+            os.makedirs(os.path.dirname(options['baseline']) or '.', exist_ok=True)
+            with open(options['baseline'], 'w', encoding='utf-8') as fh:
+                json.dump(report, fh, indent=2, sort_keys=True)
+            self.stdout.write(self.style.SUCCESS(f'Baseline written to {options["baseline"]}.'))
+
+        if options['check']:
+            failed = regressions + [f'{label}: {n} error(s)' for label, n in errors.items() if n]
+            if failed:
+                raise CommandError('Load test failed: ' + '; '.join(failed))
+
+    # ---------------- run ----------------
+    def drive(self, roles, password, duration):
+        """Log every simulated user in, run the flows for duration seconds and summarise."""
+        results = defaultdict(list)
+        errors = defaultdict(int)
+        lock = threading.Lock()
+        ready = threading.Barrier(len(roles) + 1)
+        stop = threading.Event()
+
+        first_errors = {}
+
+        def record(label, elapsed, error=None):
+            with lock:
+                results[label].append(elapsed * 1000)
+                if error:
+                    errors[label] += 1
+                    first_errors.setdefault(label, error)
+
+        threads = [
+            threading.Thread(target=self.simulate, args=(role, ctx, password, record, ready, stop), daemon=True)
+            for role, ctx in roles
+        ]
+        for thread in threads:
+            thread.start()
+
+        self.stdout.write(f'Logging in {len(roles)} simulated user(s)...')
+        ready.wait()
+        login_samples = {label: list(v) for label, v in results.items()}
+        with lock:
+            results.clear()
+        started = time.perf_counter()
+        self.stdout.write(f'Running for {duration:.0f}s...')
+        time.sleep(duration)
+        stop.set()
+        for thread in threads:
+            thread.join()
+        elapsed = time.perf_counter() - started
+
+        report = self.summarise(results, errors, elapsed)
+        report["steps"].update(
+            {label: self.stats(values, errors[label], None) for label, values in login_samples.items()}
+        )
+        return report, errors, first_errors
+
+    # ---------------- setup ----------------
+    def identities(self):
+        """Seeded accounts to log in as, with ids their flows need."""
+        participants = list(
+            AbstractSubmission.objects
+            .filter(user__username__startswith="seed_", user__participant__isnull=False)
+            .exclude(user__username__startswith="seed_ta_")
+            .values_list("user__username", "id")[:2000]
+        )
+        theme_admins = list(
+            ThemeAdmin.objects
+            .filter(is_active=True, user__username__startswith="seed_ta_", themes__isnull=False)
+            .values_list("user__username", "themes__id")
+        )
+        admin = User.objects.filter(username=seed.ADMIN_USERNAME, is_superuser=True).exists()
+        if not participants or not theme_admins or not admin:
+            raise CommandError('No seeded dataset found; rerun with --seed.')
+
+        abstract_ids = dict(
+            AbstractSubmission.objects.filter(theme_id__in=[t for _, t in theme_admins])
+            .values_list("theme_id", "id").order_by("theme_id", "-submitted_at")
+        )
+        return {
+            "participant": [{"username": u, "abstract_id": a} for u, a in participants],
+            "theme_admin": [{"username": u, "abstract_id": abstract_ids[t]} for u, t in theme_admins if t in abstract_ids],
+            "admin": [{"username": seed.ADMIN_USERNAME,
+                       "abstract_id": participants[len(participants) // 2][1]}],
+            "anonymous": [{"username": None}],
+        }
+
+    def assign_roles(self, mix, users, identities):
+        try:
+            shares = {role: float(share) for role, share in (part.split("=") for part in mix.split(","))}
+        except ValueError:
+            raise CommandError(f'Invalid --mix "{mix}"; expected role=share pairs.')
+        unknown = set(shares) - set(FLOWS)
+        if unknown:
+            raise CommandError(f'Unknown role(s) in --mix: {", ".join(sorted(unknown))}')
+        empty = [role for role, share in shares.items() if share > 0 and not identities[role]]
+        if empty or not sum(shares.values()) > 0:
+            raise CommandError(f'No seeded accounts for role(s): {", ".join(empty) or "any"}.')
+
+        total = sum(shares.values())
+        pools = {role: cycle(identities[role]) for role in shares}
+        assigned = dict.fromkeys(shares, 0)
+        roles = []
+        for n in range(users):
+            # Next user goes to the role furthest below its share
+            role = max(shares, key=lambda r: shares[r] / total * (n + 1) - assigned[r])
+            assigned[role] += 1
+            ctx = dict(next(pools[role]))
+            ctx["theme_code"] = PUBLIC_THEME_CODES[n % len(PUBLIC_THEME_CODES)]
+            ctx["search"] = SEARCH_TERMS[n % len(SEARCH_TERMS)]
+            roles.append((role, ctx))
+        return roles
+
+    # ---------------- simulated user ----------------
+    def simulate(self, role, ctx, password, record, ready, stop):
+        client = Client()
+        try:
+            if ctx["username"]:
+                started = time.perf_counter()
+                response = client.post(reverse("conference:login"),
+                                       {"username": ctx["username"], "password": password})
+                record("login", time.perf_counter() - started,
+                       None if response.status_code == 302 else f"HTTP {response.status_code}")
+        finally:
+            ready.wait()
+
+        try:
+            for label, build in cycle(FLOWS[role]):
+                if stop.is_set():
+                    break
+                started = time.perf_counter()
+                error = None
+                try:
+                    response = client.get(build(ctx))
+                    if response.status_code >= 400:
+                        error = f"HTTP {response.status_code}"
+                    elif getattr(response, "streaming", False):
+                        for _ in response.streaming_content:
+                            pass
+                except Exception as exc:
+                    error = f"{type(exc).__name__}: {exc}"
+                record(label, time.perf_counter() - started, error)
+        finally:
+            connection.close()
+
+    # ---------------- reporting ----------------
+    def stats(self, values, errors, elapsed):
+        return {
+            "n": len(values),
+            "errors": errors,
+            "rps": round(len(values) / elapsed, 2) if elapsed else None,
+            "p50": round(percentile(values, 50), 2),
+            "p95": round(percentile(values, 95), 2),
+            "p99": round(percentile(values, 99), 2),
+        }
+
+    def summarise(self, results, errors, elapsed):
+        steps = {label: self.stats(values, errors[label], elapsed) for label, values in results.items() if values}
+        everything = [v for values in results.values() for v in values]
+        if not everything:
+            raise CommandError('No requests completed; increase --duration.')
+        return {
+            "duration": round(elapsed, 2),
+            "total": self.stats(everything, sum(errors.values()), elapsed),
+            "steps": steps,
+        }
+
+    def print_report(self, report):
+        self.stdout.write(f'\n{"step":<26} {"n":>7} {"err":>5} {"req/s":>8} {"p50 ms":>9} {"p95 ms":>9} {"p99 ms":>9}')
+        self.stdout.write('-' * 78)
+        rows = sorted(report["steps"].items()) + [("TOTAL", report["total"])]
+        for label, s in rows:
+            rps = f'{s["rps"]:.1f}' if s["rps"] is not None else '-'
+            self.stdout.write(
+                f'{label:<26} {s["n"]:>7} {s["errors"]:>5} {rps:>8} {s["p50"]:>9.1f} {s["p95"]:>9.1f} {s["p99"]:>9.1f}'
+            )
+
+    def compare(self, report, path, tolerance):
+        """Print the change against the baseline; return regression messages."""
+        try:
+            with open(path, encoding='utf-8') as fh:
+                baseline = json.load(fh)
+        except FileNotFoundError:
+            self.stdout.write(self.style.WARNING(f'\nNo baseline at {path}; run with --save-baseline to create one.'))
+            return []
+
+        self.stdout.write(f'\nAgainst baseline from {baseline.get("created", "?")} ({baseline.get("users")} users):')
+        regressions = []
+        pairs = [("TOTAL", report["total"], baseline["total"])] + [
+            (label, stats, baseline["steps"][label])
+            for label, stats in sorted(report["steps"].items())
+            if label in baseline["steps"]
+        ]
+        for label, now, before in pairs:
+            p95_change = (now["p95"] - before["p95"]) / before["p95"] if before["p95"] else 0
+            line = f'  {label:<26} p95 {before["p95"]:>8.1f} -> {now["p95"]:>8.1f} ms ({p95_change:+.0%})'
+            slower = p95_change > tolerance
+            if now.get("rps") and before.get("rps"):
+                rps_change = (now["rps"] - before["rps"]) / before["rps"]
+                line += f'   req/s {before["rps"]:.1f} -> {now["rps"]:.1f} ({rps_change:+.0%})'
+                slower = slower or rps_change < -tolerance
+            if slower:
+                regressions.append(f'{label} regressed')
+            self.stdout.write((self.style.ERROR if slower else self.style.SUCCESS)(line))
+        return regressions
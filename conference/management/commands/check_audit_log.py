@@ -0,0 +1,47 @@
+import time
+import uuid
+
+from django.conf import settings
+from django.core.management.base import BaseCommand, CommandError
+
+from conference.models import AdminActionLog
+from conference.services import audit_log
+
+
+class Command(BaseCommand):
+    help = ("Queue audit log entries through the buffer, wait for the background flush and read them back "
+            "from the database. The probe rows are deleted afterwards.")
+
+    def add_arguments(self, parser):
+        parser.add_argument('--count', type=int, default=5, help='Entries to queue (below the batch size tests the timed flush)')
+        parser.add_argument('--timeout', type=float, default=None,
+                            help='Seconds to wait for the rows (default: twice AUDIT_LOG_FLUSH_INTERVAL plus 1)')
+
+    def handle(self, *args, **options):
+        count = options['count']
+        timeout = options['timeout']
+        if timeout is None:
+            timeout = 2 * audit_log.buffer.flush_interval + 1
+
+        marker = f'check_audit_log {uuid.uuid4().hex}'
+        for _ in range(count):
+            audit_log.record("OTHER", description=marker)
+
+        written = 0
+        deadline = time.monotonic() + timeout
+        try:
+            while True:
+                written = AdminActionLog.objects.filter(description=marker).count()
+                if written >= count or time.monotonic() >= deadline:
+                    break
+                time.sleep(0.1)
+        finally:
+            # Whatever is still queued is flushed here so the probe leaves nothing behind
+            audit_log.flush()
+            AdminActionLog.objects.filter(description=marker).delete()
+
+        mode = 'buffered' if getattr(settings, 'AUDIT_LOG_BUFFERED', True) else 'synchronous'
+        if written < count:
+            raise CommandError(f'Only {written}/{count} {mode} audit log entries reached the database '
+                               f'within {timeout:.1f}s.')
+        self.stdout.write(self.style.SUCCESS(f'{written}/{count} {mode} audit log entries read back from the database.'))
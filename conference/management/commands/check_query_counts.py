@@ -0,0 +1,81 @@
+from functools import partial
+
+from django.contrib.auth.models import AnonymousUser, User
+from django.contrib.messages.storage.fallback import FallbackStorage
+from django.core.management.base import BaseCommand, CommandError
+from django.db import connection
+from django.test import RequestFactory
+from django.test.utils import CaptureQueriesContext
+
+from conference import admin_views, views
+from conference.models import ThemeAdmin
+
+# (label, view, user kind, max queries). Counted with warm caches, for the
+# view and template render only (session/auth middleware excluded), so a
+# budget fails only when the view itself starts issuing more queries,
+# e.g. a count per status or a lookup per listed row. The public pages are
+# served to anonymous visitors from the cached theme catalog alone.
+BUDGETS = [
+    ("home", views.home, "anonymous", 0),
+    ("faq", views.faq, "anonymous", 0),
+    ("brochure", views.brochure, "anonymous", 0),
+    ("themes", views.themes, "anonymous", 0),
+    ("theme_detail", partial(views.theme_detail, code="cryosphere"), "anonymous", 0),
+    ("theme_admin_dashboard", admin_views.theme_admin_dashboard, "theme_admin", 8),
+]
+
+
+class Command(BaseCommand):
+    help = "Render the budgeted public and admin views and fail if any issues more queries than allowed."
+
+    def add_arguments(self, parser):
+        parser.add_argument('--theme-admin', help='Username of the theme admin to render as (default: first active one with themes)')
+        parser.add_argument('--show-queries', action='store_true', help='Print the SQL of every captured query')
+
+    def handle(self, *args, **options):
+        users = {"anonymous": None, "theme_admin": self.theme_admin_user_id(options['theme_admin'])}
+        factory = RequestFactory()
+
+        failures = []
+        for label, view, kind, budget in BUDGETS:
+            user_id = users[kind]
+
+            view(self.request(factory, user_id))  # warm caches (theme catalog, unread counts)
+            request = self.request(factory, user_id)
+            with CaptureQueriesContext(connection) as ctx:
+                response = view(request)
+
+            used = len(ctx.captured_queries)
+            if response.status_code != 200:
+                failures.append(f'{label} returned {response.status_code}')
+                continue
+
+            over = used > budget
+            style = self.style.ERROR if over else self.style.SUCCESS
+            self.stdout.write(style(f'{label}: {used} queries (budget {budget})'))
+            if options['show_queries'] or over:
+                for query in ctx.captured_queries:
+                    self.stdout.write(f'    {query["sql"]}')
+            if over:
+                failures.append(f'{label} ({used} > {budget})')
+
+        if failures:
+            raise CommandError('Query budgets exceeded: ' + '; '.join(failures))
+        self.stdout.write(self.style.SUCCESS('All views are within their query budgets.'))
+
+    def request(self, factory, user_id):
+        request = factory.get("/")
+        # Fresh instance, so the view pays for its own related lookups
+        request.user = AnonymousUser() if user_id is None else User.objects.get(pk=user_id)
+        request.session = {}
+        request._messages = FallbackStorage(request)
+        return request
+
+    def theme_admin_user_id(self, username):
+        admins = ThemeAdmin.objects.filter(is_active=True, user__is_staff=True, themes__isnull=False)
+        if username:
+            admins = admins.filter(user__username=username)
+        theme_admin = admins.first()
+        if theme_admin is None:
+            raise CommandError('No active theme admin with assigned themes to render the dashboard as.')
+        return theme_admin.user_id
@@ -0,0 +1,141 @@
+import re
+
+from django.contrib.auth.models import User
+from django.contrib.messages.storage.fallback import FallbackStorage
+from django.core.management.base import BaseCommand, CommandError
+from django.db import connection
+from django.test import RequestFactory
+from django.test.utils import CaptureQueriesContext
+from django.utils import timezone
+
+from conference import admin_views, views
+from conference.models import AdminActionLog, Participant, ScientificTheme, ThemeAdmin
+from conference.services.pagination import encode_cursor
+
+# "SCAN <table>" with no "USING ... INDEX" is a full table scan
+FULL_SCAN_RE = re.compile(r"\bSCAN (?:TABLE )?(\w+)(?! USING)(?:\s|$)")
+# Walking a whole index is only cheap when it yields rows already in order
+# and a LIMIT stops it; followed by a sort it reads and sorts every row
+ANY_SCAN_RE = re.compile(r"\bSCAN (?:TABLE )?(\w+)")
+SORTED_RE = re.compile(r"USE TEMP B-TREE FOR ORDER BY")
+
+# Tables small enough that a scan is expected and harmless: the theme lookup
+# and the daily rollups the dashboard sums (a row per day, theme and status)
+SMALL_TABLES = {"conference_scientifictheme", "conference_abstractdailystat", "conference_registrationdailystat"}
+
+# Statements EXPLAIN QUERY PLAN can describe (not SAVEPOINT / RELEASE)
+EXPLAINABLE_RE = re.compile(r"^\s*(SELECT|WITH|UPDATE|DELETE|INSERT)\b", re.IGNORECASE)
+
+# Literals, so a query repeated per row is explained once
+LITERAL_RE = re.compile(r"'(?:[^']|'')*'|\b\d+(?:\.\d+)?\b")
+
+
+class Command(BaseCommand):
+    help = ("Render the hot list views, run EXPLAIN QUERY PLAN on every statement they issue and fail "
+            "on any full table scan or full sort.")
+
+    def add_arguments(self, parser):
+        parser.add_argument('--verbose-plans', action='store_true', help='Print the plan of every query, not just failures')
+
+    def cases(self):
+        """(label, view, user kind, method, params, session) for the requests to capture."""
+        theme = ScientificTheme.objects.order_by("id").values_list("code", flat=True).first() or "glaciology"
+        # The cursor of a full first page, so the keyset query for page two is what gets explained
+        boundary = AdminActionLog.objects.order_by("-created_at", "-id").values_list("created_at", "id")[19:20]
+        after = encode_cursor(*boundary[0]) if boundary else encode_cursor(timezone.now(), 0)
+        staff_id = str(User.objects.filter(is_staff=True).order_by("id").values_list("id", flat=True).first() or 1)
+
+        return [
+            ("admin_dashboard", admin_views.admin_dashboard, "superuser", "get", {}, {}),
+            ("admin_abstracts: all", admin_views.admin_abstracts, "superuser", "get", {}, {}),
+            ("admin_abstracts: status", admin_views.admin_abstracts, "superuser", "get", {"status": "PENDING"}, {}),
+            ("admin_abstracts: theme + status", admin_views.admin_abstracts, "superuser", "get",
+             {"theme": theme, "status": "PENDING"}, {}),
+            ("admin_abstracts: theme admin", admin_views.admin_abstracts, "theme_admin", "get", {}, {}),
+            ("theme_admin_dashboard", admin_views.theme_admin_dashboard, "theme_admin", "get", {}, {}),
+            ("admin notifications: all", admin_views.theme_admin_notifications, "superuser", "get", {}, {}),
+            ("admin notifications: theme admin", admin_views.theme_admin_notifications, "theme_admin", "get", {}, {}),
+            ("notifications: participant", views.notifications_list, "participant", "get", {}, {}),
+            ("admin_logs: first page", admin_views.admin_logs, "superuser", "get", {}, {}),
+            ("admin_logs: next page", admin_views.admin_logs, "superuser", "get", {"after": after}, {}),
+            ("admin_logs: previous page", admin_views.admin_logs, "superuser", "get", {"before": after}, {}),
+            ("admin_logs: action", admin_views.admin_logs, "superuser", "get", {"action": "UPDATE"}, {}),
+            ("admin_logs: action, next page", admin_views.admin_logs, "superuser", "get",
+             {"action": "UPDATE", "after": after}, {}),
+            ("admin_logs: user", admin_views.admin_logs, "superuser", "get", {"user": staff_id}, {}),
+            ("admin_logs: date range", admin_views.admin_logs, "superuser", "get",
+             {"start_date": "2025-01-01", "end_date": "2025-01-31"}, {}),
+            ("password reset: active OTPs", views.verify_otp, "participant", "post",
+             {"otp": "000000"}, {"reset_user_id": "participant"}),
+        ]
+
+    def handle(self, *args, **options):
+        if connection.vendor != "sqlite":
+            raise CommandError('check_query_plans reads SQLite EXPLAIN QUERY PLAN output; run it against SQLite.')
+
+        users = self.users()
+        factory = RequestFactory()
+
+        failures = []
+        skipped = set()
+        for label, view, kind, method, params, session in self.cases():
+            if users[kind] is None:
+                skipped.add(kind)
+                continue
+            request = getattr(factory, method)("/", params)
+            request.user = users[kind]
+            request.session = {key: users[value].pk for key, value in session.items()}
+            request._messages = FallbackStorage(request)
+
+            # A full query log stops CaptureQueriesContext from capturing anything
+            connection.queries_log.clear()
+            with CaptureQueriesContext(connection) as ctx:
+                response = view(request)
+            if response.status_code >= 400:
+                failures.append(f'{label} returned {response.status_code}')
+                continue
+            if len(ctx.captured_queries) >= connection.queries_limit:
+                failures.append(f'{label} issued over {connection.queries_limit} queries (a query per row?)')
+
+            explained = set()
+            for query in ctx.captured_queries:
+                shape = LITERAL_RE.sub("?", query["sql"])
+                if shape in explained or not EXPLAINABLE_RE.match(query["sql"]):
+                    continue
+                explained.add(shape)
+                plan = "\n".join(self.explain(query["sql"]))
+                scans = ANY_SCAN_RE.findall(plan) if SORTED_RE.search(plan) else FULL_SCAN_RE.findall(plan)
+                scans = [t for t in scans if t not in SMALL_TABLES]
+
+                if scans or options['verbose_plans']:
+                    style = self.style.ERROR if scans else self.style.SUCCESS
+                    self.stdout.write(style(f'{"FULL SCAN" if scans else "ok"}: {label}'))
+                    self.stdout.write(f'    {query["sql"]}')
+                    for line in plan.splitlines():
+                        self.stdout.write(f'    {line}')
+                if scans:
+                    failures.append(f'{label} ({", ".join(scans)})')
+
+        for kind in sorted(skipped):
+            self.stdout.write(self.style.WARNING(f'No {kind.replace("_", " ")} account; its views were not checked.'))
+        if failures:
+            raise CommandError('Hot query problems: ' + '; '.join(failures))
+        self.stdout.write(self.style.SUCCESS('All hot queries use indexes.'))
+
+    def users(self):
+        """The account each kind of request is made as (None if there is none)."""
+        theme_admin = (
+            ThemeAdmin.objects.filter(is_active=True, user__is_staff=True, themes__isnull=False)
+            .values_list("user_id", flat=True).first()
+        )
+        participant = Participant.objects.order_by("id").values_list("user_id", flat=True).first()
+        return {
+            "superuser": User.objects.filter(is_superuser=True, is_active=True).order_by("id").first(),
+            "theme_admin": User.objects.filter(pk=theme_admin).first(),
+            "participant": User.objects.filter(pk=participant).first(),
+        }
+
+    def explain(self, sql):
+        with connection.cursor() as cursor:
+            cursor.execute(f"EXPLAIN QUERY PLAN {sql}")
+            return [row[-1] for row in cursor.fetchall()]
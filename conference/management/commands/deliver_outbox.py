@@ -0,0 +1,118 @@
+import time
+from datetime import timedelta
+
+from django.core.mail import EmailMessage, get_connection
+from django.core.management.base import BaseCommand
+from django.utils import timezone
+
+from conference.models import EmailOutbox
+
+
+class Command(BaseCommand):
+    help = "Deliver queued EmailOutbox messages over a single SMTP connection, retrying failures with backoff."
+
+    def add_arguments(self, parser):
+        parser.add_argument('--batch-size', type=int, default=100, help='Messages sent per connection')
+        parser.add_argument('--max-attempts', type=int, default=5, help='Give up (status FAILED) after this many attempts')
+        parser.add_argument('--backoff', type=int, default=60, help='Base retry delay in seconds (doubled per attempt)')
+        parser.add_argument('--lease', type=int, default=600,
+                            help='Seconds a claimed batch stays reserved before another run may retry it')
+        parser.add_argument('--loop', action='store_true', help='Keep polling the outbox instead of exiting when empty')
+        parser.add_argument('--interval', type=float, default=5.0, help='Seconds to sleep between polls with --loop')
+
+    def handle(self, *args, **options):
+        batch_size = options['batch_size']
+        loop = options['loop']
+
+        total_sent = total_failed = 0
+        while True:
+            # Claims left by a run that died mid-batch lapse back into the queue
+            EmailOutbox.objects.filter(status="SENDING", next_attempt_at__lte=timezone.now()).update(status="PENDING")
+
+            due = list(
+                EmailOutbox.objects
+                .filter(status="PENDING", next_attempt_at__lte=timezone.now())
+                .order_by("next_attempt_at", "id")[:batch_size]
+            )
+            claimed = self.claim(due, options['lease'])
+            if claimed:
+                sent, failed = self.deliver(claimed, options['max_attempts'], options['backoff'])
+                total_sent += sent
+                total_failed += failed
+                # A full batch means more may be waiting; go again right away
+                if len(due) == batch_size:
+                    continue
+
+            if not loop:
+                break
+            time.sleep(options['interval'])
+
+        self.stdout.write(self.style.SUCCESS(f'Outbox delivered: {total_sent} sent, {total_failed} deferred/failed.'))
+
+    def claim(self, entries, lease):
+        """
+        Mark entries SENDING and return the ones this run won; an overlapping
+        run may have claimed (or already sent or deferred) some of them.
+        """
+        now = timezone.now()
+        lapses_at = now + timedelta(seconds=lease)
+        claimed = []
+        for entry in entries:
+            won = EmailOutbox.objects.filter(pk=entry.pk, status="PENDING", next_attempt_at__lte=now).update(
+                status="SENDING", next_attempt_at=lapses_at
+            )
+            if won:
+                entry.status = "SENDING"
+                entry.next_attempt_at = lapses_at
+                claimed.append(entry)
+        return claimed
+
+    def deliver(self, entries, max_attempts, backoff):
+        sent = failed = 0
+        connection = get_connection(fail_silently=False)
+        try:
+            connection.open()
+        except Exception as e:
+            for entry in entries:
+                self.defer(entry, e, max_attempts, backoff)
+            self.stdout.write(self.style.ERROR(f'Could not open mail connection: {e}'))
+            return 0, len(entries)
+
+        try:
+            for entry in entries:
+                message = EmailMessage(
+                    subject=entry.subject,
+                    body=entry.body,
+                    from_email=entry.from_email or None,
+                    to=entry.recipient_list(),
+                    connection=connection,
+                )
+                try:
+                    connection.send_messages([message])
+                except Exception as e:
+                    self.defer(entry, e, max_attempts, backoff)
+                    failed += 1
+                    continue
+
+                entry.status = "SENT"
+                entry.attempts += 1
+                entry.sent_at = timezone.now()
+                entry.last_error = ""
+                entry.save(update_fields=["status", "attempts", "sent_at", "last_error"])
+                sent += 1
+        finally:
+            connection.close()
+
+        return sent, failed
+
+    def defer(self, entry, error, max_attempts, backoff):
+        entry.attempts += 1
+        entry.last_error = str(error)
+        if entry.attempts >= max_attempts:
+            entry.status = "FAILED"
+            self.stdout.write(self.style.ERROR(f'Giving up on outbox id={entry.id}: {error}'))
+        else:
+            entry.status = "PENDING"
+            delay = backoff * (2 ** (entry.attempts - 1))
+            entry.next_attempt_at = timezone.now() + timedelta(seconds=delay)
+        entry.save(update_fields=["status", "attempts", "last_error", "next_attempt_at"])
@@ -0,0 +1,78 @@
+import time
+
+from django.core.management.base import BaseCommand
+from django.db.models import Q
+from django.utils import timezone
+
+from conference.models import AbstractSubmission
+from conference.services import search
+from conference.services.pdf_text import MAX_TEXT_LENGTH, extract_pdf_text
+
+
+class Command(BaseCommand):
+    help = "Extract plain text from uploaded abstract PDFs and add it to the search index."
+
+    def add_arguments(self, parser):
+        parser.add_argument('--batch-size', type=int, default=50, help='Abstracts processed per query')
+        parser.add_argument('--all', action='store_true', help='Re-extract every abstract, not just pending ones')
+        parser.add_argument('--loop', action='store_true', help='Keep polling for new uploads instead of exiting when idle')
+        parser.add_argument('--interval', type=float, default=10.0, help='Seconds to sleep between polls with --loop')
+
+    def handle(self, *args, **options):
+        if options['all']:
+            AbstractSubmission.objects.update(text_extraction_status="PENDING")
+
+        done = failed = 0
+        while True:
+            batch = list(
+                AbstractSubmission.objects
+                .filter(text_extraction_status="PENDING")
+                .select_related("user")
+                .order_by("id")[:options['batch_size']]
+            )
+            for abstract in batch:
+                if self.extract(abstract):
+                    done += 1
+                else:
+                    failed += 1
+
+            if len(batch) == options['batch_size']:
+                continue
+            if not options['loop']:
+                break
+            time.sleep(options['interval'])
+
+        self.stdout.write(self.style.SUCCESS(f'Extracted text for {done} abstract(s); {failed} failed.'))
+
+    def extract(self, abstract):
+        status = "DONE"
+        texts = []
+        for field_file in (abstract.pdf_file, abstract.revised_submission):
+            try:
+                texts.append(extract_pdf_text(field_file))
+            except Exception as e:
+                status = "FAILED"
+                self.stdout.write(self.style.WARNING(f'Abstract id={abstract.pk}: could not read {field_file.name}: {e}'))
+
+        abstract.extracted_text = "\n\n".join(t for t in texts if t)[:MAX_TEXT_LENGTH]
+        abstract.text_extraction_status = status
+        abstract.text_extracted_at = timezone.now()
+
+        # Only store the text if the files were not replaced meanwhile;
+        # a new upload resets the status to PENDING and is picked up again.
+        unchanged = AbstractSubmission.objects.filter(pk=abstract.pk)
+        for field in ("pdf_file", "revised_submission"):
+            name = getattr(abstract, field).name
+            if name:
+                unchanged = unchanged.filter(**{field: name})
+            else:
+                unchanged = unchanged.filter(Q(**{field: ""}) | Q(**{f"{field}__isnull": True}))
+
+        updated = unchanged.update(
+            extracted_text=abstract.extracted_text,
+            text_extraction_status=status,
+            text_extracted_at=abstract.text_extracted_at,
+        )
+        if updated:
+            search.index_abstract(abstract)
+        return status == "DONE"
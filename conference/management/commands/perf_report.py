@@ -0,0 +1,84 @@
+from collections import defaultdict
+from datetime import datetime, timedelta
+
+from django.core.management.base import BaseCommand, CommandError
+from django.utils import timezone
+
+from conference.services import perf
+
+PERCENTILES = (50, 95, 99)
+
+
+class Command(BaseCommand):
+    help = "Print p50/p95/p99 query count, SQL time, render time, latency and size per URL name from the perf samples."
+
+    def add_arguments(self, parser):
+        parser.add_argument('--since', type=float, help='Only samples from the last N hours')
+        parser.add_argument('--url', help='Only URL names containing this text')
+        parser.add_argument('--sort', default='ms', choices=['ms', 'queries', 'sql_ms', 'render_ms', 'count'],
+                            help='Order rows by the p95 of this column (or by sample count)')
+        parser.add_argument('--check', action='store_true', help='Exit with an error if any p95 breaks its budget')
+
+    def handle(self, *args, **options):
+        samples = perf.load_samples()
+        if options['since']:
+            cutoff = timezone.now() - timedelta(hours=options['since'])
+            samples = [s for s in samples if datetime.fromisoformat(s["at"]) >= cutoff]
+        if options['url']:
+            samples = [s for s in samples if options['url'] in s["url"]]
+
+        if not samples:
+            self.stdout.write(self.style.WARNING(
+                f'No samples in {perf.log_dir()}. Set PERF_MONITORING=True and exercise the site first.'
+            ))
+            return
+
+        by_url = defaultdict(list)
+        for sample in samples:
+            by_url[sample["url"]].append(sample)
+
+        rows = []
+        for url, url_samples in by_url.items():
+            row = {"url": url, "count": len(url_samples)}
+            for column in ("queries", "sql_ms", "render_ms", "ms", "bytes"):
+                values = [s[column] for s in url_samples if s.get(column) is not None]
+                row[column] = [perf.percentile(values, p) for p in PERCENTILES] if values else None
+            # Worst sample decides the N+1 column
+            row["duplicates"] = max(s["duplicates"] for s in url_samples)
+            rows.append(row)
+
+        sort = options['sort']
+        rows.sort(key=lambda r: r["count"] if sort == 'count' else (r[sort] or [0, 0, 0])[1], reverse=True)
+
+        header = f'{"URL name":<48} {"n":>6}  {"queries":>14}  {"sql ms":>20}  {"render ms":>20}  {"total ms":>20}  {"kB p50":>8}  {"dup":>4}'
+        self.stdout.write(header)
+        self.stdout.write(f'{"":<48} {"":>6}  {"p50/p95/p99":>14}  {"p50/p95/p99":>20}  {"p50/p95/p99":>20}  {"p50/p95/p99":>20}')
+        self.stdout.write('-' * len(header))
+
+        failures = []
+        for row in rows:
+            size = f'{row["bytes"][0] / 1024:.1f}' if row["bytes"] else '-'
+            self.stdout.write(
+                f'{row["url"][:48]:<48} {row["count"]:>6}  '
+                f'{self.triple(row["queries"], "{:g}"):>14}  '
+                f'{self.triple(row["sql_ms"]):>20}  '
+                f'{self.triple(row["render_ms"]):>20}  '
+                f'{self.triple(row["ms"]):>20}  '
+                f'{size:>8}  {row["duplicates"]:>4}'
+            )
+            p95 = {"url": row["url"], "duplicates": row["duplicates"],
+                   "queries": row["queries"][1], "ms": row["ms"][1]}
+            violations = perf.check_budget(p95)
+            if violations:
+                failures.append(f'{row["url"]}: ' + ', '.join(violations))
+
+        self.stdout.write(f'\n{len(samples)} sample(s) across {len(rows)} view(s).')
+        for failure in failures:
+            self.stdout.write(self.style.WARNING(f'Over budget at p95: {failure}'))
+
+        if options['check'] and failures:
+            raise CommandError(f'{len(failures)} view(s) over budget.')
+
+    @staticmethod
+    def triple(values, fmt="{:.1f}"):
+        return "/".join(fmt.format(v) for v in values) if values else "-"
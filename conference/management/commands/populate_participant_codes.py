@@ -1,25 +1,60 @@
 from django.core.management.base import BaseCommand
+from django.db import IntegrityError, transaction
+from django.db.models import Q
+
 from conference.models import Participant
 
 
 class Command(BaseCommand):
     help = "Populate participant_code for existing Participant records without one."
 
+    def add_arguments(self, parser):
+        parser.add_argument('--batch-size', type=int, default=1000, help='Codes written per bulk UPDATE')
+
     def handle(self, *args, **options):
-        qs = Participant.objects.filter(participant_code__isnull=True) | Participant.objects.filter(participant_code="")
-        qs = qs.distinct()
-        total = qs.count()
+        missing = list(
+            Participant.objects
+            .filter(Q(participant_code__isnull=True) | Q(participant_code=""))
+            .only("id", "scientific_theme")
+            .order_by("id")
+        )
+        total = len(missing)
         if total == 0:
             self.stdout.write(self.style.SUCCESS('No participants need codes.'))
             return
 
+        # One query for the codes in use; new ones are checked against it in memory
+        taken = set(
+            Participant.objects.exclude(participant_code__isnull=True).values_list("participant_code", flat=True)
+        )
+
         updated = 0
-        for p in qs:
-            # Trigger save() to generate code
+        batch_size = max(options['batch_size'], 1)
+        for offset in range(0, total, batch_size):
+            batch = missing[offset:offset + batch_size]
+            for p in batch:
+                code = p._generate_code()
+                while code in taken:
+                    code = p._generate_code()
+                taken.add(code)
+                p.participant_code = code
             try:
-                p.save()
-                updated += 1
-            except Exception as e:
-                self.stdout.write(self.style.ERROR(f'Failed for Participant id={p.id}: {e}'))
+                with transaction.atomic():
+                    Participant.objects.bulk_update(batch, ["participant_code"])
+                updated += len(batch)
+            except IntegrityError:
+                # A registration took one of these codes meanwhile; save() retries per row
+                updated += self.save_each(batch)
 
         self.stdout.write(self.style.SUCCESS(f'Populated participant_code for {updated}/{total} participants.'))
+
+    def save_each(self, batch):
+        saved = 0
+        for p in batch:
+            p.participant_code = None
+            try:
+                p.save(update_fields=["participant_code"])
+                saved += 1
+            except Exception as e:
+                self.stdout.write(self.style.ERROR(f'Failed for Participant id={p.id}: {e}'))
+        return saved
@@ -0,0 +1,15 @@
+from django.core.management.base import BaseCommand
+
+from conference.services.analytics import rebuild_rollups
+
+
+class Command(BaseCommand):
+    help = "Recompute the analytics rollup tables (AbstractDailyStat, RegistrationDailyStat, ThemeParticipant)."
+
+    def handle(self, *args, **options):
+        counts = rebuild_rollups()
+        self.stdout.write(self.style.SUCCESS(
+            'Rebuilt analytics rollups: '
+            f'{counts["abstracts"]} abstract, {counts["registrations"]} registration and '
+            f'{counts["theme_participants"]} theme membership row(s).'
+        ))
@@ -0,0 +1,23 @@
+from django.core.management.base import BaseCommand, CommandError
+from django.db import connection
+from django.db.utils import OperationalError
+
+from conference.services import search
+
+
+class Command(BaseCommand):
+    help = "Create (if missing) and repopulate the SQLite FTS5 abstract search index."
+
+    def handle(self, *args, **options):
+        if connection.vendor != "sqlite":
+            raise CommandError('The full-text index is only used on SQLite; search falls back to icontains filters.')
+
+        with connection.cursor() as cursor:
+            try:
+                search.create_fts_table(cursor)
+            except OperationalError as e:
+                raise CommandError(f'FTS5 is not available in this SQLite build: {e}')
+        search._fts_state.clear()
+
+        indexed = search.rebuild_index()
+        self.stdout.write(self.style.SUCCESS(f'Indexed {indexed} abstract(s).'))
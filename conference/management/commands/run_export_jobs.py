@@ -0,0 +1,145 @@
+import os
+import time
+from datetime import timedelta
+from itertools import chain
+
+from django.conf import settings
+from django.core.management.base import BaseCommand
+from django.urls import reverse
+from django.utils import timezone
+
+from conference.admin_views import _get_theme_filtered_abstracts
+from conference.models import AdminActionLog, ExportJob, Notification
+from conference.services.exports import (
+    ABSTRACT_HEADER,
+    ADMIN_LOG_HEADER,
+    WRITERS,
+    abstract_rows,
+    admin_log_rows,
+    archived_admin_log_rows,
+    filter_abstracts,
+    filter_admin_logs,
+)
+
+
+class Command(BaseCommand):
+    help = "Process pending ExportJob rows and write the files to MEDIA_ROOT/exports/."
+
+    def add_arguments(self, parser):
+        parser.add_argument('--lease', type=int, default=3600,
+                            help='Seconds a claimed job stays RUNNING before another run may retry it; '
+                                 'keep it above the longest export')
+        parser.add_argument('--loop', action='store_true', help='Keep polling for new jobs instead of exiting when idle')
+        parser.add_argument('--interval', type=float, default=5.0, help='Seconds to sleep between polls with --loop')
+
+    def handle(self, *args, **options):
+        processed = 0
+        while True:
+            # Jobs left RUNNING by a worker that died mid-export go back to the queue
+            lapsed = ExportJob.objects.filter(
+                status="RUNNING", started_at__lte=timezone.now() - timedelta(seconds=options['lease'])
+            ).update(status="PENDING", started_at=None, processed_rows=0)
+            if lapsed:
+                self.stdout.write(self.style.WARNING(f'Requeued {lapsed} export job(s) whose worker stopped.'))
+
+            job = ExportJob.objects.filter(status="PENDING").order_by("created_at").first()
+            if job:
+                # Claim the job; another worker may have picked it up already
+                claimed = ExportJob.objects.filter(pk=job.pk, status="PENDING").update(
+                    status="RUNNING", started_at=timezone.now()
+                )
+                if claimed:
+                    job.refresh_from_db()
+                    self.run_job(job)
+                    processed += 1
+                continue
+
+            if not options['loop']:
+                break
+            time.sleep(options['interval'])
+
+        self.stdout.write(self.style.SUCCESS(f'Processed {processed} export job(s).'))
+
+    def source(self, job):
+        """Return (header, queryset, row iterator factory) for the job spec."""
+        if job.kind == "ADMIN_LOGS":
+            logs = filter_admin_logs(AdminActionLog.objects.order_by("-created_at"), job.filters)
+
+            def rows(queryset):
+                return chain(admin_log_rows(queryset), archived_admin_log_rows(job.filters))
+
+            return ADMIN_LOG_HEADER, logs, rows
+
+        abstracts = _get_theme_filtered_abstracts(job.user)
+        if abstracts is None:
+            raise PermissionError("User is not allowed to export abstracts.")
+        return ABSTRACT_HEADER, filter_abstracts(abstracts, job.filters), abstract_rows
+
+    def run_job(self, job):
+        self.stdout.write(f'Running export job id={job.pk} ({job.kind}, {job.format})')
+        path = None
+        try:
+            header, queryset, rows = self.source(job)
+            writer, extension = WRITERS[job.format]
+
+            total = queryset.count()
+            ExportJob.objects.filter(pk=job.pk).update(total_rows=total)
+
+            export_dir = os.path.join(settings.MEDIA_ROOT, "exports")
+            os.makedirs(export_dir, exist_ok=True)
+            filename = f"{job.kind.lower()}_{job.pk}_{timezone.now():%Y%m%d%H%M%S}.{extension}"
+            path = os.path.join(export_dir, filename)
+
+            def progress(count):
+                ExportJob.objects.filter(pk=job.pk).update(processed_rows=count)
+
+            written = writer(path, header, rows(queryset), progress=progress)
+
+            job.file.name = f"exports/{filename}"
+            job.total_rows = max(total, written)
+            job.processed_rows = written
+            job.status = "DONE"
+            job.finished_at = timezone.now()
+            if not self.finish(job, ["file", "total_rows", "processed_rows", "status", "finished_at"]):
+                os.remove(path)
+                return
+        except Exception as e:
+            if path and os.path.exists(path):
+                os.remove(path)
+            job.status = "FAILED"
+            job.error = str(e)
+            job.finished_at = timezone.now()
+            if not self.finish(job, ["status", "error", "finished_at"]):
+                return
+            Notification.objects.create(
+                user=job.user,
+                title="Export failed",
+                message=f"Your {job.get_kind_display()} export could not be generated: {e}",
+            )
+            self.stdout.write(self.style.ERROR(f'Export job id={job.pk} failed: {e}'))
+            return
+
+        download_url = reverse("conference:ncps_admin:export_job_download", args=[job.pk])
+        Notification.objects.create(
+            user=job.user,
+            title="Export ready",
+            message=(
+                f"Your {job.get_kind_display()} export ({job.processed_rows} rows, "
+                f"{job.get_format_display()}) is ready to download: {download_url}"
+            ),
+        )
+        self.stdout.write(self.style.SUCCESS(f'Export job id={job.pk} wrote {job.processed_rows} rows to {job.file.name}'))
+
+    def finish(self, job, fields):
+        """
+        Save the job's final state if this run still holds it. A run that
+        outlived its lease finds the job requeued (or run again) and leaves
+        it to the newer claim.
+        """
+        values = {field: getattr(job, field) for field in fields}
+        held = ExportJob.objects.filter(pk=job.pk, status="RUNNING", started_at=job.started_at).update(**values)
+        if not held:
+            self.stdout.write(self.style.WARNING(
+                f'Export job id={job.pk} was requeued after its lease lapsed; discarding this run\'s result.'
+            ))
+        return held
@@ -0,0 +1,53 @@
+import time
+
+from django.conf import settings
+from django.core.management.base import BaseCommand, CommandError
+from django.db import connection
+
+from conference.services import seed
+
+
+class Command(BaseCommand):
+    help = ("Bulk-insert a synthetic conference: users, participants with unique codes, abstracts with "
+            "small PDFs, reviews, notifications and admin logs into the default database. Seeded accounts "
+            "cannot log in. Refuses to run with DEBUG off unless --force is given.")
+
+    def add_arguments(self, parser):
+        parser.add_argument('--participants', type=int, default=1000, help='Participants (and their users) to create')
+        parser.add_argument('--abstracts', type=int, default=2000, help='Abstracts spread over the participants')
+        parser.add_argument('--logs', type=int, default=10000, help='AdminActionLog rows to create')
+        parser.add_argument('--reviews', type=float, default=0.3, help='Share of abstracts assigned to a reviewer')
+        parser.add_argument('--notifications', type=float, default=1.5, help='Average notifications per abstract')
+        parser.add_argument('--days', type=int, default=120, help='Length of the call for papers the data spans')
+        parser.add_argument('--no-pdfs', action='store_true', help='Do not write a PDF file per abstract')
+        parser.add_argument('--random-seed', type=int, help='Seed for a reproducible dataset')
+        parser.add_argument('--batch-size', type=int, default=seed.BATCH_SIZE, help='Rows per bulk INSERT')
+        parser.add_argument('--force', action='store_true', help='Seed even though DEBUG is off')
+
+    def handle(self, *args, **options):
+        if not settings.DEBUG and not options['force']:
+            raise CommandError(f'DEBUG is off, so "{connection.settings_dict["NAME"]}" may be a live database; '
+                               f'pass --force to seed it anyway.')
+        for name in ('participants', 'abstracts', 'logs', 'days', 'batch_size'):
+            if options[name] < 0 or (name in ('days', 'batch_size') and options[name] == 0):
+                raise CommandError(f'--{name.replace("_", "-")} must be positive.')
+        if options['abstracts'] and not options['participants']:
+            raise CommandError('Abstracts need at least one participant.')
+        if not 0 <= options['reviews'] <= 1:
+            raise CommandError('--reviews is a share between 0 and 1.')
+
+        started = time.perf_counter()
+        counts = seed.seed_conference(
+            participants=options['participants'],
+            abstracts=options['abstracts'],
+            reviews=options['reviews'],
+            notifications=options['notifications'],
+            logs=options['logs'],
+            days=options['days'],
+            pdfs=not options['no_pdfs'],
+            seed=options['random_seed'],
+            batch_size=options['batch_size'],
+            stdout=self.stdout,
+        )
+        summary = ", ".join(f"{count} {name}" for name, count in counts.items())
+        self.stdout.write(self.style.SUCCESS(f'Seeded {summary} in {time.perf_counter() - started:.1f}s.'))
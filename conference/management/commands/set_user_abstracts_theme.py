@@ -1,6 +1,7 @@
 from django.core.management.base import BaseCommand
 from django.contrib.auth import get_user_model
 from conference.models import AbstractSubmission, ScientificTheme, Participant
+from conference.services.analytics import rebuild_rollups
 
 User = get_user_model()
 
@@ -87,4 +88,8 @@ class Command(BaseCommand):
 
             total_changed += changed
 
+        # Queryset updates bypass the signals that maintain the rollups
+        if total_changed:
+            rebuild_rollups()
+
         self.stdout.write(self.style.SUCCESS(f'Done. Total abstracts updated: {total_changed}. Total skipped users: {total_skipped}'))
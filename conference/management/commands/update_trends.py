@@ -0,0 +1,30 @@
+import time
+
+from django.core.management.base import BaseCommand
+
+from conference.services.trends import rebuild_trends, refresh_trends
+
+
+class Command(BaseCommand):
+    help = "Fold new registrations, submissions, approvals and revisions into the trend time-series."
+
+    def add_arguments(self, parser):
+        parser.add_argument('--rebuild', action='store_true', help='Discard the series and aggregate all events again first')
+        parser.add_argument('--loop', action='store_true', help='Keep updating instead of running once')
+        parser.add_argument('--interval', type=float, default=60.0, help='Seconds between passes with --loop')
+
+    def handle(self, *args, **options):
+        if options['rebuild']:
+            added = rebuild_trends()
+            self.stdout.write(self.style.SUCCESS(f'Trends rebuilt from {sum(added.values())} event(s).'))
+            if not options['loop']:
+                return
+
+        while True:
+            added = refresh_trends()
+            summary = ", ".join(f"{metric.lower()} +{count}" for metric, count in added.items())
+            self.stdout.write(self.style.SUCCESS(f'Trends updated: {summary}'))
+
+            if not options['loop']:
+                break
+            time.sleep(options['interval'])
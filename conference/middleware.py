@@ -0,0 +1,65 @@
+from django.conf import settings
+from django.core.exceptions import MiddlewareNotUsed
+from django.utils import timezone
+
+from .services import perf
+
+DEFAULT_MONITORED_MODULES = ("conference.views", "conference.admin_views", "chatbot.views")
+
+
+class PerfBudgetMiddleware:
+    """Record query count, SQL time, render time and response size per view.
+
+    Opt-in: removed from the stack unless PERF_MONITORING is True. Only
+    views defined in PERF_MONITORED_MODULES are measured. Keep it last in
+    MIDDLEWARE so the numbers cover the view alone; queries run while a
+    streaming response is iterated are not included.
+    """
+
+    def __init__(self, get_response):
+        if not getattr(settings, "PERF_MONITORING", False):
+            raise MiddlewareNotUsed
+        self.get_response = get_response
+        self.modules = tuple(getattr(settings, "PERF_MONITORED_MODULES", DEFAULT_MONITORED_MODULES))
+        perf.install_render_timer()
+
+    def __call__(self, request):
+        response = self.get_response(request)
+
+        profile = getattr(request, "_perf_profile", None)
+        if profile is None:
+            return response
+        profile.__exit__(None, None, None)
+        del request._perf_profile
+
+        streaming = getattr(response, "streaming", False)
+        sample = {
+            "url": request.resolver_match.view_name,
+            "method": request.method,
+            "status": response.status_code,
+            "at": timezone.now().isoformat(timespec="seconds"),
+            "queries": profile.queries,
+            "duplicates": profile.duplicate_queries,
+            "sql_ms": round(profile.sql_ms, 2),
+            "render_ms": round(profile.render_ms, 2),
+            "ms": round(profile.total_ms, 2),
+            "bytes": None if streaming else len(response.content),
+        }
+        perf.record_sample(sample)
+        perf.enforce_budget(sample)
+        return response
+
+    def process_view(self, request, view_func, view_args, view_kwargs):
+        module = getattr(view_func, "__module__", "") or ""
+        if not module.startswith(self.modules):
+            return None
+        request._perf_profile = perf.ViewProfile().__enter__()
+        return None
+
+    def process_exception(self, request, exception):
+        profile = getattr(request, "_perf_profile", None)
+        if profile is not None:
+            # The view failed; drop the sample rather than log a partial one
+            profile.__exit__(None, None, None)
+            del request._perf_profile
+        return None
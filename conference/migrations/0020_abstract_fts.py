@@ -0,0 +1,46 @@
+# Generated by Django 6.0 on 2026-10-17 13:05
+
+from django.db import migrations
+from django.db.utils import OperationalError
+
+
+def create_fts_index(apps, schema_editor):
+    # FTS5 search index for admin abstract search (SQLite only; other
+    # backends fall back to icontains filtering).
+    if schema_editor.connection.vendor != "sqlite":
+        return
+    with schema_editor.connection.cursor() as cursor:
+        try:
+            cursor.execute(
+                "CREATE VIRTUAL TABLE IF NOT EXISTS conference_abstract_fts USING fts5("
+                "title, username, email, "
+                "tokenize = 'unicode61 remove_diacritics 2', prefix = '2 3')"
+            )
+        except OperationalError:
+            # SQLite built without FTS5
+            return
+        cursor.execute(
+            "INSERT INTO conference_abstract_fts (rowid, title, username, email) "
+            "SELECT a.id, a.title, u.username, COALESCE(u.email, '') "
+            "FROM conference_abstractsubmission a "
+            "JOIN auth_user u ON u.id = a.user_id"
+        )
+
+
+def drop_fts_index(apps, schema_editor):
+    if schema_editor.connection.vendor != "sqlite":
+        return
+    with schema_editor.connection.cursor() as cursor:
+        cursor.execute("DROP TABLE IF EXISTS conference_abstract_fts")
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('conference', '0019_exportjob'),
+        ('auth', '0012_alter_user_first_name_max_length'),
+    ]
+
+    operations = [
+        migrations.RunPython(create_fts_index, drop_fts_index),
+    ]
@@ -0,0 +1,67 @@
+# Generated by Django 6.0 on 2026-10-17 13:40
+
+from django.db import migrations, models
+from django.db.utils import OperationalError
+
+
+def _recreate_fts_index(schema_editor, with_body):
+    if schema_editor.connection.vendor != "sqlite":
+        return
+    columns = "title, username, email, body" if with_body else "title, username, email"
+    body_select = ", COALESCE(a.extracted_text, '')" if with_body else ""
+    with schema_editor.connection.cursor() as cursor:
+        cursor.execute("DROP TABLE IF EXISTS conference_abstract_fts")
+        try:
+            cursor.execute(
+                f"CREATE VIRTUAL TABLE conference_abstract_fts USING fts5({columns}, "
+                "tokenize = 'unicode61 remove_diacritics 2', prefix = '2 3')"
+            )
+        except OperationalError:
+            # SQLite built without FTS5
+            return
+        if with_body:
+            # Title matches outrank author and body matches
+            cursor.execute(
+                "INSERT INTO conference_abstract_fts (conference_abstract_fts, rank) "
+                "VALUES ('rank', 'bm25(10.0, 5.0, 5.0, 1.0)')"
+            )
+        cursor.execute(
+            f"INSERT INTO conference_abstract_fts (rowid, {columns}) "
+            f"SELECT a.id, a.title, u.username, COALESCE(u.email, ''){body_select} "
+            "FROM conference_abstractsubmission a "
+            "JOIN auth_user u ON u.id = a.user_id"
+        )
+
+
+def add_body_to_fts_index(apps, schema_editor):
+    _recreate_fts_index(schema_editor, with_body=True)
+
+
+def remove_body_from_fts_index(apps, schema_editor):
+    _recreate_fts_index(schema_editor, with_body=False)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('conference', '0020_abstract_fts'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='abstractsubmission',
+            name='extracted_text',
+            field=models.TextField(blank=True, default=''),
+        ),
+        migrations.AddField(
+            model_name='abstractsubmission',
+            name='text_extracted_at',
+            field=models.DateTimeField(blank=True, null=True),
+        ),
+        migrations.AddField(
+            model_name='abstractsubmission',
+            name='text_extraction_status',
+            field=models.CharField(choices=[('PENDING', 'Pending'), ('DONE', 'Done'), ('FAILED', 'Failed')], db_index=True, default='PENDING', max_length=10),
+        ),
+        migrations.RunPython(add_body_to_fts_index, remove_body_from_fts_index),
+    ]
@@ -0,0 +1,59 @@
+# Generated by Django 6.0 on 2026-10-17 14:10
+
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('conference', '0021_abstract_extracted_text'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='abstractsubmission',
+            index=models.Index(fields=['theme', 'status', '-submitted_at'], name='abstract_theme_status_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='abstractsubmission',
+            index=models.Index(fields=['status', '-submitted_at'], name='abstract_status_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='abstractsubmission',
+            index=models.Index(fields=['-submitted_at'], name='abstract_submitted_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='adminactionlog',
+            index=models.Index(fields=['action', '-created_at'], name='adminlog_action_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='adminactionlog',
+            index=models.Index(fields=['user', '-created_at'], name='adminlog_user_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='adminactionlog',
+            index=models.Index(fields=['-created_at'], name='adminlog_created_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='notification',
+            index=models.Index(fields=['user', 'is_read', '-created_at'], name='notif_user_read_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='notification',
+            index=models.Index(fields=['user', '-created_at'], name='notif_user_created_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='notification',
+            index=models.Index(fields=['-created_at'], name='notif_created_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='notification',
+            index=models.Index(condition=models.Q(('is_read', False)), fields=['-created_at'], name='notif_unread_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='passwordresetotp',
+            index=models.Index(fields=['user', 'is_used'], name='otp_user_used_idx'),
+        ),
+    ]
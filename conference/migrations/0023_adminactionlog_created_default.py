@@ -0,0 +1,19 @@
+# Generated by Django 6.0 on 2026-10-17 15:20
+
+import django.utils.timezone
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('conference', '0022_hot_path_indexes'),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name='adminactionlog',
+            name='created_at',
+            field=models.DateTimeField(default=django.utils.timezone.now, editable=False),
+        ),
+    ]
@@ -0,0 +1,93 @@
+# Generated by Django 6.0 on 2026-10-17 16:30
+
+import django.db.models.deletion
+from django.db import migrations, models
+from django.db.models import Count, F
+from django.db.models.functions import TruncDate
+
+
+def populate_rollups(apps, schema_editor):
+    AbstractSubmission = apps.get_model("conference", "AbstractSubmission")
+    Participant = apps.get_model("conference", "Participant")
+    AbstractDailyStat = apps.get_model("conference", "AbstractDailyStat")
+    RegistrationDailyStat = apps.get_model("conference", "RegistrationDailyStat")
+    ThemeParticipantDailyStat = apps.get_model("conference", "ThemeParticipantDailyStat")
+
+    AbstractDailyStat.objects.bulk_create(
+        AbstractDailyStat(day=s["day"], theme_id=s["theme_id"], status=s["status"], count=s["total"])
+        for s in AbstractSubmission.objects
+        .annotate(day=TruncDate("submitted_at"))
+        .values("day", "theme_id", "status")
+        .annotate(total=Count("id"))
+        .order_by()
+    )
+    RegistrationDailyStat.objects.bulk_create(
+        RegistrationDailyStat(day=s["day"], scientific_theme=s["scientific_theme"], count=s["total"])
+        for s in Participant.objects
+        .annotate(day=TruncDate("created_at"))
+        .values("day", "scientific_theme")
+        .annotate(total=Count("id"))
+        .order_by()
+    )
+    ThemeParticipantDailyStat.objects.bulk_create(
+        ThemeParticipantDailyStat(
+            day=s["day"], theme_id=s["theme_id"], scientific_theme=s["scientific_theme"], count=s["total"]
+        )
+        for s in Participant.objects
+        .filter(user__abstracts__isnull=False)
+        .annotate(day=TruncDate("created_at"), theme_id=F("user__abstracts__theme_id"))
+        .values("day", "theme_id", "scientific_theme")
+        .annotate(total=Count("id", distinct=True))
+        .order_by()
+    )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('conference', '0023_adminactionlog_created_default'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='RegistrationDailyStat',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('day', models.DateField()),
+                ('scientific_theme', models.CharField(max_length=50)),
+                ('count', models.IntegerField(default=0)),
+            ],
+            options={
+                'constraints': [models.UniqueConstraint(fields=('day', 'scientific_theme'), name='registration_stat_unique')],
+            },
+        ),
+        migrations.CreateModel(
+            name='AbstractDailyStat',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('day', models.DateField()),
+                ('status', models.CharField(max_length=20)),
+                ('count', models.IntegerField(default=0)),
+                ('theme', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='daily_stats', to='conference.scientifictheme')),
+            ],
+            options={
+                'indexes': [models.Index(fields=['theme', 'day'], name='abstract_stat_theme_idx')],
+                'constraints': [models.UniqueConstraint(fields=('day', 'theme', 'status'), name='abstract_stat_unique')],
+            },
+        ),
+        migrations.CreateModel(
+            name='ThemeParticipantDailyStat',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('day', models.DateField()),
+                ('scientific_theme', models.CharField(max_length=50)),
+                ('count', models.IntegerField(default=0)),
+                ('theme', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='participant_stats', to='conference.scientifictheme')),
+            ],
+            options={
+                'indexes': [models.Index(fields=['theme', 'day'], name='theme_part_stat_theme_idx')],
+                'constraints': [models.UniqueConstraint(fields=('day', 'theme', 'scientific_theme'), name='theme_participant_stat_unique')],
+            },
+        ),
+        migrations.RunPython(populate_rollups, migrations.RunPython.noop),
+    ]
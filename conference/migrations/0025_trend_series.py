@@ -0,0 +1,54 @@
+# Generated by Django 6.0 on 2026-10-17 17:15
+
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('conference', '0024_analytics_rollups'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='TrendBucket',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('granularity', models.CharField(choices=[('HOUR', 'Hourly'), ('DAY', 'Daily')], max_length=4)),
+                ('metric', models.CharField(choices=[('REGISTRATIONS', 'Registrations'), ('SUBMISSIONS', 'Submissions'), ('APPROVALS', 'Approvals'), ('REVISIONS', 'Revised submissions')], max_length=20)),
+                ('theme_code', models.CharField(max_length=50)),
+                ('bucket_start', models.DateTimeField()),
+                ('count', models.IntegerField(default=0)),
+            ],
+        ),
+        migrations.CreateModel(
+            name='TrendHighWaterMark',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('metric', models.CharField(choices=[('REGISTRATIONS', 'Registrations'), ('SUBMISSIONS', 'Submissions'), ('APPROVALS', 'Approvals'), ('REVISIONS', 'Revised submissions')], max_length=20, unique=True)),
+                ('processed_until', models.DateTimeField(blank=True, null=True)),
+            ],
+        ),
+        migrations.AddIndex(
+            model_name='abstractsubmission',
+            index=models.Index(fields=['approved_at'], name='abstract_approved_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='abstractsubmission',
+            index=models.Index(fields=['revised_uploaded_at'], name='abstract_revised_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='participant',
+            index=models.Index(fields=['created_at'], name='participant_created_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='trendbucket',
+            index=models.Index(fields=['granularity', 'bucket_start'], name='trend_bucket_range_idx'),
+        ),
+        migrations.AddConstraint(
+            model_name='trendbucket',
+            constraint=models.UniqueConstraint(fields=('granularity', 'metric', 'theme_code', 'bucket_start'), name='trend_bucket_unique'),
+        ),
+    ]
@@ -0,0 +1,55 @@
+# Generated by Django 6.0 on 2026-10-17 19:06
+
+import django.db.models.deletion
+from django.db import migrations, models
+from django.db.models import F
+from django.db.models.functions import TruncDate
+
+
+def populate_memberships(apps, schema_editor):
+    Participant = apps.get_model("conference", "Participant")
+    ThemeParticipant = apps.get_model("conference", "ThemeParticipant")
+
+    ThemeParticipant.objects.bulk_create(
+        (
+            ThemeParticipant(
+                theme_id=m["theme_id"], participant_id=m["id"], day=m["day"], scientific_theme=m["scientific_theme"]
+            )
+            for m in Participant.objects
+            .filter(user__abstracts__isnull=False)
+            .annotate(day=TruncDate("created_at"), theme_id=F("user__abstracts__theme_id"))
+            .values("id", "day", "theme_id", "scientific_theme")
+            .distinct()
+            .order_by()
+            .iterator()
+        ),
+        batch_size=1000,
+    )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('conference', '0026_emailoutbox_sending'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='ThemeParticipant',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('day', models.DateField()),
+                ('scientific_theme', models.CharField(max_length=50)),
+                ('participant', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='theme_memberships', to='conference.participant')),
+                ('theme', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='participant_memberships', to='conference.scientifictheme')),
+            ],
+            options={
+                'indexes': [models.Index(fields=['scientific_theme', 'participant', 'day'], name='theme_participant_cover_idx')],
+                'constraints': [models.UniqueConstraint(fields=('theme', 'participant'), name='theme_participant_unique')],
+            },
+        ),
+        migrations.RunPython(populate_memberships, migrations.RunPython.noop),
+        migrations.DeleteModel(
+            name='ThemeParticipantDailyStat',
+        ),
+    ]
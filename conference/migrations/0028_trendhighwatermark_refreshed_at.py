@@ -0,0 +1,18 @@
+# Generated by Django 6.0 on 2026-10-17 19:08
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('conference', '0027_theme_participant_membership'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='trendhighwatermark',
+            name='refreshed_at',
+            field=models.DateTimeField(blank=True, null=True),
+        ),
+    ]
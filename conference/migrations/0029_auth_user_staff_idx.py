@@ -0,0 +1,30 @@
+# Generated by Django 6.0 on 2026-10-17 19:52
+
+from django.db import migrations
+
+
+def create_staff_index(apps, schema_editor):
+    # The admin log filter lists staff users on every page; without this the
+    # query scans every participant's account. auth_user belongs to
+    # django.contrib.auth, so the index is created here rather than in Meta.
+    if not schema_editor.connection.features.supports_partial_indexes:
+        return
+    schema_editor.execute("CREATE INDEX IF NOT EXISTS auth_user_staff_idx ON auth_user (id) WHERE is_staff")
+
+
+def drop_staff_index(apps, schema_editor):
+    if not schema_editor.connection.features.supports_partial_indexes:
+        return
+    schema_editor.execute("DROP INDEX IF EXISTS auth_user_staff_idx")
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('conference', '0028_trendhighwatermark_refreshed_at'),
+        ('auth', '0012_alter_user_first_name_max_length'),
+    ]
+
+    operations = [
+        migrations.RunPython(create_staff_index, drop_staff_index),
+    ]
@@ -1,6 +1,6 @@
 from django.db import models
 from django.contrib.auth.models import User
-from django.db import models
+from django.db import IntegrityError, models, transaction
 from django.utils import timezone
 from django.utils.crypto import get_random_string
 import string
@@ -12,6 +12,11 @@ import time
 # ==================================================
 # PARTICIPANT
 # ==================================================
+PARTICIPANT_CODE_CHARS = string.ascii_uppercase + string.digits
+PARTICIPANT_CODE_LENGTH = 6
+PARTICIPANT_CODE_ATTEMPTS = 5
+
+
 class Participant(models.Model):
 
     SCIENTIFIC_THEMES = [
@@ -59,6 +64,11 @@ class Participant(models.Model):
     # Unique participant code shown across the site (e.g. CC-A1B2C3)
     participant_code = models.CharField(max_length=16, unique=True, blank=True, null=True)
 
+    class Meta:
+        indexes = [
+            models.Index(fields=["created_at"], name="participant_created_idx"),
+        ]
+
     def __str__(self):
         return f"{self.user.username} ({self.organization})"
 
@@ -76,26 +86,39 @@ class Participant(models.Model):
         }
         return mapping.get(self.scientific_theme, "OT")
 
-    def _generate_code(self, length=6):
-        """Generate a unique alphanumeric code with theme prefix."""
-        prefix = self._theme_prefix()
-        # Use uppercase letters and digits
-        chars = string.ascii_uppercase + string.digits
-
-        for _ in range(10):
-            rand = get_random_string(length, allowed_chars=chars)
-            code = f"{prefix}-{rand}"
-            if not self.__class__.objects.filter(participant_code=code).exists():
-                return code
-        # Fallback: timestamp-based code
-        ts = int(time.time())
-        return f"{prefix}-{ts}"
+    def _generate_code(self, length=PARTICIPANT_CODE_LENGTH):
+        """Generate a random alphanumeric code with theme prefix.
+
+        No uniqueness query: 36**6 suffixes per prefix make a clash
+        vanishingly rare, and save() retries on the unique constraint
+        instead of checking before every attempt.
+        """
+        rand = get_random_string(length, allowed_chars=PARTICIPANT_CODE_CHARS)
+        return f"{self._theme_prefix()}-{rand}"
+
+    def _code_taken(self):
+        return self.__class__.objects.filter(
+            participant_code=self.participant_code
+        ).exclude(pk=self.pk).exists()
 
     def save(self, *args, **kwargs):
         # Ensure a participant_code exists
-        if not self.participant_code:
+        if self.participant_code:
+            return super().save(*args, **kwargs)
+
+        for _ in range(PARTICIPANT_CODE_ATTEMPTS):
             self.participant_code = self._generate_code()
-        super().save(*args, **kwargs)
+            try:
+                # Savepoint, so a clash leaves any outer transaction usable
+                with transaction.atomic():
+                    return super().save(*args, **kwargs)
+            except IntegrityError:
+                # Only the (rare) failure path pays for a lookup
+                if not self._code_taken():
+                    self.participant_code = None
+                    raise
+        self.participant_code = None
+        raise IntegrityError("Could not allocate a unique participant code.")
 
 
 # ==================================================
@@ -207,8 +230,42 @@ class AbstractSubmission(models.Model):
         blank=True
     )
 
+    # Plain text pulled from pdf_file / revised_submission by the
+    # extract_abstract_text command; indexed for admin search.
+    TEXT_EXTRACTION_CHOICES = [
+        ("PENDING", "Pending"),
+        ("DONE", "Done"),
+        ("FAILED", "Failed"),
+    ]
+
+    extracted_text = models.TextField(
+        blank=True,
+        default=""
+    )
+
+    text_extraction_status = models.CharField(
+        max_length=10,
+        choices=TEXT_EXTRACTION_CHOICES,
+        default="PENDING",
+        db_index=True
+    )
+
+    text_extracted_at = models.DateTimeField(
+        null=True,
+        blank=True
+    )
+
     class Meta:
         ordering = ["-submitted_at"]
+        indexes = [
+            # Admin / theme-admin lists: filter by theme and status, newest first
+            models.Index(fields=["theme", "status", "-submitted_at"], name="abstract_theme_status_idx"),
+            models.Index(fields=["status", "-submitted_at"], name="abstract_status_idx"),
+            models.Index(fields=["-submitted_at"], name="abstract_submitted_idx"),
+            # Trend aggregation reads events past a high-water mark
+            models.Index(fields=["approved_at"], name="abstract_approved_idx"),
+            models.Index(fields=["revised_uploaded_at"], name="abstract_revised_idx"),
+        ]
 
     def __str__(self):
         return f"{self.title} — {self.user.username}"
@@ -284,6 +341,18 @@ class Notification(models.Model):
 
     class Meta:
         ordering = ["-created_at"]
+        indexes = [
+            # Unread counts and per-user lists
+            models.Index(fields=["user", "is_read", "-created_at"], name="notif_user_read_idx"),
+            models.Index(fields=["user", "-created_at"], name="notif_user_created_idx"),
+            models.Index(fields=["-created_at"], name="notif_created_idx"),
+            # Global unread count: only the (few) unread rows are indexed
+            models.Index(
+                fields=["-created_at"],
+                condition=models.Q(is_read=False),
+                name="notif_unread_idx",
+            ),
+        ]
 
     def __str__(self):
         return f"{self.user.username} - {self.title}"
@@ -382,11 +451,17 @@ class AdminActionLog(models.Model):
         blank=True
     )
 
-
-    created_at = models.DateTimeField(auto_now_add=True)
+    # default (not auto_now_add) so buffered entries keep the time of the
+    # action rather than the time their batch is written
+    created_at = models.DateTimeField(default=timezone.now, editable=False)
 
     class Meta:
         ordering = ["-created_at"]
+        indexes = [
+            models.Index(fields=["action", "-created_at"], name="adminlog_action_idx"),
+            models.Index(fields=["user", "-created_at"], name="adminlog_user_idx"),
+            models.Index(fields=["-created_at"], name="adminlog_created_idx"),
+        ]
 
     def __str__(self):
         return f"{self.user.username if self.user else 'System'} - {self.action}"
@@ -398,6 +473,11 @@ class PasswordResetOTP(models.Model):
     created_at = models.DateTimeField(auto_now_add=True)
     is_used = models.BooleanField(default=False)
 
+    class Meta:
+        indexes = [
+            models.Index(fields=["user", "is_used"], name="otp_user_used_idx"),
+        ]
+
     def is_expired(self):
         return timezone.now() > self.created_at + timezone.timedelta(minutes=10)
 
@@ -407,3 +487,248 @@ class PasswordResetOTP(models.Model):
 
     def __str__(self):
         return f"{self.user.email} - {self.otp}"
+
+
+# ==================================================
+# EMAIL OUTBOX
+# ==================================================
+class EmailOutbox(models.Model):
+    """Outgoing email queued in the request transaction and delivered by
+    the `deliver_outbox` management command."""
+
+    STATUS_CHOICES = [
+        ("PENDING", "Pending"),
+        ("SENDING", "Sending"),
+        ("SENT", "Sent"),
+        ("FAILED", "Failed"),
+    ]
+
+    subject = models.CharField(max_length=255)
+    body = models.TextField()
+    from_email = models.CharField(max_length=255, blank=True)
+    # Comma-separated recipient addresses
+    recipients = models.TextField()
+
+    status = models.CharField(
+        max_length=20,
+        choices=STATUS_CHOICES,
+        default="PENDING"
+    )
+    attempts = models.PositiveIntegerField(default=0)
+    # When PENDING, the earliest retry; when SENDING, when the claim lapses
+    next_attempt_at = models.DateTimeField(default=timezone.now)
+    last_error = models.TextField(blank=True)
+
+    created_at = models.DateTimeField(auto_now_add=True)
+    sent_at = models.DateTimeField(null=True, blank=True)
+
+    class Meta:
+        ordering = ["created_at"]
+        indexes = [
+            models.Index(fields=["status", "next_attempt_at"]),
+        ]
+
+    def __str__(self):
+        return f"{self.recipients} - {self.subject} ({self.status})"
+
+    def recipient_list(self):
+        return [r for r in self.recipients.split(",") if r]
+
+
+# ==================================================
+# EXPORT JOB
+# ==================================================
+class ExportJob(models.Model):
+    """A large export written to MEDIA_ROOT/exports/ by the
+    `run_export_jobs` management command."""
+
+    KIND_CHOICES = [
+        ("ADMIN_LOGS", "Admin Logs"),
+        ("ABSTRACTS", "Abstracts"),
+    ]
+
+    FORMAT_CHOICES = [
+        ("CSV", "CSV"),
+        ("XLSX", "Excel (XLSX)"),
+        ("COLUMNAR", "Columnar JSON (gzip)"),
+    ]
+
+    STATUS_CHOICES = [
+        ("PENDING", "Pending"),
+        ("RUNNING", "Running"),
+        ("DONE", "Done"),
+        ("FAILED", "Failed"),
+    ]
+
+    user = models.ForeignKey(
+        User,
+        on_delete=models.CASCADE,
+        related_name="export_jobs"
+    )
+
+    kind = models.CharField(max_length=20, choices=KIND_CHOICES)
+    format = models.CharField(max_length=20, choices=FORMAT_CHOICES, default="CSV")
+
+    # Query parameters captured from the list page (e.g. action, user,
+    # start_date, end_date for admin logs; status, search, theme for abstracts)
+    filters = models.JSONField(default=dict, blank=True)
+
+    status = models.CharField(
+        max_length=20,
+        choices=STATUS_CHOICES,
+        default="PENDING"
+    )
+    total_rows = models.PositiveIntegerField(default=0)
+    processed_rows = models.PositiveIntegerField(default=0)
+
+    file = models.FileField(upload_to="exports/", blank=True, null=True)
+    error = models.TextField(blank=True)
+
+    created_at = models.DateTimeField(auto_now_add=True)
+    started_at = models.DateTimeField(null=True, blank=True)
+    finished_at = models.DateTimeField(null=True, blank=True)
+
+    class Meta:
+        ordering = ["-created_at"]
+
+    def __str__(self):
+        return f"{self.get_kind_display()} export #{self.pk} ({self.status})"
+
+    @property
+    def progress(self):
+        if self.status == "DONE":
+            return 100
+        if not self.total_rows:
+            return 0
+        return min(100, int(self.processed_rows * 100 / self.total_rows))
+
+
+# ==================================================
+# ANALYTICS ROLLUPS
+# ==================================================
+# Daily counters and theme memberships kept up to date by the signals in
+# conference.signals (see services/analytics.py) and rebuilt by
+# `manage.py rebuild_analytics`.
+class AbstractDailyStat(models.Model):
+    """Abstracts submitted on `day` in `theme` that currently have `status`."""
+
+    day = models.DateField()
+    theme = models.ForeignKey(
+        ScientificTheme,
+        on_delete=models.CASCADE,
+        related_name="daily_stats"
+    )
+    status = models.CharField(max_length=20)
+    count = models.IntegerField(default=0)
+
+    class Meta:
+        constraints = [
+            models.UniqueConstraint(fields=["day", "theme", "status"], name="abstract_stat_unique"),
+        ]
+        indexes = [
+            models.Index(fields=["theme", "day"], name="abstract_stat_theme_idx"),
+        ]
+
+    def __str__(self):
+        return f"{self.day} {self.theme_id} {self.status}: {self.count}"
+
+
+class RegistrationDailyStat(models.Model):
+    """Participants who registered on `day` with `scientific_theme`."""
+
+    day = models.DateField()
+    scientific_theme = models.CharField(max_length=50)
+    count = models.IntegerField(default=0)
+
+    class Meta:
+        constraints = [
+            models.UniqueConstraint(fields=["day", "scientific_theme"], name="registration_stat_unique"),
+        ]
+
+    def __str__(self):
+        return f"{self.day} {self.scientific_theme}: {self.count}"
+
+
+class ThemeParticipant(models.Model):
+    """A participant with at least one abstract in `theme` (the theme
+    admin's registrations). `day` and `scientific_theme` are copied from the
+    Participant so the analytics page can count distinct participants over
+    any set of themes without joining abstracts."""
+
+    theme = models.ForeignKey(
+        ScientificTheme,
+        on_delete=models.CASCADE,
+        related_name="participant_memberships"
+    )
+    participant = models.ForeignKey(
+        Participant,
+        on_delete=models.CASCADE,
+        related_name="theme_memberships"
+    )
+    day = models.DateField()
+    scientific_theme = models.CharField(max_length=50)
+
+    class Meta:
+        constraints = [
+            models.UniqueConstraint(fields=["theme", "participant"], name="theme_participant_unique"),
+        ]
+        indexes = [
+            # Covers the all-themes COUNT(DISTINCT participant) per scientific theme
+            models.Index(fields=["scientific_theme", "participant", "day"], name="theme_participant_cover_idx"),
+        ]
+
+    def __str__(self):
+        return f"{self.theme_id} {self.participant_id} ({self.scientific_theme})"
+
+
+# ==================================================
+# TREND TIME-SERIES
+# ==================================================
+class TrendBucket(models.Model):
+    """Event count for one metric, theme and hour/day, filled incrementally
+    by services/trends.py from each metric's high-water mark."""
+
+    GRANULARITY_CHOICES = [
+        ("HOUR", "Hourly"),
+        ("DAY", "Daily"),
+    ]
+
+    METRIC_CHOICES = [
+        ("REGISTRATIONS", "Registrations"),
+        ("SUBMISSIONS", "Submissions"),
+        ("APPROVALS", "Approvals"),
+        ("REVISIONS", "Revised submissions"),
+    ]
+
+    granularity = models.CharField(max_length=4, choices=GRANULARITY_CHOICES)
+    metric = models.CharField(max_length=20, choices=METRIC_CHOICES)
+    # ScientificTheme code (Participant.scientific_theme for registrations)
+    theme_code = models.CharField(max_length=50)
+    bucket_start = models.DateTimeField()
+    count = models.IntegerField(default=0)
+
+    class Meta:
+        constraints = [
+            models.UniqueConstraint(
+                fields=["granularity", "metric", "theme_code", "bucket_start"], name="trend_bucket_unique"
+            ),
+        ]
+        indexes = [
+            models.Index(fields=["granularity", "bucket_start"], name="trend_bucket_range_idx"),
+        ]
+
+    def __str__(self):
+        return f"{self.metric} {self.theme_code} {self.bucket_start:%Y-%m-%d %H:00}: {self.count}"
+
+
+class TrendHighWaterMark(models.Model):
+    """Events of `metric` up to `processed_until` are already in TrendBucket."""
+
+    metric = models.CharField(max_length=20, choices=TrendBucket.METRIC_CHOICES, unique=True)
+    # Timestamp of the newest event folded in
+    processed_until = models.DateTimeField(null=True, blank=True)
+    # When the last refresh pass finished
+    refreshed_at = models.DateTimeField(null=True, blank=True)
+
+    def __str__(self):
+        return f"{self.metric} @ {self.processed_until}"
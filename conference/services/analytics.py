@@ -0,0 +1,284 @@
+"""Daily rollups behind admin_dashboard and admin_analytics.
+
+Two counter tables and one membership table replace the per-request
+aggregates:
+
+* AbstractDailyStat      — abstracts per (submission day, theme, status)
+* RegistrationDailyStat  — participants per (registration day, scientific theme)
+* ThemeParticipant       — one row per participant with >=1 abstract in a
+                           theme; counted distinct per participant, so someone
+                           with abstracts in several themes is counted once
+
+The signals in conference.signals call the record_* functions inside the
+same transaction as the change, so counters roll back with it. Bulk
+queryset updates bypass signals; run `manage.py rebuild_analytics` after
+those (or any time the counters are in doubt).
+"""
+
+from datetime import timedelta
+
+from django.db import IntegrityError, transaction
+from django.db.models import Count, F, Q, Sum
+from django.db.models.functions import TruncDate
+from django.utils import timezone
+
+from conference.models import (
+    AbstractDailyStat,
+    AbstractSubmission,
+    Participant,
+    RegistrationDailyStat,
+    ThemeParticipant,
+)
+
+RECENT_DAYS = 30
+
+
+def _day(value):
+    return timezone.localtime(value).date() if value else timezone.localdate()
+
+
+def bump_counter(model, delta, **key):
+    """Atomically add `delta` to the counter row identified by `key`."""
+    if not delta:
+        return
+    if model.objects.filter(**key).update(count=F("count") + delta) or delta < 0:
+        return
+    try:
+        with transaction.atomic():
+            model.objects.create(count=delta, **key)
+    except IntegrityError:
+        # Created concurrently; add to that row instead
+        model.objects.filter(**key).update(count=F("count") + delta)
+
+
+# ==================================================
+# INCREMENTAL MAINTENANCE
+# ==================================================
+def _join_themes(participant, theme_ids):
+    """Add membership rows for the participant (id, created_at,
+    scientific_theme); rows that already exist are left alone."""
+    ThemeParticipant.objects.bulk_create(
+        [
+            ThemeParticipant(
+                theme_id=theme_id,
+                participant_id=participant["id"],
+                day=_day(participant["created_at"]),
+                scientific_theme=participant["scientific_theme"],
+            )
+            for theme_id in theme_ids
+        ],
+        ignore_conflicts=True,
+    )
+
+
+def _theme_membership(user_id, theme_id, joined, exclude_pk=None):
+    """Add the user's participant to a theme when an abstract arrives there,
+    or remove it when their last one leaves."""
+    participant = (
+        Participant.objects
+        .filter(user_id=user_id)
+        .values("id", "created_at", "scientific_theme")
+        .first()
+    )
+    if not participant:
+        return
+    if joined:
+        _join_themes(participant, [theme_id])
+        return
+
+    others = AbstractSubmission.objects.filter(user_id=user_id, theme_id=theme_id)
+    if exclude_pk is not None:
+        others = others.exclude(pk=exclude_pk)
+    if not others.exists():
+        ThemeParticipant.objects.filter(theme_id=theme_id, participant_id=participant["id"]).delete()
+
+
+def record_abstract_saved(abstract, created, previous=None):
+    """previous: (theme_id, status) before the save, for existing rows."""
+    day = _day(abstract.submitted_at)
+
+    if created:
+        bump_counter(AbstractDailyStat, 1, day=day, theme_id=abstract.theme_id, status=abstract.status)
+        _theme_membership(abstract.user_id, abstract.theme_id, True)
+        return
+
+    if previous is None or previous == (abstract.theme_id, abstract.status):
+        return
+
+    old_theme_id, old_status = previous
+    bump_counter(AbstractDailyStat, -1, day=day, theme_id=old_theme_id, status=old_status)
+    bump_counter(AbstractDailyStat, 1, day=day, theme_id=abstract.theme_id, status=abstract.status)
+
+    if old_theme_id != abstract.theme_id:
+        _theme_membership(abstract.user_id, old_theme_id, False, exclude_pk=abstract.pk)
+        _theme_membership(abstract.user_id, abstract.theme_id, True)
+
+
+def record_abstract_deleted(abstract):
+    bump_counter(AbstractDailyStat, -1, day=_day(abstract.submitted_at),
+                 theme_id=abstract.theme_id, status=abstract.status)
+    _theme_membership(abstract.user_id, abstract.theme_id, False, exclude_pk=abstract.pk)
+
+
+def record_participant_saved(participant, created, previous_theme=None):
+    day = _day(participant.created_at)
+
+    if created:
+        bump_counter(RegistrationDailyStat, 1, day=day, scientific_theme=participant.scientific_theme)
+        theme_ids = set(
+            AbstractSubmission.objects
+            .filter(user_id=participant.user_id)
+            .values_list("theme_id", flat=True)
+        )
+        _join_themes(
+            {"id": participant.pk, "created_at": participant.created_at,
+             "scientific_theme": participant.scientific_theme},
+            theme_ids,
+        )
+        return
+
+    if previous_theme is None or previous_theme == participant.scientific_theme:
+        return
+
+    bump_counter(RegistrationDailyStat, -1, day=day, scientific_theme=previous_theme)
+    bump_counter(RegistrationDailyStat, 1, day=day, scientific_theme=participant.scientific_theme)
+    ThemeParticipant.objects.filter(participant=participant).update(scientific_theme=participant.scientific_theme)
+
+
+def record_participant_deleted(participant):
+    # Memberships go with the participant (on_delete=CASCADE)
+    bump_counter(RegistrationDailyStat, -1, day=_day(participant.created_at),
+                 scientific_theme=participant.scientific_theme)
+
+
+# ==================================================
+# REBUILD
+# ==================================================
+@transaction.atomic
+def rebuild_rollups():
+    """Recompute every rollup table from the source rows."""
+    AbstractDailyStat.objects.all().delete()
+    RegistrationDailyStat.objects.all().delete()
+    ThemeParticipant.objects.all().delete()
+
+    abstract_stats = (
+        AbstractSubmission.objects
+        .annotate(day=TruncDate("submitted_at"))
+        .values("day", "theme_id", "status")
+        .annotate(total=Count("id"))
+        .order_by()
+    )
+    AbstractDailyStat.objects.bulk_create(
+        AbstractDailyStat(day=s["day"], theme_id=s["theme_id"], status=s["status"], count=s["total"])
+        for s in abstract_stats
+    )
+
+    registration_stats = (
+        Participant.objects
+        .annotate(day=TruncDate("created_at"))
+        .values("day", "scientific_theme")
+        .annotate(total=Count("id"))
+        .order_by()
+    )
+    RegistrationDailyStat.objects.bulk_create(
+        RegistrationDailyStat(day=s["day"], scientific_theme=s["scientific_theme"], count=s["total"])
+        for s in registration_stats
+    )
+
+    memberships = (
+        Participant.objects
+        .filter(user__abstracts__isnull=False)
+        .annotate(day=TruncDate("created_at"), theme_id=F("user__abstracts__theme_id"))
+        .values("id", "day", "theme_id", "scientific_theme")
+        .distinct()
+        .order_by()
+    )
+    ThemeParticipant.objects.bulk_create(
+        (
+            ThemeParticipant(
+                theme_id=m["theme_id"], participant_id=m["id"], day=m["day"], scientific_theme=m["scientific_theme"]
+            )
+            for m in memberships.iterator()
+        ),
+        batch_size=1000,
+    )
+
+    return {
+        "abstracts": AbstractDailyStat.objects.count(),
+        "registrations": RegistrationDailyStat.objects.count(),
+        "theme_participants": ThemeParticipant.objects.count(),
+    }
+
+
+# ==================================================
+# READS (one grouped query each)
+# ==================================================
+def _recent_since():
+    return timezone.localdate() - timedelta(days=RECENT_DAYS)
+
+
+def abstract_summary(theme_ids=None):
+    """Totals, last-30-day count and per-status / per-theme breakdowns."""
+    stats = AbstractDailyStat.objects.all()
+    if theme_ids is not None:
+        stats = stats.filter(theme_id__in=theme_ids)
+
+    rows = (
+        stats
+        .values("status", theme_name=F("theme__name"))
+        .annotate(total=Sum("count"), recent=Sum("count", filter=Q(day__gte=_recent_since())))
+        .order_by()
+    )
+
+    by_status = {}
+    by_theme = {}
+    total = recent = 0
+    for row in rows:
+        if not row["total"]:
+            continue
+        total += row["total"]
+        recent += row["recent"] or 0
+        by_status[row["status"]] = by_status.get(row["status"], 0) + row["total"]
+        by_theme[row["theme_name"]] = by_theme.get(row["theme_name"], 0) + row["total"]
+
+    return {
+        "total": total,
+        "recent": recent,
+        "by_status": [{"status": k, "count": v} for k, v in sorted(by_status.items())],
+        "by_theme": [{"theme_name": k, "count": v} for k, v in sorted(by_theme.items())],
+    }
+
+
+def registration_summary():
+    """All registrations: total and last-30-day count."""
+    totals = RegistrationDailyStat.objects.aggregate(
+        total=Sum("count"),
+        recent=Sum("count", filter=Q(day__gte=_recent_since())),
+    )
+    return {"total": totals["total"] or 0, "recent": totals["recent"] or 0}
+
+
+def theme_participant_summary(theme_ids=None):
+    """Distinct participants with abstracts (optionally in the given themes):
+    total, last-30-day registrations and a per-scientific-theme breakdown."""
+    memberships = ThemeParticipant.objects.all()
+    if theme_ids is not None:
+        memberships = memberships.filter(theme_id__in=theme_ids)
+
+    # A participant has one scientific theme, so the groups' distinct
+    # counts add up to the distinct total
+    rows = (
+        memberships
+        .values("scientific_theme")
+        .annotate(
+            total=Count("participant", distinct=True),
+            recent=Count("participant", distinct=True, filter=Q(day__gte=_recent_since())),
+        )
+        .order_by("scientific_theme")
+    )
+    rows = list(rows)
+    return {
+        "total": sum(r["total"] for r in rows),
+        "recent": sum(r["recent"] or 0 for r in rows),
+        "by_scientific_theme": [{"scientific_theme": r["scientific_theme"], "count": r["total"]} for r in rows],
+    }
@@ -0,0 +1,116 @@
+"""Buffered sink for AdminActionLog rows.
+
+Request handlers hand entries to `record()`, which only appends to an
+in-process buffer. A background thread writes the buffer with one
+bulk_create when it reaches AUDIT_LOG_BATCH_SIZE entries or is older than
+AUDIT_LOG_FLUSH_INTERVAL seconds, and an atexit hook flushes whatever is
+left when the process shuts down. Login/logout bursts therefore cost one
+INSERT per batch instead of one write-lock round trip per request.
+
+The atexit hook only runs on a clean interpreter exit. A serverless
+instance (Vercel) can be frozen or killed with entries still queued, so
+settings turn buffering off there; AUDIT_LOG_BUFFERED = False writes every
+entry synchronously. `manage.py check_audit_log` confirms that queued
+entries reach the database.
+"""
+
+import atexit
+import logging
+import threading
+
+from django.conf import settings
+from django.db import connection, transaction
+from django.utils import timezone
+
+from conference.models import AdminActionLog
+
+logger = logging.getLogger(__name__)
+
+# Entries kept across failed flushes before the oldest are dropped
+MAX_PENDING = 10000
+
+
+class AuditLogBuffer:
+    def __init__(self, batch_size=50, flush_interval=2.0):
+        self.batch_size = batch_size
+        self.flush_interval = flush_interval
+        self._entries = []
+        self._lock = threading.Lock()
+        self._flush_lock = threading.Lock()
+        self._wakeup = threading.Event()
+        self._thread = None
+
+    def add(self, entry):
+        with self._lock:
+            self._entries.append(entry)
+            pending = len(self._entries)
+            self._ensure_thread()
+        if pending >= self.batch_size:
+            self._wakeup.set()
+
+    def _ensure_thread(self):
+        if self._thread is None or not self._thread.is_alive():
+            self._thread = threading.Thread(target=self._run, name="audit-log-flusher", daemon=True)
+            self._thread.start()
+
+    def _run(self):
+        while True:
+            self._wakeup.wait(self.flush_interval)
+            self._wakeup.clear()
+            try:
+                self.flush()
+            finally:
+                # Do not keep a connection open in this thread between flushes
+                connection.close()
+
+    def flush(self):
+        """Write all buffered entries; returns the number written."""
+        with self._flush_lock:
+            with self._lock:
+                entries, self._entries = self._entries, []
+            if not entries:
+                return 0
+            try:
+                # atomic() also opens this thread's connection, which
+                # bulk_create needs open to read the backend's limits
+                with transaction.atomic():
+                    AdminActionLog.objects.bulk_create(entries, batch_size=500)
+            except Exception:
+                logger.exception("Could not write %d audit log entries", len(entries))
+                # Keep them for the next attempt, but never grow without bound
+                with self._lock:
+                    self._entries = (entries + self._entries)[-MAX_PENDING:]
+                return 0
+            return len(entries)
+
+    def __len__(self):
+        return len(self._entries)
+
+
+buffer = AuditLogBuffer(
+    batch_size=getattr(settings, "AUDIT_LOG_BATCH_SIZE", 50),
+    flush_interval=getattr(settings, "AUDIT_LOG_FLUSH_INTERVAL", 2.0),
+)
+atexit.register(buffer.flush)
+
+
+def record(action, user=None, description="", object_type=None, object_id=None, ip_address=None):
+    """Queue one AdminActionLog entry (written synchronously when buffering is off)."""
+    entry = AdminActionLog(
+        user_id=user.pk if user is not None else None,
+        action=action,
+        object_type=object_type,
+        object_id=object_id,
+        description=description,
+        ip_address=ip_address,
+        # Stamped now, not when the batch is written
+        created_at=timezone.now(),
+    )
+    if not getattr(settings, "AUDIT_LOG_BUFFERED", True):
+        entry.save()
+        return
+    buffer.add(entry)
+
+
+def flush():
+    return buffer.flush()
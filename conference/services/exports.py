@@ -0,0 +1,399 @@
+"""Row sources, file writers and the streaming ZIP builder shared by the
+admin export views and the background export jobs (see the
+`run_export_jobs` command)."""
+
+import csv
+import gzip
+import json
+import re
+import zipfile
+from datetime import date, datetime, timedelta
+from xml.sax.saxutils import escape
+
+from django.utils import timezone
+
+from conference.models import AbstractSubmission, AdminActionLog, Participant
+from conference.services import log_archive
+from conference.services.search import search_abstracts
+
+# Rows are fetched with .iterator() in chunks of this size, so exports run in
+# constant memory however large the table is.
+EXPORT_CHUNK_SIZE = 2000
+
+
+# ==================================================
+# FILTERS (same query parameters as the list pages)
+# ==================================================
+def admin_log_filter_args(params):
+    """Parse the admin_logs query parameters into
+    {action, user_id, start, end}; start/end bound created_at as [start, end)."""
+    user_id = params.get("user")
+    end = _day_start(params.get("end_date"))
+    return {
+        "action": params.get("action") or None,
+        "user_id": int(user_id) if user_id and str(user_id).isdigit() else None,
+        "start": _day_start(params.get("start_date")),
+        "end": end + timedelta(days=1) if end else None,
+    }
+
+
+def filter_admin_logs(logs, params):
+    """Apply the admin_logs filters (action, user, start_date, end_date)."""
+    args = admin_log_filter_args(params)
+
+    if args["action"]:
+        logs = logs.filter(action=args["action"])
+
+    if args["user_id"] is not None:
+        logs = logs.filter(user__id=args["user_id"])
+
+    # Compare created_at against day boundaries rather than created_at__date,
+    # so the (action/user, created_at) indexes can serve the range.
+    if args["start"]:
+        logs = logs.filter(created_at__gte=args["start"])
+
+    if args["end"]:
+        logs = logs.filter(created_at__lt=args["end"])
+
+    return logs
+
+
+def _day_start(value):
+    """Aware datetime for midnight of a YYYY-MM-DD string (None if invalid)."""
+    try:
+        day = date.fromisoformat(str(value)) if value else None
+    except ValueError:
+        return None
+    if day is None:
+        return None
+    return timezone.make_aware(datetime.combine(day, datetime.min.time()))
+
+
+def filter_abstracts(abstracts, params):
+    """Apply the admin_abstracts filters (status, search, theme)."""
+    status_filter = params.get("status", "")
+    search_query = params.get("search", "")
+    theme_filter = params.get("theme", "")
+
+    if status_filter:
+        abstracts = abstracts.filter(status=status_filter)
+
+    if theme_filter:
+        abstracts = abstracts.filter(theme__code=theme_filter)
+
+    # Full-text (FTS5) search where available, ranked best match first
+    if search_query:
+        abstracts = search_abstracts(abstracts, search_query)
+
+    return abstracts
+
+
+# ==================================================
+# ROW SOURCES
+# ==================================================
+ABSTRACT_HEADER = [
+    "ID", "Participant Code", "Title", "Author", "Email",
+    "Theme", "Status", "Submitted On"
+]
+
+REGISTRATION_HEADER = [
+    "Username",
+    "Participant Code",
+    "Full Name",
+    "Email",
+    "Organization",
+    "Designation",
+    "Scientific Theme",
+    "Phone",
+    "Registered On",
+]
+
+ADMIN_LOG_HEADER = [
+    "Time",
+    "User",
+    "Action",
+    "Object Type",
+    "Object ID",
+    "IP Address",
+    "Description",
+]
+
+
+def abstract_rows(abstracts):
+    status_labels = dict(AbstractSubmission.STATUS_CHOICES)
+    rows = abstracts.values_list(
+        "id",
+        "user__participant__participant_code",
+        "title",
+        "user__first_name",
+        "user__last_name",
+        "user__username",
+        "user__email",
+        "theme__name",
+        "status",
+        "submitted_at",
+    ).iterator(chunk_size=EXPORT_CHUNK_SIZE)
+
+    for (pk, code, title, first, last, username, email,
+         theme_name, status, submitted_at) in rows:
+        yield [
+            pk,
+            code or "",
+            title,
+            f"{first} {last}".strip() or username,
+            email,
+            theme_name,
+            status_labels.get(status, status),
+            submitted_at.strftime("%d-%m-%Y"),
+        ]
+
+
+def registration_rows(participants):
+    theme_labels = dict(Participant.SCIENTIFIC_THEMES)
+    rows = participants.values_list(
+        "user__username",
+        "participant_code",
+        "user__first_name",
+        "user__last_name",
+        "user__email",
+        "organization",
+        "designation",
+        "scientific_theme",
+        "phone",
+        "created_at",
+    ).iterator(chunk_size=EXPORT_CHUNK_SIZE)
+
+    for (username, code, first, last, email, organization,
+         designation, theme, phone, created_at) in rows:
+        yield [
+            username,
+            code or "",
+            f"{first} {last}".strip(),
+            email,
+            organization,
+            designation,
+            theme_labels.get(theme, theme),
+            phone,
+            created_at.strftime("%d-%m-%Y"),
+        ]
+
+
+def admin_log_rows(logs):
+    action_labels = dict(AdminActionLog.ACTION_CHOICES)
+    rows = logs.values_list(
+        "created_at",
+        "user__username",
+        "action",
+        "object_type",
+        "object_id",
+        "ip_address",
+        "description",
+    ).iterator(chunk_size=EXPORT_CHUNK_SIZE)
+
+    for (created_at, username, action, object_type, object_id,
+         ip_address, description) in rows:
+        yield [
+            created_at.strftime("%d-%m-%Y %H:%M"),
+            username or "System",
+            action_labels.get(action, action),
+            object_type or "",
+            object_id or "",
+            ip_address,
+            description,
+        ]
+
+
+def archived_admin_log_rows(params):
+    """Rows for the archived part of an admin log export (empty unless the
+    date filter reaches back past the live table)."""
+    args = admin_log_filter_args(params)
+    if not log_archive.reaches_archive(args["start"], args["end"]):
+        return
+
+    action_labels = dict(AdminActionLog.ACTION_CHOICES)
+    for entry in log_archive.archived_entries(**args):
+        yield [
+            entry.created_at.strftime("%d-%m-%Y %H:%M"),
+            entry.user.username if entry.user else "System",
+            action_labels.get(entry.action, entry.action),
+            entry.object_type or "",
+            entry.object_id or "",
+            entry.ip_address,
+            entry.description,
+        ]
+
+
+# ==================================================
+# FILE WRITERS
+# ==================================================
+# Each writer takes a header, a row iterator and an optional progress
+# callback (called with the running row count every EXPORT_CHUNK_SIZE rows)
+# and returns the number of rows written.
+def write_csv(path, header, rows, progress=None):
+    count = 0
+    with open(path, "w", newline="", encoding="utf-8") as fh:
+        writer = csv.writer(fh)
+        writer.writerow(header)
+        for row in rows:
+            writer.writerow(row)
+            count += 1
+            if progress and count % EXPORT_CHUNK_SIZE == 0:
+                progress(count)
+    return count
+
+
+_XML_ILLEGAL = re.compile(r"[\x00-\x08\x0b\x0c\x0e-\x1f]")
+
+_XLSX_CONTENT_TYPES = (
+    '<?xml version="1.0" encoding="UTF-8" standalone="yes"?>'
+    '<Types xmlns="http://schemas.openxmlformats.org/package/2006/content-types">'
+    '<Default Extension="rels" ContentType="application/vnd.openxmlformats-package.relationships+xml"/>'
+    '<Default Extension="xml" ContentType="application/xml"/>'
+    '<Override PartName="/xl/workbook.xml" ContentType="application/vnd.openxmlformats-officedocument.spreadsheetml.sheet.main+xml"/>'
+    '<Override PartName="/xl/worksheets/sheet1.xml" ContentType="application/vnd.openxmlformats-officedocument.spreadsheetml.worksheet+xml"/>'
+    '</Types>'
+)
+_XLSX_RELS = (
+    '<?xml version="1.0" encoding="UTF-8" standalone="yes"?>'
+    '<Relationships xmlns="http://schemas.openxmlformats.org/package/2006/relationships">'
+    '<Relationship Id="rId1" Type="http://schemas.openxmlformats.org/officeDocument/2006/relationships/officeDocument" Target="xl/workbook.xml"/>'
+    '</Relationships>'
+)
+_XLSX_WORKBOOK = (
+    '<?xml version="1.0" encoding="UTF-8" standalone="yes"?>'
+    '<workbook xmlns="http://schemas.openxmlformats.org/spreadsheetml/2006/main" '
+    'xmlns:r="http://schemas.openxmlformats.org/officeDocument/2006/relationships">'
+    '<sheets><sheet name="Export" sheetId="1" r:id="rId1"/></sheets>'
+    '</workbook>'
+)
+_XLSX_WORKBOOK_RELS = (
+    '<?xml version="1.0" encoding="UTF-8" standalone="yes"?>'
+    '<Relationships xmlns="http://schemas.openxmlformats.org/package/2006/relationships">'
+    '<Relationship Id="rId1" Type="http://schemas.openxmlformats.org/officeDocument/2006/relationships/worksheet" Target="worksheets/sheet1.xml"/>'
+    '</Relationships>'
+)
+
+
+def _xlsx_row(values):
+    cells = []
+    for value in values:
+        if isinstance(value, (int, float)) and not isinstance(value, bool):
+            cells.append(f"<c><v>{value}</v></c>")
+        else:
+            text = escape(_XML_ILLEGAL.sub("", "" if value is None else str(value)))
+            cells.append(f'<c t="inlineStr"><is><t xml:space="preserve">{text}</t></is></c>')
+    return "<row>" + "".join(cells) + "</row>"
+
+
+def write_xlsx(path, header, rows, progress=None):
+    """Write a single-sheet XLSX workbook, streaming the sheet XML into the
+    zip so the workbook is never held in memory."""
+    count = 0
+    with zipfile.ZipFile(path, "w", compression=zipfile.ZIP_DEFLATED) as zf:
+        zf.writestr("[Content_Types].xml", _XLSX_CONTENT_TYPES)
+        zf.writestr("_rels/.rels", _XLSX_RELS)
+        zf.writestr("xl/workbook.xml", _XLSX_WORKBOOK)
+        zf.writestr("xl/_rels/workbook.xml.rels", _XLSX_WORKBOOK_RELS)
+
+        with zf.open("xl/worksheets/sheet1.xml", "w") as sheet:
+            sheet.write(
+                b'<?xml version="1.0" encoding="UTF-8" standalone="yes"?>'
+                b'<worksheet xmlns="http://schemas.openxmlformats.org/spreadsheetml/2006/main"><sheetData>'
+            )
+            sheet.write(_xlsx_row(header).encode("utf-8"))
+            for row in rows:
+                sheet.write(_xlsx_row(row).encode("utf-8"))
+                count += 1
+                if progress and count % EXPORT_CHUNK_SIZE == 0:
+                    progress(count)
+            sheet.write(b"</sheetData></worksheet>")
+    return count
+
+
+def write_columnar(path, header, rows, progress=None):
+    """Write gzip-compressed JSON lines in a Parquet-like column layout.
+
+    The first line holds the schema ({"columns": [...]}); every following
+    line is one row group of up to EXPORT_CHUNK_SIZE rows stored column by
+    column ({"rows": n, "data": [[col0...], [col1...], ...]}).
+    """
+    count = 0
+    with gzip.open(path, "wt", encoding="utf-8") as fh:
+        fh.write(json.dumps({"columns": header}) + "\n")
+
+        group = [[] for _ in header]
+        group_rows = 0
+        for row in rows:
+            for column, value in zip(group, row):
+                column.append(value)
+            group_rows += 1
+            count += 1
+            if group_rows == EXPORT_CHUNK_SIZE:
+                fh.write(json.dumps({"rows": group_rows, "data": group}, default=str) + "\n")
+                group = [[] for _ in header]
+                group_rows = 0
+                if progress:
+                    progress(count)
+        if group_rows:
+            fh.write(json.dumps({"rows": group_rows, "data": group}, default=str) + "\n")
+    return count
+
+
+WRITERS = {
+    "CSV": (write_csv, "csv"),
+    "XLSX": (write_xlsx, "xlsx"),
+    "COLUMNAR": (write_columnar, "columns.jsonl.gz"),
+}
+
+
+# ==================================================
+# STREAMING ZIP
+# ==================================================
+class _ZipStream:
+    """Write-only, non-seekable sink for zipfile; the compressed bytes are
+    handed out with pop() as soon as they are produced."""
+
+    def __init__(self):
+        self._chunks = []
+
+    def write(self, data):
+        self._chunks.append(bytes(data))
+        return len(data)
+
+    def flush(self):
+        pass
+
+    def pop(self):
+        data = b"".join(self._chunks)
+        self._chunks.clear()
+        return data
+
+
+def stream_zip(entries, chunk_size=64 * 1024):
+    """Yield a ZIP archive built from (arcname, storage file) pairs.
+
+    Each file is read in chunk_size pieces and every compressed piece is
+    yielded straight away, so neither the files nor the archive are held in
+    memory. Files missing from storage are skipped.
+    """
+    sink = _ZipStream()
+    # PDFs are already compressed; level 1 keeps CPU cost low
+    with zipfile.ZipFile(sink, "w", compression=zipfile.ZIP_DEFLATED, compresslevel=1) as zf:
+        for arcname, field_file in entries:
+            try:
+                field_file.open("rb")
+            except (FileNotFoundError, OSError):
+                continue
+            try:
+                with zf.open(arcname, "w") as dest:
+                    for chunk in field_file.chunks(chunk_size):
+                        dest.write(chunk)
+                        data = sink.pop()
+                        if data:
+                            yield data
+            finally:
+                field_file.close()
+            data = sink.pop()
+            if data:
+                yield data
+    yield sink.pop()
@@ -0,0 +1,245 @@
+"""Monthly archive files for AdminActionLog.
+
+`manage.py archive_admin_logs` moves rows older than
+AUDIT_LOG_RETENTION_DAYS out of the live table into one gzip JSON-lines
+file per month under AUDIT_LOG_ARCHIVE_DIR, e.g. admin_logs_2025-03.jsonl.gz.
+A file is a series of gzip members (blocks) of up to BLOCK_ROWS rows each.
+
+index.json records, per month, the file name, row count and time span, the
+byte offset, length and (created_at, id) span of every block, and the
+highest id and cutoff of the last run; plus `archived_before`: every row
+older than that instant lives in the archive.
+
+The admin log viewer and exports read the archives through
+`archived_entries()` when a date filter reaches back past that instant. A
+page seeks to the blocks around its cursor and decompresses only those.
+"""
+
+import gzip
+import heapq
+import json
+import os
+from datetime import datetime, timedelta, timezone as dt_timezone
+from itertools import count, islice
+
+from django.conf import settings
+
+from conference.models import AdminActionLog
+
+INDEX_FILE = "index.json"
+
+# Rows per gzip member; the unit a page read decompresses
+BLOCK_ROWS = 1000
+
+_EPOCH = datetime(1970, 1, 1, tzinfo=dt_timezone.utc)
+
+
+def archive_dir():
+    return str(getattr(settings, "AUDIT_LOG_ARCHIVE_DIR", os.path.join(settings.BASE_DIR, "archive", "admin_logs")))
+
+
+def month_file(month):
+    return f"admin_logs_{month}.jsonl.gz"
+
+
+# ==================================================
+# INDEX
+# ==================================================
+def load_index():
+    path = os.path.join(archive_dir(), INDEX_FILE)
+    try:
+        with open(path, encoding="utf-8") as fh:
+            return json.load(fh)
+    except FileNotFoundError:
+        return {"archived_before": None, "months": {}}
+
+
+def save_index(index):
+    directory = archive_dir()
+    os.makedirs(directory, exist_ok=True)
+    tmp_path = os.path.join(directory, INDEX_FILE + ".tmp")
+    with open(tmp_path, "w", encoding="utf-8") as fh:
+        json.dump(index, fh, indent=2, sort_keys=True)
+    os.replace(tmp_path, os.path.join(directory, INDEX_FILE))
+
+
+def archived_before(index=None):
+    """Start of the live window (None if nothing was ever archived)."""
+    value = (index or load_index()).get("archived_before")
+    return datetime.fromisoformat(value) if value else None
+
+
+def reaches_archive(start, end, index=None):
+    """True when a date-filtered query [start, end) extends past the live table."""
+    if start is None and end is None:
+        return False
+    boundary = archived_before(index)
+    return boundary is not None and (start is None or start < boundary)
+
+
+# ==================================================
+# WRITING
+# ==================================================
+def append_month(month, rows):
+    """Append serialised rows (oldest first) to a month's file.
+
+    Rows are written in gzip members of BLOCK_ROWS, so the file is still a
+    single readable .jsonl.gz. Returns the index entries of the new blocks.
+    """
+    directory = archive_dir()
+    os.makedirs(directory, exist_ok=True)
+    blocks = []
+    rows = iter(rows)
+    with open(os.path.join(directory, month_file(month)), "ab") as fh:
+        fh.seek(0, os.SEEK_END)
+        while True:
+            chunk = list(islice(rows, BLOCK_ROWS))
+            if not chunk:
+                break
+            text = "".join(json.dumps(row, separators=(",", ":")) + "\n" for row in chunk)
+            data = gzip.compress(text.encode("utf-8"))
+            blocks.append({
+                "offset": fh.tell(),
+                "length": len(data),
+                "rows": len(chunk),
+                "first": [chunk[0]["created_at"], chunk[0]["id"]],
+                "last": [chunk[-1]["created_at"], chunk[-1]["id"]],
+            })
+            fh.write(data)
+    return blocks
+
+
+def serialise(log, username):
+    return {
+        "id": log["id"],
+        "created_at": log["created_at"].isoformat(),
+        "user_id": log["user_id"],
+        "username": username,
+        "action": log["action"],
+        "object_type": log["object_type"],
+        "object_id": log["object_id"],
+        "ip_address": log["ip_address"],
+        "description": log["description"],
+    }
+
+
+# ==================================================
+# READING
+# ==================================================
+class ArchivedLog:
+    """Read-only stand-in for an AdminActionLog row restored from an archive."""
+
+    archived = True
+
+    def __init__(self, data):
+        self.pk = self.id = data["id"]
+        self.created_at = datetime.fromisoformat(data["created_at"])
+        self.user_id = data["user_id"]
+        self.action = data["action"]
+        self.object_type = data["object_type"]
+        self.object_id = data["object_id"]
+        self.ip_address = data["ip_address"]
+        self.description = data["description"]
+        username = data.get("username")
+        self.user = _ArchivedUser(self.user_id, username) if username else None
+
+    def get_action_display(self):
+        return dict(AdminActionLog.ACTION_CHOICES).get(self.action, self.action)
+
+
+class _ArchivedUser:
+    def __init__(self, pk, username):
+        self.pk = self.id = pk
+        self.username = username
+
+    def __str__(self):
+        return self.username
+
+
+def _micros(value):
+    return (value - _EPOCH) // timedelta(microseconds=1)
+
+
+def _block_key(bound):
+    created_at, pk = bound
+    return datetime.fromisoformat(created_at), pk
+
+
+def _read_block(month, block):
+    path = os.path.join(archive_dir(), month_file(month))
+    try:
+        with open(path, "rb") as fh:
+            fh.seek(block["offset"])
+            data = fh.read(block["length"])
+    except FileNotFoundError:
+        return []
+    text = gzip.decompress(data).decode("utf-8")
+    return [json.loads(line) for line in text.splitlines() if line.strip()]
+
+
+def archived_entries(start=None, end=None, action=None, user_id=None,
+                     after=None, before=None, newest_first=True):
+    """Yield ArchivedLog entries matching the admin log filters.
+
+    start/end bound created_at as [start, end). after/before are
+    (created_at, id) keyset bounds, exclusive, as used by the paginator.
+    Blocks are read lazily in key order, and only those whose span
+    overlaps the range, so a page costs the blocks it touches.
+    """
+    blocks = []
+    for month, meta in load_index().get("months", {}).items():
+        for block in meta.get("blocks", []):
+            first, last = _block_key(block["first"]), _block_key(block["last"])
+            if start is not None and last[0] < start:
+                continue
+            if end is not None and first[0] >= end:
+                continue
+            if after is not None and first >= after:
+                continue
+            if before is not None and last <= before:
+                continue
+            blocks.append((first, last, month, block))
+
+    sign = -1 if newest_first else 1
+
+    def order(key):
+        return sign * _micros(key[0]), sign * key[1]
+
+    def entries(month, block):
+        for data in _read_block(month, block):
+            if action and data["action"] != action:
+                continue
+            if user_id is not None and data["user_id"] != user_id:
+                continue
+            entry = ArchivedLog(data)
+            if start is not None and entry.created_at < start:
+                continue
+            if end is not None and entry.created_at >= end:
+                continue
+            key = (entry.created_at, entry.pk)
+            if after is not None and not key < after:
+                continue
+            if before is not None and not key > before:
+                continue
+            yield entry
+
+    # Blocks from separate runs may overlap, so merge them: a block is only
+    # read once the next entry due could come from it.
+    blocks.sort(key=lambda b: order(b[1] if newest_first else b[0]))
+    heap = []
+    tiebreak = count()
+    position = 0
+    while position < len(blocks) or heap:
+        while position < len(blocks):
+            first, last, month, block = blocks[position]
+            if heap and order(last if newest_first else first) > heap[0][0]:
+                break
+            for entry in entries(month, block):
+                heapq.heappush(heap, (order((entry.created_at, entry.pk)), next(tiebreak), entry))
+            position += 1
+        if heap:
+            yield heapq.heappop(heap)[2]
+
+
+def month_key(value):
+    return value.astimezone(dt_timezone.utc).strftime("%Y-%m")
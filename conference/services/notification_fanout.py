@@ -0,0 +1,69 @@
+from collections import Counter, defaultdict
+
+from django.db import transaction
+
+from conference.models import Notification, ThemeAdmin
+from conference.utils import adjust_unread_notification_count
+
+
+def create_notifications(notifications, batch_size=500):
+    """Insert Notification objects with a single bulk_create.
+
+    bulk_create skips post_save, so the cached unread counters are bumped
+    here (once per recipient) after the transaction commits.
+    """
+    notifications = list(notifications)
+    if not notifications:
+        return []
+
+    created = Notification.objects.bulk_create(notifications, batch_size=batch_size)
+
+    per_user = Counter(n.user_id for n in created if not n.is_read)
+
+    def bump():
+        for user_id, count in per_user.items():
+            adjust_unread_notification_count(user_id, count)
+
+    transaction.on_commit(bump)
+    return created
+
+
+def theme_admin_recipients(theme_ids):
+    """Return {theme_id: [user_id, ...]} for active ThemeAdmins, in one query."""
+    recipients = defaultdict(list)
+    rows = (
+        ThemeAdmin.themes.through.objects
+        .filter(scientifictheme_id__in=set(theme_ids), themeadmin__is_active=True)
+        .values_list("scientifictheme_id", "themeadmin__user_id")
+    )
+    for theme_id, user_id in rows:
+        recipients[theme_id].append(user_id)
+    return recipients
+
+
+def notify_theme_admins(abstracts, build_message):
+    """Notify the active ThemeAdmins of each abstract's theme.
+
+    `abstracts` may hold any number of AbstractSubmission rows;
+    `build_message(abstract)` returns the (title, message) pair for one
+    abstract. Recipients are resolved with one query and every
+    notification is written with one bulk_create.
+    """
+    abstracts = [a for a in abstracts if a.theme_id]
+    if not abstracts:
+        return []
+
+    recipients = theme_admin_recipients(a.theme_id for a in abstracts)
+
+    notifications = []
+    for abstract in abstracts:
+        user_ids = recipients.get(abstract.theme_id)
+        if not user_ids:
+            continue
+        title, message = build_message(abstract)
+        notifications.extend(
+            Notification(user_id=user_id, abstract=abstract, title=title, message=message)
+            for user_id in user_ids
+        )
+
+    return create_notifications(notifications)
@@ -0,0 +1,122 @@
+"""Keyset (cursor) pagination for large, append-only tables.
+
+Pages are addressed by the (created_at, id) of their boundary rows instead
+of an OFFSET, so every page is an index range scan of `per_page` rows no
+matter how deep it is. Totals come from a short-lived cache instead of a
+COUNT(*) on every request.
+"""
+
+import hashlib
+from itertools import islice
+from datetime import datetime, timedelta, timezone as dt_timezone
+
+from django.core.cache import cache
+from django.db.models import Q
+
+_EPOCH = datetime(1970, 1, 1, tzinfo=dt_timezone.utc)
+
+COUNT_CACHE_TTL = 60
+
+
+def encode_cursor(created_at, pk):
+    """Opaque, URL-safe cursor: microseconds since the epoch and the row id."""
+    micros = (created_at - _EPOCH) // timedelta(microseconds=1)
+    return f"{micros}.{pk}"
+
+
+def decode_cursor(cursor):
+    """Return (created_at, pk) for a cursor, or None if it is malformed."""
+    try:
+        micros, pk = (int(part) for part in str(cursor).split(".", 1))
+    except (TypeError, ValueError):
+        return None
+    return _EPOCH + timedelta(microseconds=micros), pk
+
+
+class KeysetPage:
+    """One page of rows, newest first, with cursors for its neighbours."""
+
+    def __init__(self, rows, has_next, has_previous):
+        self.object_list = rows
+        self.has_next = has_next
+        self.has_previous = has_previous
+
+    def __iter__(self):
+        return iter(self.object_list)
+
+    def __len__(self):
+        return len(self.object_list)
+
+    @property
+    def next_cursor(self):
+        last = self.object_list[-1] if self.object_list else None
+        return encode_cursor(last.created_at, last.pk) if last and self.has_next else ""
+
+    @property
+    def previous_cursor(self):
+        first = self.object_list[0] if self.object_list else None
+        return encode_cursor(first.created_at, first.pk) if first and self.has_previous else ""
+
+
+def keyset_page(queryset, after=None, before=None, per_page=20, older=None):
+    """Return the page of `queryset` (newest first by created_at, id).
+
+    `after` selects the page of rows older than that cursor, `before` the
+    page of rows newer than it; with neither the newest page is returned.
+
+    `older`, if given, is a callable yielding rows that all predate the
+    queryset (e.g. archived logs). It takes the same keyword arguments as
+    log_archive.archived_entries (after, before, newest_first) with
+    decoded cursors, and continues the listing once the queryset runs out.
+    """
+    after = decode_cursor(after) if after else None
+    before = decode_cursor(before) if before else None
+
+    if before:
+        created_at, pk = before
+        rows = []
+        if older:
+            rows = list(islice(older(before=before, newest_first=False), per_page + 1))
+        if len(rows) <= per_page:
+            rows += list(
+                queryset
+                .filter(created_at__gte=created_at)
+                .filter(Q(created_at__gt=created_at) | Q(pk__gt=pk))
+                .order_by("created_at", "id")[:per_page + 1 - len(rows)]
+            )
+        if len(rows) <= per_page:
+            # Reached the newest rows: show a full first page
+            return keyset_page(queryset, per_page=per_page, older=older)
+        return KeysetPage(rows[:per_page][::-1], has_next=True, has_previous=True)
+
+    live = queryset
+    if after:
+        created_at, pk = after
+        live = (
+            queryset
+            .filter(created_at__lte=created_at)
+            .filter(Q(created_at__lt=created_at) | Q(pk__lt=pk))
+        )
+
+    rows = list(live.order_by("-created_at", "-id")[:per_page + 1])
+    if older and len(rows) <= per_page:
+        rows += list(islice(older(after=after, newest_first=True), per_page + 1 - len(rows)))
+    has_next = len(rows) > per_page
+    return KeysetPage(rows[:per_page], has_next=has_next, has_previous=bool(after))
+
+
+def cached_count(queryset, key_prefix, params, ttl=COUNT_CACHE_TTL):
+    """COUNT(*) of `queryset`, cached for `ttl` seconds per filter set.
+
+    Fine for a "~N rows" label on a growing log; exact counts are not worth
+    a full index scan on every page load.
+    """
+    fingerprint = hashlib.md5(
+        "&".join(f"{k}={v}" for k, v in sorted(params.items())).encode()
+    ).hexdigest()
+    key = f"{key_prefix}:count:{fingerprint}"
+    count = cache.get(key)
+    if count is None:
+        count = queryset.count()
+        cache.set(key, count, ttl)
+    return count
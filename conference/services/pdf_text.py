@@ -0,0 +1,46 @@
+"""Plain-text extraction from uploaded abstract PDFs.
+
+pypdf decodes the content streams through each font's encoding and
+ToUnicode CMap, so Type0 / Identity-H text from Word and LaTeX comes out
+readable. Scanned PDFs yield no text.
+"""
+
+import io
+import re
+
+from pypdf import PdfReader
+
+# Cap on the text stored per abstract; search does not need whole papers.
+MAX_TEXT_LENGTH = 100_000
+
+_WHITESPACE_RE = re.compile(r"[ \t\r\f\v]+")
+_BLANK_LINES_RE = re.compile(r"\n\s*\n+")
+
+
+def normalize_text(text):
+    text = _WHITESPACE_RE.sub(" ", text.replace("\x00", ""))
+    text = _BLANK_LINES_RE.sub("\n", text)
+    return text.strip()[:MAX_TEXT_LENGTH]
+
+
+def extract_pdf_text(field_file):
+    """Return the normalised plain text of a stored PDF ('' if none)."""
+    if not field_file:
+        return ""
+    field_file.open("rb")
+    try:
+        data = field_file.read()
+    finally:
+        field_file.close()
+
+    reader = PdfReader(io.BytesIO(data))
+    parts = []
+    length = 0
+    for page in reader.pages:
+        text = page.extract_text() or ""
+        parts.append(text)
+        length += len(text)
+        # Pages past the stored cap are not worth decoding
+        if length >= MAX_TEXT_LENGTH:
+            break
+    return normalize_text("\n".join(parts))
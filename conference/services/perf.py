@@ -0,0 +1,185 @@
+"""Per-view query and latency samples, and the budgets checked against them.
+
+conference.middleware.PerfBudgetMiddleware (enabled with PERF_MONITORING)
+wraps each monitored view in a `ViewProfile`, which counts the SQL queries
+it issues through a connection execute_wrapper, their total time, the time
+spent rendering templates and the response size. Samples are appended as
+JSON lines to PERF_LOG_DIR/perf.jsonl, which rolls over to perf.jsonl.1 at
+PERF_LOG_MAX_BYTES, and `manage.py perf_report` summarises them.
+
+Budgets (PERF_BUDGETS) are checked on every sample; PERF_BUDGET_ACTION
+"log" writes a warning, "raise" raises QueryBudgetExceeded so an N+1
+regression fails the request (and therefore any test that makes it).
+"""
+
+import json
+import logging
+import math
+import os
+import threading
+import time
+from collections import Counter
+
+from django.conf import settings
+from django.db import connections
+
+logger = logging.getLogger(__name__)
+
+LOG_FILE = "perf.jsonl"
+
+_write_lock = threading.Lock()
+_render_state = threading.local()
+
+
+class QueryBudgetExceeded(Exception):
+    pass
+
+
+# ==================================================
+# MEASURING
+# ==================================================
+class ViewProfile:
+    """Context manager collecting the numbers for one view call."""
+
+    def __init__(self):
+        self.queries = 0
+        self.sql_ms = 0.0
+        self.statements = Counter()
+        self._wrapped = []
+
+    def __call__(self, execute, sql, params, many, context):
+        start = time.perf_counter()
+        try:
+            return execute(sql, params, many, context)
+        finally:
+            self.sql_ms += (time.perf_counter() - start) * 1000
+            self.queries += 1
+            self.statements[sql] += 1
+
+    def __enter__(self):
+        for conn in connections.all():
+            conn.execute_wrappers.append(self)
+            self._wrapped.append(conn)
+        _render_state.ms = 0.0
+        _render_state.depth = 0
+        self._start = time.perf_counter()
+        return self
+
+    def __exit__(self, *exc_info):
+        self.total_ms = (time.perf_counter() - self._start) * 1000
+        self.render_ms = getattr(_render_state, "ms", 0.0)
+        for conn in self._wrapped:
+            conn.execute_wrappers.remove(self)
+        self._wrapped = []
+
+    @property
+    def duplicate_queries(self):
+        """Executions of the most repeated SQL statement (same text, any params)."""
+        return max(self.statements.values(), default=0)
+
+
+def install_render_timer():
+    """Time Django template rendering (outermost render only). Idempotent."""
+    from django.template.backends.django import Template
+
+    if getattr(Template.render, "_perf_timed", False):
+        return
+    original = Template.render
+
+    def render(self, context=None, request=None):
+        depth = getattr(_render_state, "depth", 0)
+        _render_state.depth = depth + 1
+        start = time.perf_counter()
+        try:
+            return original(self, context, request)
+        finally:
+            _render_state.depth = depth
+            if depth == 0:
+                _render_state.ms = getattr(_render_state, "ms", 0.0) + (time.perf_counter() - start) * 1000
+
+    render._perf_timed = True
+    Template.render = render
+
+
+# ==================================================
+# BUDGETS
+# ==================================================
+def budget_for(url_name):
+    """Merged budget for a URL name: PERF_DEFAULT_BUDGET overlaid with its PERF_BUDGETS entry."""
+    budget = dict(getattr(settings, "PERF_DEFAULT_BUDGET", {}))
+    budget.update(getattr(settings, "PERF_BUDGETS", {}).get(url_name, {}))
+    return budget
+
+
+def check_budget(sample):
+    """Return a list of human-readable budget violations for a sample."""
+    budget = budget_for(sample["url"])
+    checks = [
+        ("queries", sample["queries"], "queries"),
+        ("duplicates", sample["duplicates"], "repeats of one query"),
+        ("ms", sample["ms"], "ms"),
+    ]
+    return [
+        f"{value:g} {label} > {budget[key]:g}"
+        for key, value, label in checks
+        if budget.get(key) is not None and value > budget[key]
+    ]
+
+
+def enforce_budget(sample):
+    violations = check_budget(sample)
+    if not violations:
+        return
+    message = f"{sample['url']} over budget: " + ", ".join(violations)
+    if getattr(settings, "PERF_BUDGET_ACTION", "log") == "raise":
+        raise QueryBudgetExceeded(message)
+    logger.warning(message)
+
+
+# ==================================================
+# ROLLING STORE
+# ==================================================
+def log_dir():
+    return str(getattr(settings, "PERF_LOG_DIR", os.path.join(settings.BASE_DIR, "perf")))
+
+
+def record_sample(sample):
+    """Append one sample, rolling the file over when it grows too large."""
+    directory = log_dir()
+    path = os.path.join(directory, LOG_FILE)
+    line = json.dumps(sample, separators=(",", ":")) + "\n"
+    max_bytes = getattr(settings, "PERF_LOG_MAX_BYTES", 5 * 1024 * 1024)
+
+    with _write_lock:
+        try:
+            os.makedirs(directory, exist_ok=True)
+            if os.path.exists(path) and os.path.getsize(path) >= max_bytes:
+                os.replace(path, path + ".1")
+            with open(path, "a", encoding="utf-8") as fh:
+                fh.write(line)
+        except OSError:
+            logger.exception("Could not record perf sample")
+
+
+def load_samples():
+    """All stored samples, oldest file first."""
+    path = os.path.join(log_dir(), LOG_FILE)
+    samples = []
+    for name in (path + ".1", path):
+        try:
+            with open(name, encoding="utf-8") as fh:
+                for line in fh:
+                    try:
+                        samples.append(json.loads(line))
+                    except ValueError:
+                        continue  # torn line from a concurrent writer
+        except FileNotFoundError:
+            continue
+    return samples
+
+
+def percentile(values, pct):
+    """Nearest-rank percentile of a non-empty list."""
+    ordered = sorted(values)
+    rank = max(math.ceil(pct / 100 * len(ordered)), 1)
+    return ordered[rank - 1]
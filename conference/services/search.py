@@ -0,0 +1,139 @@
+"""Full-text search for admin abstract lists.
+
+On SQLite the abstracts (title, author, and the text extracted from the
+PDFs) are mirrored into an FTS5 virtual table (created by migration 0020,
+body column added in 0021) that is kept in sync by the signals in
+conference.signals.
+On any other backend, or if FTS5 is unavailable, search falls back to the
+original icontains filters.
+"""
+
+import re
+
+from django.db import connection
+from django.db.models import Q
+
+FTS_TABLE = "conference_abstract_fts"
+
+_TOKEN_RE = re.compile(r"\w+", re.UNICODE)
+
+_fts_state = {}
+
+
+def create_fts_table(cursor):
+    cursor.execute(
+        f"CREATE VIRTUAL TABLE IF NOT EXISTS {FTS_TABLE} USING fts5("
+        "title, username, email, body, "
+        "tokenize = 'unicode61 remove_diacritics 2', prefix = '2 3')"
+    )
+    # Title matches outrank author and body matches
+    cursor.execute(
+        f"INSERT INTO {FTS_TABLE} ({FTS_TABLE}, rank) VALUES ('rank', 'bm25(10.0, 5.0, 5.0, 1.0)')"
+    )
+
+
+def fts_available():
+    """True when the FTS5 index exists on the default (SQLite) database."""
+    if connection.vendor != "sqlite":
+        return False
+    if "available" not in _fts_state:
+        with connection.cursor() as cursor:
+            cursor.execute(
+                "SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = %s",
+                [FTS_TABLE],
+            )
+            _fts_state["available"] = cursor.fetchone() is not None
+    return _fts_state["available"]
+
+
+def build_match_query(query):
+    """Turn free text into an FTS5 expression: every word is a quoted
+    prefix term and all of them must match."""
+    tokens = _TOKEN_RE.findall(query or "")
+    return " ".join(f'"{token}"*' for token in tokens)
+
+
+# ==================================================
+# INDEX MAINTENANCE
+# ==================================================
+def index_abstract(abstract):
+    if not fts_available():
+        return
+    user = abstract.user
+    with connection.cursor() as cursor:
+        cursor.execute(f"DELETE FROM {FTS_TABLE} WHERE rowid = %s", [abstract.pk])
+        cursor.execute(
+            f"INSERT INTO {FTS_TABLE} (rowid, title, username, email, body) VALUES (%s, %s, %s, %s, %s)",
+            [abstract.pk, abstract.title or "", user.username or "", user.email or "",
+             abstract.extracted_text or ""],
+        )
+
+
+def remove_abstract(abstract_id):
+    if not fts_available():
+        return
+    with connection.cursor() as cursor:
+        cursor.execute(f"DELETE FROM {FTS_TABLE} WHERE rowid = %s", [abstract_id])
+
+
+def reindex_user(user):
+    """Refresh the username/email columns for every abstract of a user."""
+    if not fts_available():
+        return
+    with connection.cursor() as cursor:
+        cursor.execute(
+            f"UPDATE {FTS_TABLE} SET username = %s, email = %s "
+            "WHERE rowid IN (SELECT id FROM conference_abstractsubmission WHERE user_id = %s)",
+            [user.username or "", user.email or "", user.pk],
+        )
+
+
+def rebuild_index():
+    """Repopulate the whole index from the abstract and user tables."""
+    if not fts_available():
+        return 0
+    with connection.cursor() as cursor:
+        cursor.execute(f"DELETE FROM {FTS_TABLE}")
+        cursor.execute(
+            f"INSERT INTO {FTS_TABLE} (rowid, title, username, email, body) "
+            "SELECT a.id, a.title, u.username, COALESCE(u.email, ''), a.extracted_text "
+            "FROM conference_abstractsubmission a "
+            "JOIN auth_user u ON u.id = a.user_id"
+        )
+        cursor.execute(f"SELECT COUNT(*) FROM {FTS_TABLE}")
+        return cursor.fetchone()[0]
+
+
+# ==================================================
+# QUERYING
+# ==================================================
+def search_abstracts(abstracts, query):
+    """Filter an AbstractSubmission queryset by free-text query.
+
+    With FTS5 the result is ordered by bm25 rank (best match first) and
+    every word matches as a prefix; otherwise the icontains filters are used.
+    """
+    if not query:
+        return abstracts
+
+    if fts_available():
+        match = build_match_query(query)
+        if not match:
+            return abstracts.none()
+        return abstracts.extra(
+            tables=[FTS_TABLE],
+            where=[
+                f"{FTS_TABLE}.rowid = conference_abstractsubmission.id",
+                f"{FTS_TABLE} MATCH %s",
+            ],
+            params=[match],
+            select={"search_rank": f"{FTS_TABLE}.rank"},
+            order_by=["search_rank"],
+        )
+
+    return abstracts.filter(
+        Q(title__icontains=query) |
+        Q(user__username__icontains=query) |
+        Q(user__email__icontains=query) |
+        Q(extracted_text__icontains=query)
+    )
@@ -0,0 +1,539 @@
+"""Synthetic conference data for benchmarks and profiling.
+
+`seed_conference()` bulk-inserts a production-shaped dataset: the eight
+scientific themes, one theme admin per theme, participants registered over
+the call-for-papers window, abstracts skewed towards each participant's own
+theme and towards the deadline, reviews, notifications and admin logs.
+Everything goes through bulk_create in batches, so signals do not fire;
+the derived tables (analytics rollups, trend series, search index, unread
+counters) are rebuilt once at the end instead.
+
+Seeded accounts, the superuser included, get unusable passwords, so a
+dataset seeded into the wrong database opens no login. Load tests that need
+the real login form give the accounts they drive a random password for the
+run with grant_password() and take it away again with revoke_passwords().
+"""
+
+import os
+import random
+import time
+from datetime import timedelta
+
+from django.contrib.auth.hashers import UNUSABLE_PASSWORD_PREFIX, make_password
+from django.contrib.auth.models import User
+from django.core.files.storage import default_storage
+from django.db import connection, transaction
+from django.utils import timezone
+from django.utils.crypto import get_random_string
+
+from conference.models import (
+    AbstractReview,
+    AbstractSubmission,
+    AdminActionLog,
+    Notification,
+    Participant,
+    ScientificTheme,
+    ThemeAdmin,
+)
+
+BATCH_SIZE = 2000
+
+# Log loads at least this big drop and rebuild the log table's indexes
+BULK_INDEX_REBUILD_ROWS = 100_000
+
+ADMIN_USERNAME = "seed_admin"
+
+# Relative popularity of the registration themes
+THEME_WEIGHTS = {
+    "climate_change": 24,
+    "glaciology": 18,
+    "oceanography": 16,
+    "polar_biology": 14,
+    "atmospheric_science": 10,
+    "remote_sensing": 8,
+    "polar_geology": 6,
+    "other": 4,
+}
+
+STATUS_WEIGHTS = {"PENDING": 45, "REVISION": 15, "APPROVED": 28, "REJECTED": 12}
+
+LOG_ACTION_WEIGHTS = {
+    "LOGIN": 55, "LOGOUT": 20, "UPDATE": 10, "CREATE": 5,
+    "APPROVED": 4, "REJECTED": 2, "ASSIGN": 3, "DELETE": 1,
+}
+
+ORGANIZATIONS = [
+    "National Centre for Polar and Ocean Research", "Indian Institute of Science",
+    "University of Tromsø", "British Antarctic Survey", "Alfred Wegener Institute",
+    "Norwegian Polar Institute", "IIT Bombay", "IISER Pune", "Physical Research Laboratory",
+    "Scott Polar Research Institute", "Geological Survey of India", "NIOT Chennai",
+]
+DESIGNATIONS = ["PhD Scholar", "Research Associate", "Scientist", "Professor",
+                "Assistant Professor", "Postdoctoral Fellow", "Project Scientist", "Student"]
+TITLES = ["Mr", "Ms", "Dr", "Dr", "Prof", "Mrs", ""]
+FIRST_NAMES = ["Aarav", "Ananya", "Ishaan", "Diya", "Kabir", "Meera", "Rohan", "Saanvi",
+               "Arjun", "Kavya", "Vikram", "Nisha", "Emma", "Lars", "Ingrid", "Olaf",
+               "Sofia", "Liam", "Hannah", "Kenji", "Yuki", "Maria", "Tomás", "Chloé"]
+LAST_NAMES = ["Sharma", "Iyer", "Nair", "Reddy", "Gupta", "Menon", "Rao", "Singh",
+              "Patel", "Das", "Hansen", "Johansen", "Berg", "Müller", "Smith", "Tanaka",
+              "García", "Rossi", "Dubois", "Kowalski"]
+TOPIC_WORDS = ["sea ice", "ice shelf", "permafrost", "krill", "aerosol", "albedo",
+               "meltwater", "katabatic winds", "moraine", "phytoplankton", "ozone",
+               "snow cover", "calving", "brine channels", "subglacial lakes", "SAR imagery",
+               "ice cores", "penguin colonies", "Southern Ocean", "Arctic amplification"]
+TITLE_PATTERNS = [
+    "Long-term variability of {a} in the {region}",
+    "Impact of {a} on {b}: evidence from {region}",
+    "Modelling {a} and {b} under warming scenarios",
+    "A multi-decadal record of {a} from {region}",
+    "Remote observation of {a} using {b}",
+]
+REGIONS = ["East Antarctica", "the Weddell Sea", "Svalbard", "the Himalaya",
+           "Dronning Maud Land", "the Larsemann Hills", "Greenland", "the Ross Sea"]
+
+
+def bulk_create_backdated(model, objs, field, batch_size):
+    """bulk_create, then write back the generated `field` times that the
+    field's auto_now_add replaced with now().
+
+    One executemany UPDATE by primary key; bulk_update's CASE batches cost
+    more than the insert itself at these sizes.
+    """
+    stamps = [getattr(obj, field) for obj in objs]
+    model.objects.bulk_create(objs, batch_size=batch_size)
+
+    quote = connection.ops.quote_name
+    adapt = connection.ops.adapt_datetimefield_value
+    sql = (
+        f"UPDATE {quote(model._meta.db_table)} SET {quote(model._meta.get_field(field).column)} = %s "
+        f"WHERE {quote(model._meta.pk.column)} = %s"
+    )
+    with connection.cursor() as cursor:
+        cursor.executemany(sql, [(adapt(stamp), obj.pk) for obj, stamp in zip(objs, stamps)])
+    for obj, stamp in zip(objs, stamps):
+        setattr(obj, field, stamp)
+
+
+def _weighted(rng, weights, k):
+    return rng.choices(list(weights), weights=list(weights.values()), k=k)
+
+
+def _skewed_time(rng, start, end, skew=2.5):
+    """A time in [start, end], bunched towards `end` (submissions near the deadline)."""
+    return end - (end - start) * (rng.random() ** skew)
+
+
+def _abstract_text(rng, words=90):
+    vocabulary = TOPIC_WORDS + ["observations", "trend", "seasonal", "model", "data",
+                                "we", "show", "that", "the", "of", "and", "in", "significant"]
+    return " ".join(rng.choice(vocabulary) for _ in range(words)).capitalize() + "."
+
+
+def dummy_pdf(title, text):
+    """A minimal one-page PDF with the title and the start of the text.
+
+    Uncompressed Tj strings, so extract_abstract_text can read it back.
+    """
+    def literal(value):
+        value = value.encode("latin-1", "replace").decode("latin-1")
+        return "(" + value.replace("\\", "\\\\").replace("(", "\\(").replace(")", "\\)") + ")"
+
+    lines = [title[:90]] + [text[i:i + 90] for i in range(0, min(len(text), 540), 90)]
+    stream = "BT /F1 11 Tf 56 780 Td 14 TL " + " ".join(f"{literal(line)} Tj T*" for line in lines) + " ET"
+    objects = [
+        "<< /Type /Catalog /Pages 2 0 R >>",
+        "<< /Type /Pages /Kids [3 0 R] /Count 1 >>",
+        "<< /Type /Page /Parent 2 0 R /MediaBox [0 0 595 842] "
+        "/Resources << /Font << /F1 4 0 R >> >> /Contents 5 0 R >>",
+        "<< /Type /Font /Subtype /Type1 /BaseFont /Helvetica >>",
+        f"<< /Length {len(stream.encode('latin-1'))} >>\nstream\n{stream}\nendstream",
+    ]
+    out = "%PDF-1.4\n"
+    offsets = []
+    for number, body in enumerate(objects, 1):
+        offsets.append(len(out.encode("latin-1")))
+        out += f"{number} 0 obj\n{body}\nendobj\n"
+    xref = len(out.encode("latin-1"))
+    out += f"xref\n0 {len(objects) + 1}\n0000000000 65535 f \n"
+    out += "".join(f"{offset:010d} 00000 n \n" for offset in offsets)
+    out += f"trailer\n<< /Size {len(objects) + 1} /Root 1 0 R >>\nstartxref\n{xref}\n%%EOF\n"
+    return out.encode("latin-1")
+
+
+class Seeder:
+    """One seeding run; `tag` keeps usernames unique across repeated runs."""
+
+    def __init__(self, days=120, seed=None, batch_size=BATCH_SIZE, stdout=None):
+        self.rng = random.Random(seed)
+        self.batch_size = batch_size
+        self.now = timezone.now()
+        self.start = self.now - timedelta(days=days)
+        self.tag = get_random_string(5, "abcdefghijklmnopqrstuvwxyz0123456789")
+        self.password = make_password(None)
+        self.stdout = stdout
+        self._last = time.perf_counter()
+
+    def say(self, message):
+        """Report a finished step with the time it took."""
+        now = time.perf_counter()
+        if self.stdout:
+            self.stdout.write(f"{message:<40} {now - self._last:6.1f}s")
+        self._last = now
+
+    # ---------------- staff ----------------
+    def themes(self):
+        existing = {t.code: t for t in ScientificTheme.objects.all()}
+        missing = [
+            ScientificTheme(code=code, name=name)
+            for code, name in Participant.SCIENTIFIC_THEMES
+            if code not in existing
+        ]
+        ScientificTheme.objects.bulk_create(missing)
+        return list(ScientificTheme.objects.filter(code__in=THEME_WEIGHTS))
+
+    def staff(self, themes):
+        admin, _ = User.objects.get_or_create(
+            username=ADMIN_USERNAME,
+            defaults={"email": "seed_admin@example.org", "is_staff": True, "is_superuser": True,
+                      "password": self.password},
+        )
+
+        theme_admins = {}
+        for theme in themes:
+            username = f"seed_ta_{theme.code}"
+            user, _ = User.objects.get_or_create(
+                username=username,
+                defaults={"email": f"{username}@example.org", "is_staff": True, "password": self.password},
+            )
+            theme_admin, _ = ThemeAdmin.objects.get_or_create(user=user)
+            theme_admin.themes.add(theme)
+            theme_admins[theme.pk] = theme_admin
+        return admin, theme_admins
+
+    # ---------------- participants ----------------
+    def participants(self, count):
+        rng = self.rng
+        users = []
+        for i in range(count):
+            first, last = rng.choice(FIRST_NAMES), rng.choice(LAST_NAMES)
+            username = f"seed_{self.tag}_{i}"
+            users.append(User(
+                username=username, first_name=first, last_name=last,
+                email=f"{username}@example.org", password=self.password,
+                date_joined=_skewed_time(rng, self.start, self.now, skew=1.5),
+            ))
+        User.objects.bulk_create(users, batch_size=self.batch_size)
+        if users and users[0].pk is None:
+            # Backends without RETURNING: fetch the ids back
+            ids = dict(User.objects.filter(username__startswith=f"seed_{self.tag}_").values_list("username", "id"))
+            for user in users:
+                user.pk = ids[user.username]
+
+        taken = set(Participant.objects.exclude(participant_code=None).values_list("participant_code", flat=True))
+        themes = _weighted(rng, THEME_WEIGHTS, count)
+        participants = []
+        for user, theme in zip(users, themes):
+            participant = Participant(
+                user=user, scientific_theme=theme, title=rng.choice(TITLES),
+                organization=rng.choice(ORGANIZATIONS), designation=rng.choice(DESIGNATIONS),
+                phone=f"+91{rng.randrange(7_000_000_000, 9_999_999_999)}",
+                created_at=user.date_joined,
+            )
+            code = participant._generate_code()
+            while code in taken:
+                code = participant._generate_code()
+            taken.add(code)
+            participant.participant_code = code
+            participants.append(participant)
+
+        bulk_create_backdated(Participant, participants, "created_at", self.batch_size)
+        self.say(f"  {count} participants")
+        return participants
+
+    # ---------------- abstracts ----------------
+    def abstracts(self, count, participants, themes, admin, pdfs=True):
+        rng = self.rng
+        if not participants:
+            self.say("  0 abstracts")
+            return []
+        theme_by_code = {t.code: t for t in themes}
+        statuses = _weighted(rng, STATUS_WEIGHTS, count)
+        # A few prolific authors, most with one or two abstracts
+        authors = rng.choices(participants, weights=[1 + (i % 7 == 0) * 3 for i in range(len(participants))], k=count)
+
+        abstracts = []
+        for participant, status in zip(authors, statuses):
+            # Mostly the theme they registered under, sometimes another one
+            theme = theme_by_code.get(participant.scientific_theme) if rng.random() < 0.75 else None
+            theme = theme or rng.choice(themes)
+            submitted_at = _skewed_time(rng, participant.created_at, self.now)
+            a, b = rng.sample(TOPIC_WORDS, 2)
+            text = _abstract_text(rng)
+            abstract = AbstractSubmission(
+                user_id=participant.user_id, theme=theme, status=status,
+                title=rng.choice(TITLE_PATTERNS).format(a=a, b=b, region=rng.choice(REGIONS)).capitalize(),
+                abstract=text, extracted_text=text, text_extraction_status="DONE",
+                submitted_at=submitted_at, text_extracted_at=submitted_at,
+            )
+            if status in ("APPROVED", "REJECTED", "REVISION"):
+                decided_at = submitted_at + (self.now - submitted_at) * rng.random() * 0.5
+                if status == "APPROVED":
+                    abstract.approved_by = admin
+                    abstract.approved_at = decided_at
+                elif status == "REVISION":
+                    abstract.admin_comments = "Please shorten the abstract and clarify the methods."
+                    abstract.revision_due_date = (decided_at + timedelta(days=14)).date()
+                    if rng.random() < 0.4:
+                        abstract.revised_uploaded_at = decided_at + (self.now - decided_at) * rng.random()
+                else:
+                    abstract.admin_comments = "Out of scope for the conference themes."
+            if pdfs:
+                abstract.pdf_file.name = self.write_pdf(len(abstracts), abstract.title, text)
+            abstracts.append(abstract)
+
+        bulk_create_backdated(AbstractSubmission, abstracts, "submitted_at", self.batch_size)
+        self.say(f"  {count} abstracts")
+        return abstracts
+
+    def write_pdf(self, number, title, text):
+        """Write straight to the storage path: Storage.save() would probe for
+        a free name on every one of the (tens of thousands of) files."""
+        name = f"abstracts/seed_{self.tag}/{number}.pdf"
+        path = default_storage.path(name)
+        if number == 0:
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+        with open(path, "wb") as fh:
+            fh.write(dummy_pdf(title, text))
+        return name
+
+    def reviews(self, abstracts, theme_admins, share=0.3):
+        rng = self.rng
+        admins = list(theme_admins.values())
+        reviews = []
+        for abstract in abstracts:
+            if rng.random() >= share or len(admins) < 2:
+                continue
+            reviewer = theme_admins.get(abstract.theme_id) or rng.choice(admins)
+            assigned_by = rng.choice([a for a in admins if a.pk != reviewer.pk])
+            created_at = abstract.submitted_at + (self.now - abstract.submitted_at) * rng.random() * 0.3
+            review = AbstractReview(abstract=abstract, reviewer=reviewer, assigned_by=assigned_by,
+                                    created_at=created_at)
+            if abstract.status != "PENDING" and rng.random() < 0.8:
+                review.is_submitted = True
+                review.status = abstract.status
+                review.comment = rng.choice(["Well structured.", "Needs clearer methods.",
+                                             "Figures are missing units.", "Strong contribution."])
+                review.submitted_at = created_at + (self.now - created_at) * rng.random() * 0.5
+            reviews.append(review)
+
+        bulk_create_backdated(AbstractReview, reviews, "created_at", self.batch_size)
+        self.say(f"  {len(reviews)} reviews")
+        return reviews
+
+    def notifications(self, abstracts, per_abstract=1.5, unread_share=0.3):
+        rng = self.rng
+        messages = {
+            "PENDING": ("Abstract received", "Your abstract has been received and is awaiting review."),
+            "REVISION": ("Revision requested", "The committee has requested a revision of your abstract."),
+            "APPROVED": ("Abstract approved", "Congratulations! Your abstract has been approved."),
+            "REJECTED": ("Abstract not accepted", "We regret that your abstract was not accepted."),
+        }
+        notifications = []
+        for abstract in abstracts:
+            if per_abstract <= 0:
+                break
+            # At least the "received" notice, more as the abstract moves along
+            for _ in range(max(int(rng.expovariate(1 / per_abstract)), 1)):
+                title, message = messages[abstract.status]
+                notifications.append(Notification(
+                    user_id=abstract.user_id, abstract=abstract, title=title, message=message,
+                    is_read=rng.random() >= unread_share,
+                    created_at=abstract.submitted_at + (self.now - abstract.submitted_at) * rng.random(),
+                ))
+
+        bulk_create_backdated(Notification, notifications, "created_at", self.batch_size)
+        self.say(f"  {len(notifications)} notifications")
+        return len(notifications)
+
+    def logs(self, count, user_ids):
+        """Admin log rows, ids in created_at order like production."""
+        user_ids = list(user_ids) or [None]
+        if connection.vendor == "sqlite" and connection.Database.sqlite_version_info >= (3, 35):
+            written = self._sqlite_logs(count, user_ids)
+        else:
+            written = self._executemany_logs(count, user_ids)
+        self.say(f"  {written} admin log entries")
+        return written
+
+    def _sqlite_logs(self, count, user_ids):
+        """Generate the rows inside SQLite with one INSERT ... SELECT over a
+        recursive sequence; a million rows take a few seconds because no row
+        ever exists as a Python object."""
+        if not count:
+            return 0
+        thresholds = []
+        cumulative = 0
+        for action, weight in LOG_ACTION_WEIGHTS.items():
+            cumulative += weight
+            thresholds.append(f"WHEN w < {cumulative} THEN '{action}'")
+        users = ", ".join(
+            f"({i}, {'NULL' if pk is None else int(pk)})" for i, pk in enumerate(user_ids)
+        )
+        start_us = int(self.start.timestamp() * 1_000_000)
+        span_us = max(int((self.now - self.start).total_seconds() * 1_000_000), 1)
+        session = "action IN ('LOGIN', 'LOGOUT')"
+        table = AdminActionLog._meta.db_table
+        # Text the way Django writes a datetime here: six-digit microseconds,
+        # left off when zero. SQLite compares these as strings, so the keyset
+        # cursor needs the same form ('%f' would give three digits).
+        stamp = (
+            "strftime('%Y-%m-%d %H:%M:%S', t / 1000000, 'unixepoch') || "
+            "CASE WHEN t % 1000000 = 0 THEN '' ELSE printf('.%06d', t % 1000000) END"
+        )
+
+        # MATERIALIZED: each random() is drawn once per row, not once per reference
+        sql = f"""
+            WITH RECURSIVE
+                seq(n) AS (SELECT 1 UNION ALL SELECT n + 1 FROM seq WHERE n < {int(count)}),
+                seed_users(i, id) AS (VALUES {users}),
+                draws AS MATERIALIZED (
+                    SELECT abs(random()) % {cumulative} AS w,
+                           abs(random()) % {len(user_ids)} AS u,
+                           {start_us} + abs(random()) % {span_us} AS t
+                    FROM seq
+                ),
+                picks AS MATERIALIZED (
+                    SELECT CASE {' '.join(thresholds)} END AS action, u, t FROM draws
+                )
+            INSERT INTO {table}
+                (user_id, action, object_type, object_id, description, ip_address, created_at)
+            SELECT seed_users.id,
+                   action,
+                   CASE WHEN {session} THEN NULL ELSE 'AbstractSubmission' END,
+                   CASE WHEN {session} THEN NULL ELSE 1 + abs(random()) % 49999 END,
+                   'Seeded ' || lower(action) || ' event',
+                   '10.' || (abs(random()) % 256) || '.' || (abs(random()) % 256) || '.' || (1 + abs(random()) % 254),
+                   {stamp}
+            FROM picks JOIN seed_users ON seed_users.i = picks.u
+            ORDER BY t
+        """
+        with connection.cursor() as cursor:
+            # Filling five b-trees row by row costs more than generating the
+            # rows; for big loads drop the secondary indexes and rebuild them
+            # from sorted data afterwards (DDL is transactional in SQLite).
+            indexes = []
+            if count >= BULK_INDEX_REBUILD_ROWS:
+                cursor.execute(
+                    "SELECT name, sql FROM sqlite_master "
+                    "WHERE type = 'index' AND tbl_name = %s AND sql IS NOT NULL",
+                    [table],
+                )
+                indexes = cursor.fetchall()
+                for name, _ in indexes:
+                    cursor.execute(f"DROP INDEX {connection.ops.quote_name(name)}")
+            cursor.execute(sql)
+            for _, create_sql in indexes:
+                cursor.execute(create_sql)
+        return count
+
+    def _executemany_logs(self, count, user_ids):
+        """Portable path: executemany on plain tuples, no model instances."""
+        rng = self.rng
+        table = AdminActionLog._meta.db_table
+        columns = ["user_id", "action", "object_type", "object_id", "description", "ip_address", "created_at"]
+        sql = (
+            f"INSERT INTO {connection.ops.quote_name(table)} "
+            f"({', '.join(connection.ops.quote_name(c) for c in columns)}) "
+            f"VALUES ({', '.join(['%s'] * len(columns))})"
+        )
+        adapt = connection.ops.adapt_datetimefield_value
+        descriptions = {action: f"Seeded {action.lower()} event" for action in LOG_ACTION_WEIGHTS}
+        span = (self.now - self.start).total_seconds()
+        chunk = max(self.batch_size, 10_000)
+
+        written = 0
+        with connection.cursor() as cursor:
+            for done in range(0, count, chunk):
+                size = min(chunk, count - done)
+                actions = _weighted(rng, LOG_ACTION_WEIGHTS, size)
+                users = rng.choices(user_ids, k=size)
+                offsets = sorted(span * rng.random() for _ in range(size))
+                rows = []
+                for action, user_id, offset in zip(actions, users, offsets):
+                    session = action in ("LOGIN", "LOGOUT")
+                    rows.append((
+                        user_id,
+                        action,
+                        None if session else "AbstractSubmission",
+                        None if session else rng.randrange(1, 50_000),
+                        descriptions[action],
+                        f"10.{rng.randrange(256)}.{rng.randrange(256)}.{rng.randrange(1, 255)}",
+                        adapt(self.start + timedelta(seconds=offset)),
+                    ))
+                cursor.executemany(sql, rows)
+                written += size
+        return written
+
+
+def rebuild_derived():
+    """Recompute everything the skipped signals would have maintained."""
+    from conference.services import analytics, search, trends
+    from conference.utils import invalidate_unread_notification_counts
+
+    analytics.rebuild_rollups()
+    trends.rebuild_trends()
+    search.rebuild_index()
+    invalidate_unread_notification_counts()
+
+
+def seed_conference(participants=1000, abstracts=2000, reviews=0.3, notifications=1.5,
+                    logs=10000, days=120, pdfs=True, seed=None, batch_size=BATCH_SIZE, stdout=None):
+    """Insert a synthetic dataset; returns {name: rows created}."""
+    seeder = Seeder(days=days, seed=seed, batch_size=batch_size, stdout=stdout)
+
+    with transaction.atomic():
+        # Runs before this change gave every account the same public password
+        User.objects.filter(username__startswith="seed_").exclude(
+            password__startswith=UNUSABLE_PASSWORD_PREFIX
+        ).update(password=seeder.password)
+        themes = seeder.themes()
+        admin, theme_admins = seeder.staff(themes)
+        people = seeder.participants(participants)
+        papers = seeder.abstracts(abstracts, people, themes, admin, pdfs=pdfs)
+        assigned = seeder.reviews(papers, theme_admins, share=reviews)
+        sent = seeder.notifications(papers, per_abstract=notifications)
+        staff_ids = [admin.pk] + [ta.user_id for ta in theme_admins.values()]
+        log_users = staff_ids * 20 + [p.user_id for p in people[:5000]]
+        logged = seeder.logs(logs, log_users)
+
+    rebuild_derived()
+    seeder.say("  rollups, trends, search index")
+
+    return {
+        "participants": len(people),
+        "abstracts": len(papers),
+        "reviews": len(assigned),
+        "notifications": sent,
+        "logs": logged,
+    }
+
+
+def grant_password(usernames):
+    """
+    Give the named seeded accounts one random password and return it.
+
+    Only accounts created by the seeder (usernames starting "seed_") are
+    touched; call revoke_passwords() with the same names afterwards.
+    """
+    password = get_random_string(32)
+    User.objects.filter(username__in=usernames, username__startswith="seed_").update(
+        password=make_password(password)
+    )
+    return password
+
+
+def revoke_passwords(usernames):
+    """Make the named seeded accounts unusable for login again."""
+    User.objects.filter(username__in=usernames, username__startswith="seed_").update(
+        password=make_password(None)
+    )
@@ -0,0 +1,177 @@
+"""Hourly and daily event series for the analytics trend chart.
+
+Each metric is an event timestamp on a source table:
+
+    REGISTRATIONS  Participant.created_at          (by scientific_theme)
+    SUBMISSIONS    AbstractSubmission.submitted_at (by theme code)
+    APPROVALS      AbstractSubmission.approved_at
+    REVISIONS      AbstractSubmission.revised_uploaded_at
+
+`refresh_trends()` only aggregates events newer than the metric's
+TrendHighWaterMark and adds them to TrendBucket, so a run costs as much as
+the activity since the previous one. Events inside the last TREND_LAG are
+left for the next run, and the mark only advances to the newest event it
+folded in, so a row from a transaction that commits late is still picked
+up unless a later-stamped row was folded before it committed.
+
+A run claims each metric's window by moving the mark with a conditional
+UPDATE; an overlapping run that read the same mark updates nothing and
+adds nothing, so events are never counted twice. The series is refreshed
+by `manage.py update_trends` and, at most once per TREND_REFRESH_SECONDS
+per process, lazily when the chart data is requested.
+"""
+
+import logging
+from collections import defaultdict
+from datetime import timedelta
+
+from django.core.cache import cache
+from django.db import OperationalError, transaction
+from django.db.models import Count, F, Max, Min, Sum
+from django.db.models.functions import TruncHour
+from django.utils import timezone
+
+from conference.models import AbstractSubmission, Participant, TrendBucket, TrendHighWaterMark
+from conference.services.analytics import bump_counter
+
+TREND_LAG = timedelta(seconds=30)
+TREND_REFRESH_SECONDS = 60
+REFRESH_LOCK_KEY = "trends:refresh"
+
+logger = logging.getLogger(__name__)
+
+SOURCES = {
+    "REGISTRATIONS": (Participant, "created_at", "scientific_theme"),
+    "SUBMISSIONS": (AbstractSubmission, "submitted_at", "theme__code"),
+    "APPROVALS": (AbstractSubmission, "approved_at", "theme__code"),
+    "REVISIONS": (AbstractSubmission, "revised_uploaded_at", "theme__code"),
+}
+
+STEPS = {
+    "HOUR": timedelta(hours=1),
+    "DAY": timedelta(days=1),
+}
+
+
+def _day_start(hour):
+    return hour.replace(hour=0, minute=0, second=0, microsecond=0)
+
+
+def _fold(now, bulk):
+    """Aggregate events since each high-water mark and add them to the
+    buckets; `bulk` inserts them in one go (only valid on an empty table)."""
+    now = now or timezone.now()
+    upto = now - TREND_LAG
+    added = {}
+
+    for metric, (model, ts_field, theme_field) in SOURCES.items():
+        mark, _ = TrendHighWaterMark.objects.get_or_create(metric=metric)
+        since = mark.processed_until
+
+        events = model.objects.filter(**{f"{ts_field}__lte": upto})
+        if since:
+            events = events.filter(**{f"{ts_field}__gt": since})
+        else:
+            events = events.filter(**{f"{ts_field}__isnull": False})
+
+        hourly = list(
+            events
+            .annotate(bucket=TruncHour(ts_field), code=F(theme_field))
+            .values("bucket", "code")
+            .annotate(n=Count("id"), latest=Max(ts_field))
+            .order_by()
+        )
+
+        # Claim (since, latest]; another run that already moved the mark
+        # makes this update match nothing
+        latest = max((row["latest"] for row in hourly), default=since)
+        claimed = TrendHighWaterMark.objects.filter(pk=mark.pk, processed_until=since).update(
+            processed_until=latest, refreshed_at=now
+        )
+        if not claimed:
+            added[metric] = 0
+            continue
+
+        counts = defaultdict(int)
+        for row in hourly:
+            code = row["code"] or ""
+            counts[("HOUR", code, row["bucket"])] += row["n"]
+            counts[("DAY", code, _day_start(timezone.localtime(row["bucket"])))] += row["n"]
+
+        if bulk:
+            TrendBucket.objects.bulk_create(
+                (TrendBucket(granularity=g, metric=metric, theme_code=code, bucket_start=start, count=n)
+                 for (g, code, start), n in counts.items()),
+                batch_size=1000,
+            )
+        else:
+            for (granularity, code, start), n in counts.items():
+                bump_counter(TrendBucket, n, granularity=granularity, metric=metric,
+                             theme_code=code, bucket_start=start)
+
+        added[metric] = sum(n for (g, _, _), n in counts.items() if g == "HOUR")
+
+    return added
+
+
+@transaction.atomic
+def refresh_trends(now=None):
+    """Fold events since each high-water mark into the buckets.
+    Returns {metric: events added}."""
+    return _fold(now, bulk=False)
+
+
+@transaction.atomic
+def rebuild_trends(now=None):
+    """Drop every bucket and high-water mark and aggregate from scratch
+    (after bulk loads or backdated rows the marks have already passed)."""
+    TrendBucket.objects.all().delete()
+    TrendHighWaterMark.objects.all().delete()
+    return _fold(now, bulk=True)
+
+
+def maybe_refresh_trends():
+    """Run refresh_trends() unless this process did so recently. If another
+    worker holds the write lock (SQLite), skip; its pass covers the events."""
+    if not cache.add(REFRESH_LOCK_KEY, 1, TREND_REFRESH_SECONDS):
+        return
+    try:
+        refresh_trends()
+    except OperationalError as e:
+        logger.warning("Trend refresh skipped: %s", e)
+
+
+def trend_series(granularity="DAY", points=30, theme_codes=None):
+    """Dense series for Chart.js, newest bucket last.
+
+    Returns {"granularity", "start" (ISO), "step" (seconds), "points",
+    "updated" (ISO or None), "series": {metric: [counts...]}}; bucket i
+    starts at start + i * step.
+    """
+    step = STEPS[granularity]
+    now = timezone.localtime()
+    current = now.replace(minute=0, second=0, microsecond=0)
+    if granularity == "DAY":
+        current = _day_start(current)
+    start = current - step * (points - 1)
+
+    buckets = TrendBucket.objects.filter(granularity=granularity, bucket_start__gte=start)
+    if theme_codes is not None:
+        buckets = buckets.filter(theme_code__in=theme_codes)
+
+    series = {metric: [0] * points for metric in SOURCES}
+    rows = buckets.values("metric", "bucket_start").annotate(n=Sum("count")).order_by()
+    for row in rows:
+        index = int((row["bucket_start"] - start) / step)
+        if 0 <= index < points:
+            series[row["metric"]][index] += row["n"]
+
+    updated = TrendHighWaterMark.objects.aggregate(updated=Min("refreshed_at"))["updated"]
+    return {
+        "granularity": granularity,
+        "start": start.isoformat(),
+        "step": int(step.total_seconds()),
+        "points": points,
+        "updated": updated.isoformat() if updated else None,
+        "series": series,
+    }
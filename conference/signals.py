@@ -1,12 +1,42 @@
-from django.db.models.signals import pre_save, post_save
+from django.db import transaction
+from django.contrib.auth.models import User
+from django.db.models.signals import pre_save, post_save, post_delete
 from django.dispatch import receiver
-from django.core.mail import send_mail
-from django.conf import settings
-from .models import AbstractSubmission, ThemeAdmin, Notification
+from .models import AbstractSubmission, Notification, Participant, ScientificTheme
+from .context_processors import invalidate_theme_catalog
+from .utils import adjust_unread_notification_count, queue_mail
+from .services.notification_fanout import notify_theme_admins
+from .services import analytics, search
+
+
+@receiver(post_save, sender=ScientificTheme)
+@receiver(post_delete, sender=ScientificTheme)
+def scientific_theme_changed(sender, instance, **kwargs):
+    """Drop the cached theme catalog once the change is committed."""
+    transaction.on_commit(invalidate_theme_catalog)
+
+
+@receiver(post_save, sender=Notification)
+def notification_created_count(sender, instance, created, **kwargs):
+    """Bump the recipient's cached unread counter for new notifications."""
+    if created and not instance.is_read:
+        user_id = instance.user_id
+        transaction.on_commit(lambda: adjust_unread_notification_count(user_id, 1))
+
+
+@receiver(post_delete, sender=Notification)
+def notification_deleted_count(sender, instance, **kwargs):
+    """Keep the cached unread counter in step when unread rows are removed."""
+    if not instance.is_read:
+        user_id = instance.user_id
+        transaction.on_commit(lambda: adjust_unread_notification_count(user_id, -1))
 
 
 @receiver(pre_save, sender=AbstractSubmission)
 def abstract_decision_email(sender, instance, **kwargs):
+    # Theme and status before the save, read by abstract_rollup_saved
+    instance._rollup_previous = None
+
     # New submission → no email
     if not instance.pk:
         return
@@ -16,6 +46,8 @@ def abstract_decision_email(sender, instance, **kwargs):
     except AbstractSubmission.DoesNotExist:
         return
 
+    instance._rollup_previous = (old.theme_id, old.status)
+
     # No change → no email
     if old.status == instance.status:
         return
@@ -97,28 +129,18 @@ Warm regards,
 NCPS 2025 Organizing Committee
 """
 
-    send_mail(
+    queue_mail(
         subject=subject,
         message=body.strip(),
-        from_email=settings.DEFAULT_FROM_EMAIL,
         recipient_list=[user.email],
-        fail_silently=True,
     )
 
     # Notify theme admins about the decision
     try:
-        theme = instance.theme
-        admins = ThemeAdmin.objects.filter(themes=theme, is_active=True)
-        for ta in admins:
-            # create a lightweight notification
-            Notification.objects.create(
-                user=ta.user,
-                abstract=instance,
-                title=f"Abstract decision: {decision}",
-                message=(
-                    f"The abstract '{instance.title}' has changed status to {decision}."
-                ),
-            )
+        notify_theme_admins([instance], lambda a: (
+            f"Abstract decision: {a.status}",
+            f"The abstract '{a.title}' has changed status to {a.status}.",
+        ))
     except Exception:
         pass
 
@@ -129,15 +151,10 @@ def abstract_created_notify_theme_admins(sender, instance, created, **kwargs):
     if not created:
         return
     try:
-        theme = instance.theme
-        admins = ThemeAdmin.objects.filter(themes=theme, is_active=True)
-        for ta in admins:
-            Notification.objects.create(
-                user=ta.user,
-                abstract=instance,
-                title="New abstract submitted",
-                message=(f"A new abstract titled '{instance.title}' was submitted under '{theme.name}'."),
-            )
+        notify_theme_admins([instance], lambda a: (
+            "New abstract submitted",
+            f"A new abstract titled '{a.title}' was submitted under '{a.theme.name}'.",
+        ))
         # Send confirmation email to the submitting participant
         try:
             submitter = instance.user
@@ -153,14 +170,79 @@ def abstract_created_notify_theme_admins(sender, instance, created, **kwargs):
 
     NCPS 2025 Organizing Committee
     """
-                send_mail(
+                queue_mail(
                     subject=subject,
                     message=body.strip(),
-                    from_email=settings.DEFAULT_FROM_EMAIL,
                     recipient_list=[submitter.email],
-                    fail_silently=True,
                 )
         except Exception:
             pass
     except Exception:
         pass
+
+
+@receiver(post_save, sender=AbstractSubmission)
+def abstract_search_index(sender, instance, **kwargs):
+    """Keep the full-text search index in sync with the abstract."""
+    search.index_abstract(instance)
+
+
+@receiver(post_delete, sender=AbstractSubmission)
+def abstract_search_unindex(sender, instance, **kwargs):
+    search.remove_abstract(instance.pk)
+
+
+@receiver(post_save, sender=User)
+def user_search_reindex(sender, instance, created, update_fields=None, **kwargs):
+    """Propagate username/email changes to the user's indexed abstracts."""
+    if created:
+        return
+    if update_fields is not None and not {"username", "email"} & set(update_fields):
+        return
+    search.reindex_user(instance)
+
+
+# ==================================================
+# ANALYTICS ROLLUPS
+# ==================================================
+def _needs_snapshot(instance, update_fields, fields):
+    if instance._state.adding:
+        return False
+    return update_fields is None or bool(set(fields) & set(update_fields))
+
+
+# The previous theme/status snapshot is taken by abstract_decision_email,
+# which already loads the row
+@receiver(post_save, sender=AbstractSubmission)
+def abstract_rollup_saved(sender, instance, created, update_fields=None, **kwargs):
+    previous = getattr(instance, "_rollup_previous", None)
+    if update_fields is not None and not {"theme", "status"} & set(update_fields):
+        previous = None
+    analytics.record_abstract_saved(instance, created, previous)
+
+
+@receiver(post_delete, sender=AbstractSubmission)
+def abstract_rollup_deleted(sender, instance, **kwargs):
+    analytics.record_abstract_deleted(instance)
+
+
+@receiver(pre_save, sender=Participant)
+def participant_rollup_snapshot(sender, instance, update_fields=None, **kwargs):
+    instance._rollup_previous = None
+    if _needs_snapshot(instance, update_fields, ("scientific_theme",)):
+        instance._rollup_previous = (
+            Participant.objects
+            .filter(pk=instance.pk)
+            .values_list("scientific_theme", flat=True)
+            .first()
+        )
+
+
+@receiver(post_save, sender=Participant)
+def participant_rollup_saved(sender, instance, created, **kwargs):
+    analytics.record_participant_saved(instance, created, getattr(instance, "_rollup_previous", None))
+
+
+@receiver(post_delete, sender=Participant)
+def participant_rollup_deleted(sender, instance, **kwargs):
+    analytics.record_participant_deleted(instance)
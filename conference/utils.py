@@ -1,6 +1,12 @@
 # conference/utils.py
 
-from .models import AdminActionLog
+import uuid
+
+from django.conf import settings
+from django.core.cache import cache
+
+from .models import Notification, EmailOutbox
+from .services import audit_log
 
 
 def get_client_ip(request):
@@ -15,13 +21,93 @@ def get_client_ip(request):
 
 def log_admin_action(request, action, description="", obj=None):
     """
-    Centralized admin/user action logger
+    Centralized admin/user action logger (buffered; see services.audit_log)
     """
-    AdminActionLog.objects.create(
+    audit_log.record(
+        action,
         user=request.user if request.user.is_authenticated else None,
-        action=action,
         object_type=obj.__class__.__name__ if obj else None,
         object_id=obj.id if obj else None,
         description=description,
         ip_address=get_client_ip(request),
     )
+
+
+def queue_mail(subject, message, recipient_list, from_email=None):
+    """
+    Queue an email in the outbox instead of sending it inline.
+    The row joins the caller's transaction; `manage.py deliver_outbox`
+    sends it later over a shared SMTP connection.
+    """
+    recipients = [r for r in recipient_list if r]
+    if not recipients:
+        return None
+    return EmailOutbox.objects.create(
+        subject=subject,
+        body=message,
+        from_email=from_email or settings.DEFAULT_FROM_EMAIL,
+        recipients=",".join(recipients),
+    )
+
+
+# ==================================================
+# UNREAD NOTIFICATION COUNTERS
+# ==================================================
+# Per-user and global unread counts are kept in the cache and adjusted in
+# place when notifications are created or marked read. Entries expire after
+# UNREAD_COUNT_TTL seconds, and a missing entry is rebuilt from a single
+# COUNT, so any drift (deleted rows, manual edits) reconciles lazily.
+UNREAD_COUNT_TTL = 15 * 60
+UNREAD_COUNT_VERSION_KEY = "conference:unread:version"
+UNREAD_COUNT_ALL = "all"
+
+
+def _unread_count_key(user_id):
+    version = cache.get(UNREAD_COUNT_VERSION_KEY)
+    if version is None:
+        cache.add(UNREAD_COUNT_VERSION_KEY, uuid.uuid4().hex, None)
+        version = cache.get(UNREAD_COUNT_VERSION_KEY)
+    return f"conference:unread:{version}:{user_id}"
+
+
+def get_unread_notification_count(user=None):
+    """
+    Return the unread count for a user, or the global count when user is None
+    """
+    key = _unread_count_key(user.pk if user else UNREAD_COUNT_ALL)
+    count = cache.get(key)
+    if count is None or count < 0:
+        qs = Notification.objects.filter(is_read=False)
+        if user:
+            qs = qs.filter(user=user)
+        count = qs.count()
+        cache.set(key, count, UNREAD_COUNT_TTL)
+    return count
+
+
+def adjust_unread_notification_count(user_id, delta):
+    """
+    Atomically shift a user's (and the global) unread counter by delta.
+    Counters not in the cache are left alone; they are rebuilt on next read.
+    """
+    if not delta:
+        return
+    for key in (_unread_count_key(user_id), _unread_count_key(UNREAD_COUNT_ALL)):
+        try:
+            cache.incr(key, delta)
+        except ValueError:
+            pass
+
+
+def reset_unread_notification_count(user_id):
+    """
+    Mark a user's counter as zero after all of their notifications were read
+    """
+    cache.set(_unread_count_key(user_id), 0, UNREAD_COUNT_TTL)
+
+
+def invalidate_unread_notification_counts():
+    """
+    Drop every cached counter (e.g. after a global mark-all-read)
+    """
+    cache.set(UNREAD_COUNT_VERSION_KEY, uuid.uuid4().hex, None)
@@ -19,20 +19,20 @@ from django.utils import timezone
 from django.db.models import Count, Q, F
 from django.shortcuts import render, redirect
 from django.contrib.auth.models import User
-from django.core.mail import send_mail
 from django.contrib import messages
 from django.utils.http import url_has_allowed_host_and_scheme
 from .models import PasswordResetOTP
-from .utils import get_client_ip
+from .utils import get_client_ip, get_unread_notification_count, queue_mail
 from .admin_views import _get_theme_filtered_abstracts
 from .forms import AbstractSubmissionForm
+from .context_processors import get_db_theme_names
 from django.core.cache import cache
 from .services.news_fetcher import fetch_official_ncpor_news
+from .services import audit_log
 from .models import (
     Participant,
     AbstractSubmission,
     ScientificTheme,
-    AdminActionLog,
 )
 
 # -------------------------------------------------------------------
@@ -160,7 +160,7 @@ def themes(request):
     ]
 
     # If themes exist in DB (admin-controlled), prefer their names.
-    db_themes = {t.code: t.name for t in ScientificTheme.objects.all()}
+    db_themes = get_db_theme_names()
     for t in theme_catalog:
         if t["code"] in db_themes:
             t["name"] = db_themes[t["code"]]
@@ -264,11 +264,9 @@ def theme_detail(request, code):
     if not theme:
         return render(request, "conference/theme_detail.html", {"theme": None}, status=404)
 
-    try:
-        db_theme = ScientificTheme.objects.get(code=code)
-        theme = {**theme, "name": db_theme.name}
-    except ScientificTheme.DoesNotExist:
-        pass
+    db_name = get_db_theme_names().get(code)
+    if db_name:
+        theme = {**theme, "name": db_name}
 
     return render(request, "conference/theme_detail.html", {"theme": theme})
 
@@ -312,9 +310,9 @@ def user_login(request):
         if user is not None:
             login(request, user)
 
-            AdminActionLog.objects.create(
+            audit_log.record(
+                "LOGIN",
                 user=user,
-                action="LOGIN",
                 ip_address=get_client_ip(request),
                 description="User logged in"
             )
@@ -342,9 +340,9 @@ def user_login(request):
 
 @login_required
 def user_logout(request):
-    AdminActionLog.objects.create(
+    audit_log.record(
+        "LOGOUT",
         user=request.user,
-        action="LOGOUT",
         ip_address=get_client_ip(request),
         description="User logged out"
     )
@@ -540,7 +538,7 @@ def register(request):
     ]
 
     try:
-        db_themes = {t.code: t.name for t in ScientificTheme.objects.all()}
+        db_themes = get_db_theme_names()
     except Exception:
         db_themes = {}
 
@@ -573,11 +571,7 @@ def dashboard(request):
         else []
     )
 
-    notifications_count = (
-        request.user.notifications.filter(is_read=False).count()
-        if hasattr(request.user, "notifications")
-        else 0
-    )
+    notifications_count = get_unread_notification_count(request.user)
 
 
     context = {
@@ -585,7 +579,7 @@ def dashboard(request):
         "abstracts": abstracts,
         "abstract_deadline": "15 January 2025",
         "notifications": notifications,
-        "notifications_count": request.user.notifications.filter(is_read=False).count(),
+        "notifications_count": notifications_count,
         # participant_theme_name: prefer admin-controlled ScientificTheme.name when available
         "participant_theme_name": None,
     }
@@ -624,7 +618,7 @@ def notifications_list(request):
         "conference/notifications.html",
         {
             "notifications": notifications,
-            "notifications_count": notifications.filter(is_read=False).count(),
+            "notifications_count": get_unread_notification_count(request.user),
         },
     )
 
@@ -722,6 +716,8 @@ def abstract_submission(request):
         # ---------------------------------------
         # 3️⃣ Save safely
         # ---------------------------------------
+        # Text is pulled from the PDF by the extract_abstract_text command
+        abstract.text_extraction_status = "PENDING"
         abstract.save()
         messages.success(request, "Abstract submitted successfully.")
         return redirect("conference:dashboard")
@@ -782,6 +778,8 @@ def upload_revised_abstract(request, pk):
         abstract.status = "RESUBMITTED"
         abstract.admin_comments = None
         abstract.revision_due_date = None
+        # Picked up by the extract_abstract_text command
+        abstract.text_extraction_status = "PENDING"
         abstract.save()
 
         messages.success(request, "Revision submitted successfully.")
@@ -919,10 +917,9 @@ def forgot_password(request):
         # DEV only
         print(f"🔐 PASSWORD RESET OTP for {user.email}: {otp}")
 
-        send_mail(
+        queue_mail(
             subject="Password Reset OTP",
             message=f"Your OTP is {otp}. Valid for 10 minutes.",
-            from_email=settings.DEFAULT_FROM_EMAIL,
             recipient_list=[user.email],
         )
 
@@ -1012,10 +1009,9 @@ def resend_otp(request):
     # DEV: print OTP
     print(f"🔁 RESENT OTP for {user.username}: {otp}")
 
-    send_mail(
+    queue_mail(
         subject="Password Reset OTP (Resent)",
         message=f"Your new OTP is {otp}. Valid for 10 minutes.",
-        from_email=settings.DEFAULT_FROM_EMAIL,
         recipient_list=[user.email],
     )
 
@@ -1044,9 +1040,9 @@ def reset_password(request):
         user = User.objects.get(id=user_id)
         user.set_password(password)
         user.save()
-        AdminActionLog.objects.create(
+        audit_log.record(
+            "PASSWORD_RESET",
             user=user,
-            action="PASSWORD_RESET",
             ip_address=get_client_ip(request),
             description="User reset password via OTP"
         )
@@ -0,0 +1,10 @@
+"""
+ASGI config for ncps_site project.
+"""
+
+import os
+from django.core.asgi import get_asgi_application
+
+os.environ.setdefault('DJANGO_SETTINGS_MODULE', 'ncps_site.settings')
+
+application = get_asgi_application()
@@ -38,6 +38,7 @@ MIDDLEWARE = [
     'django.contrib.auth.middleware.AuthenticationMiddleware',
     'django.contrib.messages.middleware.MessageMiddleware',
     'django.middleware.clickjacking.XFrameOptionsMiddleware',
+    'conference.middleware.PerfBudgetMiddleware',  # no-op unless PERF_MONITORING
 ]
 
 ROOT_URLCONF = 'ncps_site.urls'
@@ -71,6 +72,24 @@ DATABASES = {
     }
 }
 
+# Cache
+# 'chatbot' holds generated chatbot answers (chatbot/response_cache.py).
+# LocMemCache evicts least recently used entries past MAX_ENTRIES; use a
+# Redis/Memcached backend with an LRU policy to share answers across workers.
+CACHES = {
+    'default': {
+        'BACKEND': 'django.core.cache.backends.locmem.LocMemCache',
+    },
+    'chatbot': {
+        'BACKEND': 'django.core.cache.backends.locmem.LocMemCache',
+        'LOCATION': 'chatbot-answers',
+        'OPTIONS': {
+            'MAX_ENTRIES': 1000,
+            'CULL_FREQUENCY': 10,  # drop the least recently used tenth when full
+        },
+    },
+}
+
 # Password validation
 AUTH_PASSWORD_VALIDATORS = [
     {
@@ -135,3 +154,58 @@ OLLAMA_MODEL = 'gemma3:4b'  # AI model to use
 OLLAMA_TEMPERATURE = 0.4     # 0.0-1.0 (higher = more creative)
 OLLAMA_MAX_TOKENS = 200      # Max response length
 OLLAMA_TIMEOUT = 120         # Request timeout in seconds
+OLLAMA_POOL_SIZE = 10        # Keep-alive connections kept open to Ollama
+
+# At most this many generations run at once; others wait up to
+# CHATBOT_QUEUE_TIMEOUT seconds, then get the keyword answer
+CHATBOT_MAX_CONCURRENT = 4
+CHATBOT_QUEUE_TIMEOUT = 15
+# Serve /chatbot/api/message/ from the async view; needs an ASGI server
+# (e.g. uvicorn ncps_site.asgi:application)
+CHATBOT_ASYNC = os.environ.get('CHATBOT_ASYNC', 'False') == 'True'
+
+# Generated answers are reused for the same normalized question, admin flag,
+# page type and knowledge-base version (see CACHES['chatbot'])
+CHATBOT_CACHE_ENABLED = True
+CHATBOT_CACHE_ALIAS = 'chatbot'
+CHATBOT_CACHE_TTL = 6 * 60 * 60  # seconds
+CHATBOT_CACHE_VERSION = 1        # bump to drop answers after prompt changes
+
+# On an exact miss, reuse the answer of a previous question with the same
+# content words (after synonym folding) whose hashed n-gram vector is at
+# least this cosine-similar (chatbot/semantic_cache.py)
+CHATBOT_SEMANTIC_CACHE = True
+CHATBOT_SEMANTIC_THRESHOLD = 0.75
+CHATBOT_SEMANTIC_MAX_ENTRIES = 2000  # questions indexed per process
+
+# ================= AUDIT LOG =================
+# AdminActionLog rows are buffered in memory and written in batches
+# (conference/services/audit_log.py); set False to write each one inline.
+# Serverless instances can be frozen or killed before the buffer is
+# flushed, so entries are written inline on Vercel unless overridden.
+AUDIT_LOG_BUFFERED = os.environ.get('AUDIT_LOG_BUFFERED', 'False' if os.environ.get('VERCEL') else 'True') == 'True'
+AUDIT_LOG_BATCH_SIZE = 50        # Flush once this many entries are queued
+AUDIT_LOG_FLUSH_INTERVAL = 2.0   # ...or after this many seconds
+
+# Rows older than this are moved to monthly gzip archives by
+# `manage.py archive_admin_logs`; the admin log viewer still searches them.
+AUDIT_LOG_RETENTION_DAYS = 180
+AUDIT_LOG_ARCHIVE_DIR = BASE_DIR / "archive" / "admin_logs"
+
+# ================= PERFORMANCE MONITORING =================
+# Per-view query count / SQL time / render time / response size, written to
+# PERF_LOG_DIR and summarised by `manage.py perf_report`.
+PERF_MONITORING = os.environ.get('PERF_MONITORING', 'False') == 'True'
+PERF_LOG_DIR = BASE_DIR / "perf"
+PERF_LOG_MAX_BYTES = 5 * 1024 * 1024   # perf.jsonl rolls over to perf.jsonl.1
+
+# Budgets per URL name over PERF_DEFAULT_BUDGET. Keys: "queries",
+# "duplicates" (repeats of one SQL statement, i.e. N+1) and "ms".
+# "log" warns on a breach; "raise" fails the request (use it in tests).
+PERF_DEFAULT_BUDGET = {"duplicates": 10}
+PERF_BUDGETS = {
+    "conference:ncps_admin:theme_dashboard": {"queries": 12},
+    "conference:ncps_admin:dashboard": {"queries": 12},
+    "conference:ncps_admin:analytics": {"queries": 12},
+}
+PERF_BUDGET_ACTION = 'log'